@@ -0,0 +1,136 @@
+"""
+End-to-end collection benchmark against local fake SSH hosts.
+
+Measures wall time, CPU time, peak RSS and throughput of
+collect_all_sync and collect_all_async for several fleet sizes.
+Runs offline and needs neither a GPU nor a remote machine.
+
+    python -m benchmarks.bench_collect --hosts 10,100,500
+    python -m benchmarks.bench_collect --hosts 100 --latency 0.2 --fail-rate 0.05 --json out.json
+    python -m benchmarks.bench_collect --compare out.json    # exit 1 on regression
+
+Requires paramiko and asyncssh (the fake hosts are asyncssh servers).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.fake_ssh import FakeHostOptions, FakeSSHFleet
+from collector.ssh_client import SSHCollector
+
+
+def _measure(mode: str, servers, timeout: int, queue) -> None:
+    """Run one collection in a fresh process and report its resource usage."""
+    collector = SSHCollector(servers, timeout=timeout)
+    # Failures are part of the scenario; do not let retry sleeps dominate
+    collector.retry_delay = 0
+
+    before = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    if mode == 'async':
+        results = asyncio.run(collector.collect_all_async())
+    else:
+        results = collector.collect_all_sync()
+    wall = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF)
+
+    queue.put({
+        "wall_s": round(wall, 3),
+        "cpu_s": round((after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime), 3),
+        "peak_rss_mb": round(after.ru_maxrss / 1024, 1),  # ru_maxrss is in KiB on Linux
+        "ok": sum(1 for r in results if r.success),
+        "failed": sum(1 for r in results if not r.success),
+    })
+
+
+def run_case(hosts: int, mode: str, options: FakeHostOptions, timeout: int, key_dir: Path) -> Dict[str, Any]:
+    with FakeSSHFleet(hosts, key_dir, options) as fleet:
+        queue = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=_measure, args=(mode, fleet.servers(), timeout, queue))
+        worker.start()
+        row = queue.get()
+        worker.join()
+
+    row.update({
+        "hosts": hosts,
+        "mode": mode,
+        "hosts_per_s": round(hosts / row["wall_s"], 1) if row["wall_s"] else 0.0,
+    })
+    return row
+
+
+def compare(rows: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> List[str]:
+    """Return a message for every case slower than the baseline beyond tolerance."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r["hosts"], r["mode"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for row in rows:
+        base = baseline.get((row["hosts"], row["mode"]))
+        if not base:
+            continue
+        for metric in ("wall_s", "cpu_s", "peak_rss_mb"):
+            if base[metric] and row[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{row['mode']} @ {row['hosts']} hosts: {metric} {row[metric]} > baseline {base[metric]}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark collection against fake SSH hosts")
+    parser.add_argument('--hosts', type=str, default='10,100,500', help='Comma-separated fleet sizes')
+    parser.add_argument('--modes', type=str, default='sync,async', help='Comma-separated modes')
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per host')
+    parser.add_argument('--processes', type=int, default=300, help='ps table rows per host')
+    parser.add_argument('--latency', type=float, default=0.05, help='Command latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Extra random latency in seconds')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of failing hosts')
+    parser.add_argument('--hang-rate', type=float, default=0.0, help='Fraction of hanging hosts')
+    parser.add_argument('--timeout', type=int, default=10, help='Collector SSH timeout in seconds')
+    parser.add_argument('--json', type=str, help='Write results to this file')
+    parser.add_argument('--compare', type=str, help='Baseline results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown vs baseline')
+    args = parser.parse_args()
+
+    options = FakeHostOptions(
+        gpu_count=args.gpus,
+        process_count=args.processes,
+        latency=args.latency,
+        jitter=args.jitter,
+        fail_rate=args.fail_rate,
+        hang_rate=args.hang_rate,
+    )
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'mode':<6} {'hosts':>6} {'wall s':>8} {'cpu s':>8} {'rss MB':>8} {'hosts/s':>8} {'ok':>5} {'fail':>5}")
+        for hosts in [int(h) for h in args.hosts.split(',')]:
+            for mode in args.modes.split(','):
+                row = run_case(hosts, mode, options, args.timeout, Path(tmp))
+                rows.append(row)
+                print(f"{mode:<6} {hosts:>6} {row['wall_s']:>8} {row['cpu_s']:>8} "
+                      f"{row['peak_rss_mb']:>8} {row['hosts_per_s']:>8} {row['ok']:>5} {row['failed']:>5}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"options": vars(args), "results": rows}, f, indent=2)
+
+    if args.compare:
+        regressions = compare(rows, args.compare, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION: {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Per-host allocation count and peak memory of the parse path, via tracemalloc.
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --processes 5000 --budget-kb 4096
+"""
+
+import argparse
+import sys
+import tracemalloc
+from typing import Callable, Tuple
+
+from collector.commands import parse_sections
+from collector.main import process_result
+from collector.parsers import build_process_map
+from collector.ssh_client import CollectionResult
+from collector.synthetic import synthetic_output
+
+
+def measure(fn: Callable[[], object]) -> Tuple[int, int, object]:
+    """Return (allocated blocks still alive, peak bytes, result) for one call."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+    return after - before, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="tracemalloc allocation benchmark per host")
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per host')
+    parser.add_argument('--processes', type=int, default=2000, help='ps table rows per host')
+    parser.add_argument('--budget-kb', type=float, help='Fail if process_result peak exceeds this')
+    args = parser.parse_args()
+
+    output = synthetic_output("bench-host", gpu_count=args.gpus, process_count=args.processes)
+    sections = parse_sections(output)
+    result = CollectionResult(server_name="bench", host="127.0.0.1", success=True, sections=sections)
+
+    # Warm up imports and caches so they are not counted
+    process_result(result)
+
+    blocks, peak, _ = measure(lambda: build_process_map(sections["ALL_PROCESSES"]))
+    print(f"build_process_map ({args.processes} processes): {blocks} live blocks, peak {peak / 1024:.1f} KiB")
+
+    blocks, peak, _ = measure(lambda: process_result(result))
+    print(f"process_result ({args.gpus} GPUs): {blocks} live blocks, peak {peak / 1024:.1f} KiB")
+
+    if args.budget_kb is not None and peak / 1024 > args.budget_kb:
+        print(f"FAIL: process_result peak {peak / 1024:.1f} KiB exceeds budget {args.budget_kb} KiB", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
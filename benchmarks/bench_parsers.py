@@ -0,0 +1,132 @@
+"""
+Parser micro-benchmarks over a corpus of raw host outputs.
+
+The corpus is either a --capture directory recorded from real hosts or,
+by default, synthetic outputs. Every parser is timed on exactly the same
+input, so results are reproducible between runs and machines.
+
+    python -m benchmarks.bench_parsers                          # synthetic corpus
+    python -m benchmarks.bench_parsers --gpu-format xml         # XML reports only
+    python -m benchmarks.bench_parsers --corpus captures/       # recorded corpus
+    python -m benchmarks.bench_parsers --json base.json
+    python -m benchmarks.bench_parsers --compare base.json      # exit 1 on regression
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, List
+
+from collector.capture import iter_captures
+from collector.commands import parse_sections
+from collector.parsers import build_process_map, parse_disk, parse_gpu_xml, parse_gpus, parse_memory
+from collector.synthetic import synthetic_output
+
+
+def load_corpus(
+    corpus_dir: str = None,
+    hosts: int = 20,
+    gpus: int = 8,
+    processes: int = 1000,
+    gpu_format: str = "both",
+) -> List[Dict[str, str]]:
+    """Return the sections of every successful host output in the corpus."""
+    if corpus_dir:
+        outputs = [
+            record["output"]
+            for capture in iter_captures(corpus_dir)
+            for record in capture["hosts"]
+            if record["success"] and record.get("output")
+        ]
+    else:
+        outputs = [
+            synthetic_output(f"synthetic-{i}", gpu_count=gpus, process_count=processes, gpu_format=gpu_format)
+            for i in range(hosts)
+        ]
+    return [parse_sections(output) for output in outputs]
+
+
+def bench(fn: Callable[[], object], repeat: int) -> float:
+    """Best-of-repeat wall time in seconds for one call of fn."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(corpus: List[Dict[str, str]], repeat: int) -> Dict[str, float]:
+    """
+    Total best-case time per parser over the corpus, in microseconds.
+
+    Each GPU parser only runs on the outputs that have its sections, so
+    with a mixed corpus their totals are not comparable; a synthetic
+    --gpu-format both corpus has both for every host.
+    """
+    process_maps = [build_process_map(s.get("ALL_PROCESSES", "")) for s in corpus]
+    csv_hosts = [(s, pm) for s, pm in zip(corpus, process_maps) if "GPU_INFO" in s]
+    xml_hosts = [(s, pm) for s, pm in zip(corpus, process_maps) if s.get("GPU_XML", "").lstrip().startswith("<")]
+
+    cases = {
+        "build_process_map": lambda: [build_process_map(s.get("ALL_PROCESSES", "")) for s in corpus],
+        "parse_gpus": lambda: [
+            parse_gpus(s["GPU_INFO"], s.get("GPU_PROCESSES", "NO_PROCESSES"), pm)
+            for s, pm in csv_hosts
+        ],
+        "parse_gpu_xml": lambda: [parse_gpu_xml(s["GPU_XML"], pm) for s, pm in xml_hosts],
+        "parse_disk": lambda: [parse_disk(s.get("DISK", "")) for s in corpus],
+        "parse_memory": lambda: [parse_memory(s.get("MEMORY", "")) for s in corpus],
+    }
+    if not csv_hosts:
+        del cases["parse_gpus"]
+    if not xml_hosts:
+        del cases["parse_gpu_xml"]
+    return {name: round(bench(fn, repeat) * 1e6, 1) for name, fn in cases.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser micro-benchmarks")
+    parser.add_argument('--corpus', type=str, help='Capture directory recorded with --capture')
+    parser.add_argument('--hosts', type=int, default=20, help='Synthetic hosts (without --corpus)')
+    parser.add_argument('--gpus', type=int, default=8, help='Synthetic GPUs per host')
+    parser.add_argument('--processes', type=int, default=1000, help='Synthetic ps rows per host')
+    parser.add_argument('--gpu-format', choices=['xml', 'csv', 'both'], default='both',
+                        help='GPU sections of the synthetic hosts (default: both)')
+    parser.add_argument('--repeat', type=int, default=20, help='Repetitions (best is kept)')
+    parser.add_argument('--json', type=str, help='Write results to this file')
+    parser.add_argument('--compare', type=str, help='Baseline results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown vs baseline')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.hosts, args.gpus, args.processes, args.gpu_format)
+    if not corpus:
+        print("Corpus is empty", file=sys.stderr)
+        sys.exit(1)
+
+    results = run(corpus, args.repeat)
+    print(f"{len(corpus)} host outputs, best of {args.repeat}")
+    for name, us in results.items():
+        print(f"  {name:<18} {us:>10.1f} us total {us / len(corpus):>9.1f} us/host")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"hosts": len(corpus), "results_us": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results_us"]
+        regressions = [
+            f"{name}: {us} us > baseline {baseline[name]} us"
+            for name, us in results.items()
+            if name in baseline and us > baseline[name] * (1 + args.tolerance)
+        ]
+        for message in regressions:
+            print(f"REGRESSION: {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
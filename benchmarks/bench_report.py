@@ -0,0 +1,80 @@
+"""
+Time and peak memory of collector.report over a long synthetic history.
+
+Snapshots are generated in memory (one per minute), so this measures the
+report itself rather than JSON parsing.
+
+    python -m benchmarks.bench_report
+    python -m benchmarks.bench_report --days 365 --servers 4 --gpus 8 --budget-seconds 30
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from collector.report import build_report
+
+
+def synthetic_history(days: float, servers: int, gpus: int, seed: int = 0, pool: int = 1440):
+    """
+    Yield 1-minute snapshots. GPUs follow a slow random walk over one day
+    of distinct samples, repeated, so generating them costs little.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1).astimezone()
+    util = [[rng.randint(0, 100) for _ in range(gpus)] for _ in range(servers)]
+
+    samples = []
+    for _ in range(pool):
+        snapshot_servers = []
+        for s in range(servers):
+            gpu_list = []
+            for g in range(gpus):
+                util[s][g] = min(100, max(0, util[s][g] + rng.randint(-5, 5)))
+                gpu_list.append({
+                    "index": g,
+                    "name": "NVIDIA H100 80GB HBM3",
+                    "temperature_celsius": 30 + util[s][g] // 2,
+                    "utilization_percent": util[s][g],
+                    "memory": {"usage_percent": float(util[s][g])},
+                })
+            snapshot_servers.append({"name": f"server-{s}", "status": "online", "gpus": gpu_list})
+        samples.append(snapshot_servers)
+
+    for minute in range(int(days * 1440)):
+        yield {"timestamp": (start + timedelta(minutes=minute)).isoformat(), "servers": samples[minute % pool]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="collector.report over a synthetic history")
+    parser.add_argument('--days', type=float, default=365, help='Days of 1-minute snapshots')
+    parser.add_argument('--servers', type=int, default=2, help='Servers')
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per server')
+    parser.add_argument('--budget-seconds', type=float, help='Fail if the report takes longer')
+    parser.add_argument('--memory', action='store_true', help='Also trace peak memory (much slower)')
+    args = parser.parse_args()
+
+    if args.memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    report = build_report(synthetic_history(args.days, args.servers, args.gpus))
+    elapsed = time.perf_counter() - start
+
+    line = (f"{report['range']['snapshots']} snapshots x {report['summary']['gpus']} GPUs "
+            f"in {elapsed:.1f} s")
+    if args.memory:
+        _, peak = tracemalloc.get_traced_memory()
+        line += f", peak {peak / 1e6:.1f} MB"
+    print(line)
+
+    if args.budget_seconds is not None and elapsed > args.budget_seconds:
+        print(f"FAIL: {elapsed:.1f} s exceeds budget {args.budget_seconds} s", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
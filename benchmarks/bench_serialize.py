@@ -0,0 +1,112 @@
+"""
+Serialization time and bytes on the wire for large histories.
+
+Builds an N-entry history (default 10k, about a week at 1-minute
+intervals) from synthetic snapshots and times each JSON backend, plus the
+size and cost of the precompressed .gz / .br siblings.
+
+    python -m benchmarks.bench_serialize
+    python -m benchmarks.bench_serialize --entries 10000 --servers 3 --gpus 8
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from collector import jsonio
+from collector.commands import parse_sections
+from collector.main import process_result
+from collector.ssh_client import CollectionResult
+from collector.synthetic import synthetic_output
+
+
+def build_history(entries: int, servers: int, gpus: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """History entries sharing server layouts but with varying metrics."""
+    rng = random.Random(seed)
+    templates = [
+        process_result(CollectionResult(
+            server_name=f"server-{i}",
+            host=f"10.0.0.{i}",
+            success=True,
+            sections=parse_sections(synthetic_output(f"server-{i}", gpu_count=gpus, process_count=200)),
+        ))
+        for i in range(servers)
+    ]
+
+    history = []
+    for n in range(entries):
+        snapshot_servers = []
+        for template in templates:
+            server = dict(template, collected_at=f"2026-01-{1 + n // 1440:02d}T00:00:{n % 60:02d}")
+            server["system"] = dict(template["system"], cpu={
+                "usage_percent": round(rng.uniform(0, 100), 1),
+                "cores": template["system"]["cpu"]["cores"],
+            })
+            server["gpus"] = [
+                dict(gpu,
+                     temperature_celsius=rng.randint(30, 85),
+                     utilization_percent=rng.randint(0, 100),
+                     memory=dict(gpu["memory"], used_mb=rng.randint(0, gpu["memory"]["total_mb"])))
+                for gpu in template["gpus"]
+            ]
+            snapshot_servers.append(server)
+        history.append({
+            "timestamp": f"2026-01-{1 + n // 1440:02d}T{(n // 60) % 24:02d}:{n % 60:02d}:00+08:00",
+            "collector_version": "2.0.0",
+            "servers": snapshot_servers,
+        })
+    return history
+
+
+def timed(fn, repeat: int):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History serialization benchmark")
+    parser.add_argument('--entries', type=int, default=10000, help='History entries')
+    parser.add_argument('--servers', type=int, default=3, help='Servers per snapshot')
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per server')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (best is kept)')
+    args = parser.parse_args()
+
+    history = build_history(args.entries, args.servers, args.gpus)
+    print(f"{args.entries} entries x {args.servers} servers x {args.gpus} GPUs")
+
+    backends = ["json"]
+    try:
+        jsonio.use_backend("orjson")
+        backends.append("orjson")
+    except ImportError:
+        print("orjson not installed, only the json backend is measured")
+
+    data = b""
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in backends:
+            backend = jsonio.use_backend(name)
+            dump_s, data = timed(lambda: backend.dumps(history), args.repeat)
+            load_s, _ = timed(lambda: backend.loads(data), args.repeat)
+            write_s, _ = timed(lambda: jsonio.write_atomic(Path(tmp) / "history.json", data), args.repeat)
+            print(f"  {name:<7} dumps {dump_s * 1000:8.1f} ms  loads {load_s * 1000:8.1f} ms  "
+                  f"atomic write {write_s * 1000:7.1f} ms  {len(data) / 1e6:8.2f} MB")
+
+    print(f"  bytes on the wire (raw {len(data) / 1e6:.2f} MB):")
+    for fmt in jsonio.PRECOMPRESS_FORMATS:
+        compress_s, compressed = timed(lambda: jsonio.compress(data, fmt), 1)
+        if compressed is None:
+            print(f"    .{fmt}: codec not installed")
+            continue
+        print(f"    .{fmt}: {len(compressed) / 1e6:8.2f} MB ({len(compressed) / len(data):.1%}), "
+              f"{compress_s * 1000:.0f} ms to compress")
+
+
+if __name__ == "__main__":
+    main()
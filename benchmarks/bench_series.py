@@ -0,0 +1,64 @@
+"""
+Render data size of the history page before and after LTTB downsampling.
+
+"Before" is what history.html fetched and plotted without series files:
+the whole history.json, and every snapshot in the range as a chart point.
+"After" is data/series/<range>.json at the given point budget. Also times
+building each range, which the collector does at most once per bucket.
+
+    python -m benchmarks.bench_series
+    python -m benchmarks.bench_series --entries 10080 --servers 3 --gpus 8 --points 300
+"""
+
+import argparse
+import gzip
+import time
+
+from collector import jsonio
+from collector.downsample import RANGES, build_series
+
+from benchmarks.bench_serialize import build_history
+
+
+def count_points(series):
+    """Chart points of one range: every line of every server."""
+    total = 0
+    for server in series["servers"].values():
+        total += len(server["cpu"]) + len(server["memory"]) + len(server["disk"])
+        for gpu in server["gpu"].values():
+            total += sum(len(line) for line in gpu.values())
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History chart data size before/after downsampling")
+    parser.add_argument('--entries', type=int, default=10080, help='History entries (1 per minute)')
+    parser.add_argument('--servers', type=int, default=3, help='Servers per snapshot')
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per server')
+    parser.add_argument('--points', type=int, default=300, help='Point budget per chart line')
+    args = parser.parse_args()
+
+    history = build_history(args.entries, args.servers, args.gpus)
+    history_bytes = jsonio.dumps(history)
+    print(f"history.json: {len(history)} entries, {len(history_bytes) / 1e6:.1f} MB, "
+          f"gz {len(gzip.compress(history_bytes)) / 1e6:.1f} MB")
+    print()
+    print(f"{'range':>5} {'raw points':>11} {'raw MB':>7} {'points':>8} {'series KB':>10} {'gz KB':>7} {'build ms':>9}")
+
+    for range_name in RANGES:
+        # Raw: every snapshot in the range, i.e. an LTTB budget that keeps all
+        raw = build_series(history, range_name, points=0)
+        raw_bytes = jsonio.dumps(raw)
+
+        start = time.perf_counter()
+        series = build_series(history, range_name, points=args.points)
+        elapsed = time.perf_counter() - start
+        series_bytes = jsonio.dumps(series)
+
+        print(f"{range_name:>5} {count_points(raw):>11} {len(raw_bytes) / 1e6:>7.2f} "
+              f"{count_points(series):>8} {len(series_bytes) / 1024:>10.1f} "
+              f"{len(gzip.compress(series_bytes)) / 1024:>7.1f} {elapsed * 1000:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
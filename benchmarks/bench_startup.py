@@ -0,0 +1,99 @@
+"""
+Cold-start budget check for the cron entry point.
+
+Runs `python -X importtime -m collector.main --stdout` against an empty
+server list and fails if the total import time exceeds the budget, or if
+modules that the cold-start path must not load (SSH backends, asyncio,
+parsers) were imported.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget-ms 80 --runs 10 --top 15
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Nothing in an empty cycle needs these; any of them showing up means an
+# import was made eager again.
+FORBIDDEN = [
+    "paramiko",
+    "asyncssh",
+    "asyncio",
+    "concurrent.futures",
+    "collector.parsers.gpu",
+    "collector.parsers.process",
+]
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Map module name to (self_us, cumulative_us) from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run_once(config_path: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Run the entry point once; returns (wall seconds, importtime table)."""
+    env = dict(os.environ, GPU_MONITOR_CONFIG=config_path)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "collector.main", "--stdout"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"collector.main failed:\n{proc.stderr[-2000:]}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import budget for collector.main")
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='Max total import time (best run)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs (best is kept, first warms the disk cache)')
+    parser.add_argument('--top', type=int, default=10, help='Show the N slowest imports')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "servers.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({"servers": []}, f)
+
+        runs: List[Tuple[float, float, Dict[str, Tuple[int, int]]]] = []
+        for _ in range(args.runs):
+            wall, modules = run_once(config_path)
+            total_ms = sum(self_us for self_us, _ in modules.values()) / 1000
+            runs.append((total_ms, wall, modules))
+
+    total_ms, wall, modules = min(runs, key=lambda r: r[0])
+    print(f"import time: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms), "
+          f"process wall time: {wall * 1000:.1f} ms, {len(modules)} modules")
+
+    print("slowest imports (cumulative):")
+    for name, (_, cumulative_us) in sorted(modules.items(), key=lambda m: -m[1][1])[:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    failures = [f"{name} imported on the cold-start path" for name in FORBIDDEN if name in modules]
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+
+    for message in failures:
+        print(f"FAIL: {message}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Check the GPU parsers against recorded nvidia-smi output.
+
+There is no GPU where this runs, so benchmarks/fixtures/nvidia-smi/ holds
+`nvidia-smi -q -x` reports from several driver generations (<name>.xml)
+and the parsed GPUs each one must give (<name>.expected.json). Where the
+CSV queries of the same GPUs were recorded too (<name>.query-gpu.csv and
+<name>.query-compute-apps.csv), the XML and the CSV fallback must agree
+on everything but telemetry, which only the XML report has. Exits 1 on
+any difference.
+
+    python -m benchmarks.check_gpu_fixtures
+    python -m benchmarks.check_gpu_fixtures --update    # after a deliberate parser change
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, List
+
+from collector.parsers import build_process_map, parse_gpu_sections, parse_gpu_xml
+from collector.schema import to_json
+
+FIXTURES = Path(__file__).parent / "fixtures" / "nvidia-smi"
+
+
+def first_difference(expected: Any, actual: Any, path: str = "") -> str:
+    """Path and values of the first difference between two JSON values."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(expected.keys() | actual.keys()):
+            if key not in expected or key not in actual:
+                return f"{path}.{key}: only in {'expected' if key in expected else 'result'}"
+            if expected[key] != actual[key]:
+                return first_difference(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            if e != a:
+                return first_difference(e, a, f"{path}[{i}]")
+    return f"{path or '.'}: expected {json.dumps(expected)}, got {json.dumps(actual)}"
+
+
+def check(fixtures: Path, update: bool = False) -> List[str]:
+    """Return one message per failed fixture."""
+    process_map = build_process_map((fixtures / "ps.txt").read_text(encoding='utf-8'))
+    failures = []
+
+    for xml_path in sorted(fixtures.glob("*.xml")):
+        name = xml_path.stem
+        gpu_xml = xml_path.read_text(encoding='utf-8')
+        gpus = to_json(parse_gpu_xml(gpu_xml, process_map))
+
+        expected_path = fixtures / f"{name}.expected.json"
+        if update:
+            expected_path.write_text(json.dumps(gpus, indent=2) + "\n", encoding='utf-8')
+            print(f"{name}: {len(gpus)} GPUs written")
+            continue
+        if not expected_path.exists():
+            failures.append(f"{name}: no {expected_path.name} (run with --update)")
+            continue
+        expected = json.loads(expected_path.read_text(encoding='utf-8'))
+        if gpus != expected:
+            failures.append(f"{name}: {first_difference(expected, gpus)}")
+            continue
+
+        # The collector's path: the GPU_XML section of the host output
+        if to_json(parse_gpu_sections({"GPU_XML": gpu_xml}, process_map)) != gpus:
+            failures.append(f"{name}: parse_gpu_sections() does not pick the XML report")
+            continue
+
+        csv_path = fixtures / f"{name}.query-gpu.csv"
+        if csv_path.exists():
+            # nvidia-smi -q -x failed: the CSV fallback sections follow NO_XML
+            fallback = to_json(parse_gpu_sections({
+                "GPU_XML": "NO_XML",
+                "GPU_INFO": csv_path.read_text(encoding='utf-8'),
+                "GPU_PROCESSES": (fixtures / f"{name}.query-compute-apps.csv").read_text(encoding='utf-8'),
+            }, process_map))
+            core = [dict(gpu, telemetry=None) for gpu in gpus]
+            if fallback != core:
+                failures.append(f"{name}: CSV fallback differs: {first_difference(core, fallback)}")
+                continue
+
+        print(f"{name}: OK ({len(gpus)} GPUs)")
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the GPU parsers against recorded nvidia-smi output")
+    parser.add_argument('--fixtures', type=str, default=str(FIXTURES), help='Fixture directory')
+    parser.add_argument('--update', action='store_true', help='Rewrite the expected results')
+    args = parser.parse_args()
+
+    failures = check(Path(args.fixtures), args.update)
+    for message in failures:
+        print(f"FAIL: {message}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
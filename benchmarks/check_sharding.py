@@ -0,0 +1,155 @@
+"""
+End-to-end check of sharded collection against local fake SSH hosts.
+
+Runs --shard-count collector processes at once, one per --shard-id, as
+separate instances would, then the --merge-shards step, and checks that:
+
+- every shard collected exactly the servers the hash ring assigns it,
+  with no server collected twice or missed;
+- the merged status.json lists every configured server once, in config
+  order, online, and reports no missing shard;
+- history.json gets one entry per merge, without the shard bookkeeping;
+- with one shard snapshot deleted, the merge still lists every server and
+  reports that shard's servers offline and the shard missing;
+- a shard snapshot with a naive timestamp is merged, not rejected.
+
+Exits 1 on any failure.
+
+    python -m benchmarks.check_sharding
+    python -m benchmarks.check_sharding --hosts 30 --shards 4
+
+Requires paramiko and asyncssh (the fake hosts are asyncssh servers).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.fake_ssh import FakeHostOptions, FakeSSHFleet
+from collector.sharding import get_shard_path, shard_servers
+
+
+def run_collector(config_path: Path, *args: str) -> subprocess.Popen:
+    env = dict(os.environ, GPU_MONITOR_CONFIG=str(config_path))
+    return subprocess.Popen([sys.executable, "-m", "collector.main", *args], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+def wait_all(processes: List[subprocess.Popen]) -> List[str]:
+    """Wait for the processes; return a message per failed one."""
+    failures = []
+    for process in processes:
+        output, _ = process.communicate()
+        if process.returncode != 0:
+            failures.append(f"{' '.join(process.args[2:])} exited with {process.returncode}:\n{output}")
+    return failures
+
+
+def check_merged(status: Dict[str, Any], names: List[str], offline: List[str], missing: List[int]) -> List[str]:
+    failures = []
+    merged = [server["name"] for server in status["servers"]]
+    if merged != names:
+        failures.append(f"merged servers {merged} != configured {names}")
+    for server in status["servers"]:
+        expected = "offline" if server["name"] in offline else "online"
+        if server["status"] != expected:
+            failures.append(f"{server['name']}: {server['status']}, expected {expected} "
+                            f"({server.get('error_message')})")
+    if status.get("shards", {}).get("missing") != missing:
+        failures.append(f"missing shards {status.get('shards', {}).get('missing')}, expected {missing}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end check of sharded collection")
+    parser.add_argument('--hosts', type=int, default=12, help='Number of fake hosts')
+    parser.add_argument('--shards', type=int, default=3, help='Number of collector shards')
+    parser.add_argument('--gpus', type=int, default=4, help='GPUs per host')
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        options = FakeHostOptions(gpu_count=args.gpus, process_count=100)
+        with FakeSSHFleet(args.hosts, tmp_path / "keys", options) as fleet:
+            servers = fleet.servers()
+            names = [server.name for server in servers]
+            output_file = tmp_path / "docs" / "data" / "status.json"
+            config_path = tmp_path / "servers.json"
+            config_path.write_text(json.dumps({
+                "servers": [
+                    {"name": s.name, "host": s.host, "user": s.user, "port": s.port, "key_file": s.key_path}
+                    for s in servers
+                ],
+                "timeout": 10,
+                "output_file": str(output_file),
+            }), encoding='utf-8')
+
+            start = time.perf_counter()
+            failures += wait_all([
+                run_collector(config_path, "--shard-id", str(shard), "--shard-count", str(args.shards))
+                for shard in range(args.shards)
+            ])
+            collect_time = time.perf_counter() - start
+
+        # Each shard has exactly its own servers, all online
+        collected: List[str] = []
+        for shard in range(args.shards):
+            path = get_shard_path(str(output_file), shard, args.shards)
+            if not path.exists():
+                failures.append(f"shard {shard}: no snapshot at {path}")
+                continue
+            partial = json.loads(path.read_text(encoding='utf-8'))
+            got = [server["name"] for server in partial["servers"]]
+            expected = [server.name for server in shard_servers(servers, shard, args.shards)]
+            if sorted(got) != sorted(expected):  # in completion order; the merge restores config order
+                failures.append(f"shard {shard}: collected {got}, expected {expected}")
+            failures += [f"shard {shard}: {s['name']} is {s['status']}" for s in partial["servers"]
+                         if s["status"] != "online"]
+            collected += got
+        if sorted(collected) != sorted(names):
+            failures.append(f"shards together collected {sorted(collected)}, expected {sorted(names)}")
+
+        failures += wait_all([run_collector(config_path, "--merge-shards", "--shard-count", str(args.shards))])
+        if output_file.exists():
+            failures += check_merged(json.loads(output_file.read_text(encoding='utf-8')), names, [], [])
+        else:
+            failures.append("merge wrote no status.json")
+        history_path = output_file.parent / "history.json"
+        history = json.loads(history_path.read_text(encoding='utf-8')) if history_path.exists() else []
+        if len(history) != 1:
+            failures.append(f"history.json has {len(history)} entries after one merge, expected 1")
+        failures += [f"history entry {entry['timestamp']} has shard bookkeeping" for entry in history
+                     if "shards" in entry]
+
+        # A shard that did not report: its servers are listed offline
+        lost = args.shards - 1
+        get_shard_path(str(output_file), lost, args.shards).unlink(missing_ok=True)
+        failures += wait_all([run_collector(config_path, "--merge-shards", "--shard-count", str(args.shards))])
+        lost_names = [server.name for server in shard_servers(servers, lost, args.shards)]
+        failures += check_merged(json.loads(output_file.read_text(encoding='utf-8')), names, lost_names, [lost])
+
+        # A naive timestamp (hand-written or old shard) is read as UTC
+        first = get_shard_path(str(output_file), 0, args.shards)
+        partial = json.loads(first.read_text(encoding='utf-8'))
+        partial["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+        first.write_text(json.dumps(partial), encoding='utf-8')
+        failures += wait_all([run_collector(config_path, "--merge-shards", "--shard-count", str(args.shards))])
+        failures += check_merged(json.loads(output_file.read_text(encoding='utf-8')), names, lost_names, [lost])
+
+    print(f"{args.hosts} hosts, {args.shards} shard processes: collected in {collect_time:.1f}s")
+    for message in failures:
+        print(f"FAIL: {message}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Local fake SSH hosts for offline benchmarks.
+
+Starts N asyncssh servers on 127.0.0.1, each answering any command with
+synthetic COMBINED_COMMAND output. Hosts can be configured to add latency,
+fail with a non-zero exit status, or hang until the client times out.
+No GPU and no remote machine is needed.
+
+Standalone usage (prints one "name port" line per host, Ctrl-C to stop):
+
+    python -m benchmarks.fake_ssh --hosts 20 --gpus 8 --latency 0.05
+
+With --write-config the hosts are also written as a servers.json, so the
+real collector (including several --shard-id processes) can be pointed at
+them with GPU_MONITOR_CONFIG.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import asyncssh
+
+from collector.config import ServerConfig
+from collector.synthetic import synthetic_output
+
+
+@dataclass
+class FakeHostOptions:
+    """Behaviour of the simulated hosts."""
+    gpu_count: int = 8
+    process_count: int = 300
+    latency: float = 0.0      # seconds before the command answers
+    jitter: float = 0.0       # extra uniform random latency
+    fail_rate: float = 0.0    # fraction of hosts exiting with status 1
+    hang_rate: float = 0.0    # fraction of hosts that never answer
+    seed: int = 0
+
+
+def host_name(index: int) -> str:
+    return f"fake-{index:04d}"
+
+
+def create_keys(key_dir: Path) -> Tuple[Path, Path, Path]:
+    """Create host and client keys; returns (host_key, client_key, authorized_keys)."""
+    key_dir.mkdir(parents=True, exist_ok=True)
+
+    host_key = key_dir / "host_key"
+    client_key = key_dir / "client_key"
+    authorized_keys = key_dir / "authorized_keys"
+
+    asyncssh.generate_private_key('ssh-ed25519').write_private_key(str(host_key))
+    key = asyncssh.generate_private_key('ssh-ed25519')
+    key.write_private_key(str(client_key))
+    key.write_public_key(str(authorized_keys))
+
+    return host_key, client_key, authorized_keys
+
+
+def _make_handler(index: int, options: FakeHostOptions):
+    rng = random.Random(f"{options.seed}:{index}")
+    roll = rng.random()
+    hangs = roll < options.hang_rate
+    fails = not hangs and roll < options.hang_rate + options.fail_rate
+    output = synthetic_output(
+        host_name(index),
+        gpu_count=options.gpu_count,
+        process_count=options.process_count,
+        seed=options.seed + index,
+    )
+
+    async def handle(process) -> None:
+        if hangs:
+            await asyncio.sleep(3600)
+        delay = options.latency + rng.uniform(0, options.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if fails:
+            process.stderr.write("simulated failure\n")
+            process.exit(1)
+            return
+        process.stdout.write(output)
+        process.exit(0)
+
+    return handle
+
+
+async def _serve(count: int, options: FakeHostOptions, host_key: Path,
+                 authorized_keys: Path, ready) -> None:
+    acceptors = []
+    for index in range(count):
+        acceptor = await asyncssh.create_server(
+            asyncssh.SSHServer, '127.0.0.1', 0,
+            server_host_keys=[str(host_key)],
+            authorized_client_keys=str(authorized_keys),
+            process_factory=_make_handler(index, options),
+        )
+        acceptors.append(acceptor)
+
+    ready([acceptor.sockets[0].getsockname()[1] for acceptor in acceptors])
+    await asyncio.Event().wait()
+
+
+def _run_server(count, options, host_key, authorized_keys, queue) -> None:
+    try:
+        asyncio.run(_serve(count, options, host_key, authorized_keys, queue.put))
+    except KeyboardInterrupt:
+        pass
+
+
+class FakeSSHFleet:
+    """
+    Fake hosts running in a child process, so their CPU time is not
+    charged to the collector being measured.
+    """
+
+    def __init__(self, count: int, key_dir: Path, options: Optional[FakeHostOptions] = None):
+        self.count = count
+        self.options = options or FakeHostOptions()
+        self.host_key, self.client_key, self.authorized_keys = create_keys(key_dir)
+        self.ports: List[int] = []
+        self._process: Optional[multiprocessing.Process] = None
+
+    def start(self, timeout: float = 60) -> "FakeSSHFleet":
+        queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_run_server,
+            args=(self.count, self.options, self.host_key, self.authorized_keys, queue),
+            daemon=True,
+        )
+        self._process.start()
+        self.ports = queue.get(timeout=timeout)
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def servers(self) -> List[ServerConfig]:
+        """ServerConfig entries pointing at the fake hosts."""
+        return [
+            ServerConfig(
+                name=host_name(index),
+                host='127.0.0.1',
+                user='bench',
+                port=port,
+                key_path=str(self.client_key),
+            )
+            for index, port in enumerate(self.ports)
+        ]
+
+    def __enter__(self) -> "FakeSSHFleet":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run local fake SSH hosts")
+    parser.add_argument('--hosts', type=int, default=10, help='Number of fake hosts')
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per host')
+    parser.add_argument('--processes', type=int, default=300, help='ps table rows per host')
+    parser.add_argument('--latency', type=float, default=0.0, help='Command latency in seconds')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of failing hosts')
+    parser.add_argument('--hang-rate', type=float, default=0.0, help='Fraction of hanging hosts')
+    parser.add_argument('--key-dir', type=str, default='./bench-keys', help='Directory for generated keys')
+    parser.add_argument('--write-config', type=str, help='Write a servers.json for the fake hosts')
+    args = parser.parse_args()
+
+    options = FakeHostOptions(
+        gpu_count=args.gpus,
+        process_count=args.processes,
+        latency=args.latency,
+        fail_rate=args.fail_rate,
+        hang_rate=args.hang_rate,
+    )
+    with FakeSSHFleet(args.hosts, Path(args.key_dir), options) as fleet:
+        print(f"client key: {fleet.client_key}", file=sys.stderr)
+        if args.write_config:
+            config = {
+                "servers": [
+                    {"name": s.name, "host": s.host, "user": s.user, "port": s.port, "key_file": s.key_path}
+                    for s in fleet.servers()
+                ],
+                "timeout": 10,
+            }
+            with open(args.write_config, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2)
+            print(f"config written to {args.write_config}", file=sys.stderr)
+        for server in fleet.servers():
+            print(f"{server.name} {server.port}")
+        sys.stdout.flush()
+        try:
+            fleet._process.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
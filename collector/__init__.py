@@ -1,3 +1,3 @@
-"""GPU/CPU Monitor Collector Package"""
-
-__version__ = "2.0.0"
+"""GPU/CPU Monitor Collector Package"""
+
+__version__ = "2.0.0"
@@ -0,0 +1,314 @@
+"""
+Per-user GPU-hours and VRAM-hours accounting.
+
+Every snapshot adds to running totals in daily buckets, per user, server
+and GPU model, kept in accounting.json next to the status file:
+
+    {
+      "counted": {"<server>": [[<start epoch s>, <end epoch s>], ...]},
+      "days": {
+        "2026-01-31": {
+          "<user>": {"<server>": {"<gpu model>": {
+              "gpu_hours": ..., "vram_gb_hours": ..., "util_gpu_hours": ...}}}
+        }
+      }
+    }
+
+A sample counts for the time since the server's previous sample, capped
+at max_gap_seconds so outages are not billed. "counted" holds the time
+ranges already billed per server; a sample only adds the part of its
+interval outside them, so history older than the live cycles can still be
+backfilled and nothing is counted twice. A GPU shared by several users is
+split by each user's share of the VRAM in use on it.
+util_gpu_hours is utilization x GPU-hours, so util_gpu_hours / gpu_hours
+is the average utilization while occupied.
+
+Query and backfill from the command line:
+
+    python -m collector.accounting query --by user --days 7
+    python -m collector.accounting query --by user,model --since 2026-01-01
+    python -m collector.accounting backfill docs/data/history.json
+"""
+
+import argparse
+import bisect
+import sys
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .jsonio import iter_json_array, load_file, save_json
+from .stats import CollectorStats
+
+METRICS = ("gpu_hours", "vram_gb_hours", "util_gpu_hours")
+GROUP_FIELDS = ("user", "server", "model")
+
+
+def _count_interval(ranges: List[List[float]], t: float, default_interval: float, max_gap_seconds: float) -> float:
+    """
+    Seconds a sample at t adds to a server's counted ranges (sorted,
+    disjoint [start, end] epoch seconds), which are updated in place.
+    A sample inside counted time adds nothing.
+    """
+    i = bisect.bisect_left(ranges, [t])  # first range starting at or after t
+    if i and ranges[i - 1][1] >= t:
+        return 0.0
+    interval = min(t - ranges[i - 1][1], max_gap_seconds) if i else default_interval
+    start = t - interval
+
+    # Ranges end before start or begin at or after t, so (start, t] only
+    # touches its neighbours
+    if i and ranges[i - 1][1] == start:
+        ranges[i - 1][1] = t
+        i -= 1
+    else:
+        ranges.insert(i, [start, t])
+    if i + 1 < len(ranges) and ranges[i + 1][0] == t:
+        ranges[i][1] = ranges.pop(i + 1)[1]
+    return interval
+
+
+def update_accounting(
+    table: Dict[str, Any],
+    snapshot: Dict[str, Any],
+    default_interval: float = 60.0,
+    max_gap_seconds: float = 300.0,
+    max_days: int = 400,
+) -> int:
+    """
+    Add one status snapshot to the accounting table, in place.
+
+    Only time not already counted for a server is added, so folding the
+    same snapshot twice, or a history overlapping the live cycles (e.g. a
+    backfill over an existing table), does not double count.
+
+    Args:
+        table: Accounting table (empty dict to start a new one)
+        snapshot: Status snapshot as written to status.json
+        default_interval: Seconds counted for a server's first sample
+        max_gap_seconds: Longest interval a single sample can count for
+        max_days: Daily buckets to keep
+
+    Returns:
+        Number of servers whose sample added time
+    """
+    now = datetime.fromisoformat(snapshot["timestamp"])
+    t = now.timestamp()
+    day = now.date().isoformat()
+
+    counted = table.setdefault("counted", {})
+    days = table.setdefault("days", {})
+    added = 0
+
+    for server in snapshot.get("servers", []):
+        if server.get("status") != "online":
+            continue
+
+        name = server["name"]
+        interval = _count_interval(counted.setdefault(name, []), t, default_interval, max_gap_seconds)
+        if interval <= 0:
+            continue
+        added += 1
+
+        hours = interval / 3600
+        for gpu in server.get("gpus", []):
+            # VRAM in use per user on this GPU
+            usage: Dict[str, float] = defaultdict(float)
+            for process in gpu.get("processes", []):
+                usage[process.get("user") or "unknown"] += process.get("gpu_memory_mb") or 0
+            if not usage:
+                continue
+
+            total_mb = sum(usage.values())
+            model = gpu.get("name") or "unknown"
+            utilization = gpu.get("utilization_percent") or 0
+
+            for user, memory_mb in usage.items():
+                share = memory_mb / total_mb if total_mb else 1 / len(usage)
+                bucket = (days.setdefault(day, {})
+                          .setdefault(user, {})
+                          .setdefault(name, {})
+                          .setdefault(model, dict.fromkeys(METRICS, 0.0)))
+                # Unrounded: rounding every increment would add up; query() rounds
+                bucket["gpu_hours"] += share * hours
+                bucket["vram_gb_hours"] += memory_mb / 1024 * hours
+                bucket["util_gpu_hours"] += utilization * share * hours
+
+    for old_day in sorted(days)[:-max_days]:
+        del days[old_day]
+    cutoff = t - max_days * 86400
+    for name, ranges in counted.items():
+        counted[name] = [r for r in ranges if r[1] >= cutoff]
+
+    return added
+
+
+def _accounting_path(output_file: str) -> Path:
+    return Path(output_file).parent / "accounting.json"
+
+
+def _load_table(path: Path) -> Dict[str, Any]:
+    if path.exists():
+        try:
+            return load_file(path)
+        except (ValueError, IOError):
+            pass
+    return {}
+
+
+def save_accounting(
+    data: Dict[str, Any],
+    output_file: str,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    precompress: Sequence[str] = (),
+) -> None:
+    """Add one snapshot to accounting.json next to the status file."""
+    if stats is None:
+        stats = CollectorStats()
+
+    path = _accounting_path(output_file)
+    with stats.phase("load_accounting"):
+        table = _load_table(path)
+
+    update_accounting(table, data)
+
+    with stats.phase("write_accounting"):
+        size = save_json(path, table, precompress=precompress)
+    stats.record_bytes("accounting", size)
+
+    if verbose:
+        print(f"Accounting saved ({len(table['days'])} days)")
+
+
+def backfill(table: Dict[str, Any], snapshots: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Fold snapshots (oldest first) into the table.
+
+    Returns:
+        (snapshots read, snapshots that added time)
+    """
+    read = added = 0
+    for snapshot in snapshots:
+        read += 1
+        if update_accounting(table, snapshot):
+            added += 1
+    return read, added
+
+
+def query(
+    table: Dict[str, Any],
+    by: Sequence[str] = ("user",),
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    users: Sequence[str] = (),
+    servers: Sequence[str] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Sum the daily buckets between since and until (inclusive), grouped by
+    any of user, server and model.
+
+    Returns:
+        Rows with the group fields, gpu_hours, vram_gb_hours and
+        avg_util_percent, largest gpu_hours first
+    """
+    totals: Dict[tuple, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(METRICS, 0.0))
+
+    for day, day_users in table.get("days", {}).items():
+        day_date = date.fromisoformat(day)
+        if (since and day_date < since) or (until and day_date > until):
+            continue
+        for user, user_servers in day_users.items():
+            if users and user not in users:
+                continue
+            for server, models in user_servers.items():
+                if servers and server not in servers:
+                    continue
+                for model, bucket in models.items():
+                    fields = {"user": user, "server": server, "model": model}
+                    total = totals[tuple(fields[f] for f in by)]
+                    for metric in METRICS:
+                        total[metric] += bucket[metric]
+
+    rows = []
+    for key, total in totals.items():
+        row: Dict[str, Any] = dict(zip(by, key))
+        row["gpu_hours"] = round(total["gpu_hours"], 2)
+        row["vram_gb_hours"] = round(total["vram_gb_hours"], 2)
+        row["avg_util_percent"] = round(total["util_gpu_hours"] / total["gpu_hours"], 1) if total["gpu_hours"] else 0.0
+        rows.append(row)
+
+    return sorted(rows, key=lambda r: -r["gpu_hours"])
+
+
+def _default_output_file() -> str:
+    from .config import load_config
+    try:
+        return load_config().output_file
+    except (FileNotFoundError, ValueError):
+        return "./docs/data/status.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GPU-hours and VRAM-hours accounting")
+    parser.add_argument('--file', help='accounting.json (default: next to the configured status file)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    query_parser = subparsers.add_parser('query', help='Show totals')
+    query_parser.add_argument('--by', default='user',
+                              help='Comma-separated grouping: user, server, model (default: user)')
+    query_parser.add_argument('--days', type=int, default=7, help='Last N days including today (default: 7)')
+    query_parser.add_argument('--since', type=date.fromisoformat, help='First day (YYYY-MM-DD), overrides --days')
+    query_parser.add_argument('--until', type=date.fromisoformat, help='Last day (YYYY-MM-DD)')
+    query_parser.add_argument('--user', action='append', default=[], help='Only this user (repeatable)')
+    query_parser.add_argument('--server', action='append', default=[], help='Only this server (repeatable)')
+    query_parser.add_argument('--json', action='store_true', help='Print rows as JSON')
+
+    backfill_parser = subparsers.add_parser('backfill', help='Fold an existing history.json into the table')
+    backfill_parser.add_argument('history', help='history.json to read (streamed)')
+    backfill_parser.add_argument('--reset', action='store_true', help='Start from an empty table')
+
+    args = parser.parse_args()
+    path = Path(args.file) if args.file else _accounting_path(_default_output_file())
+
+    if args.command == 'backfill':
+        table = {} if args.reset else _load_table(path)
+        try:
+            read, added = backfill(table, iter_json_array(Path(args.history)))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        save_json(path, table)
+        print(f"Backfilled {added} of {read} snapshots into {path} ({read - added} already counted)")
+        return
+
+    by = [field.strip() for field in args.by.split(',') if field.strip()]
+    invalid = [field for field in by if field not in GROUP_FIELDS]
+    if not by or invalid:
+        print(f"Error: --by takes {', '.join(GROUP_FIELDS)}", file=sys.stderr)
+        sys.exit(1)
+
+    since = args.since or date.today() - timedelta(days=args.days - 1)
+    rows = query(_load_table(path), by=by, since=since, until=args.until,
+                 users=args.user, servers=args.server)
+
+    if args.json:
+        import json
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+        return
+
+    if not rows:
+        print(f"No usage recorded since {since.isoformat()}")
+        return
+
+    widths = [max(len(field), *(len(str(row[field])) for row in rows)) for field in by]
+    header = "  ".join(field.ljust(width) for field, width in zip(by, widths))
+    print(f"{header}  {'GPU-h':>10}  {'VRAM-GB-h':>10}  {'util %':>7}")
+    for row in rows:
+        key = "  ".join(str(row[field]).ljust(width) for field, width in zip(by, widths))
+        print(f"{key}  {row['gpu_hours']:>10.2f}  {row['vram_gb_hours']:>10.2f}  {row['avg_util_percent']:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
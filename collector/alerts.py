@@ -0,0 +1,483 @@
+"""
+Streaming alert rules evaluated on every collection cycle.
+
+Rules are configured under "alerts" in servers.json:
+
+    "alerts": {
+      "rules": [
+        {"name": "server-offline", "metric": "server.offline", "op": ">=", "threshold": 1, "for": 120},
+        {"name": "gpu-hot", "metric": "gpu.temperature_celsius", "op": ">", "threshold": 85,
+         "clear": 80, "for": 300, "severity": "critical"},
+        {"name": "disk-full", "metric": "disk.usage_percent", "op": ">", "threshold": 95},
+        {"name": "gpu-idle", "metric": "gpu.utilization_percent", "op": "<", "threshold": 5,
+         "window": 3600, "aggregate": "mean"}
+      ],
+      "sinks": [
+        {"type": "webhook", "url": "https://hooks.example.com/..."},
+        {"type": "file", "path": "./logs/alerts.jsonl"}
+      ],
+      "repeat_after": 3600,
+      "state_file": "./state/alerts_state.json"
+    }
+
+Each rule is evaluated per series (a server, a GPU or a disk). A rule
+fires once its condition has held for "for" seconds, tracked by the time
+the breach started. With "window" the condition is tested on the mean of
+the last "window" seconds (once the series spans a full window), kept as
+a running sum over WINDOW_BUCKETS time buckets, so the oldest bucket may
+reach up to window / WINDOW_BUCKETS past the window. Both are O(1) per
+sample, so no history is re-read. A firing alert resolves only when the
+value no longer passes "clear" (hysteresis, defaults to the threshold).
+Notifications are sent on transitions only, plus a reminder every
+"repeat_after" seconds while firing (0 = never).
+
+State is kept in "state_file", outside docs/ by default: it is internal,
+and the cron job publishes everything under docs/data.
+"""
+
+import math
+import operator
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .jsonio import dumps, load_file, save_json
+from .stats import CollectorStats
+
+OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+AGGREGATES = ("last", "mean")
+
+# Time buckets kept per windowed series, whatever the window and interval
+WINDOW_BUCKETS = 60
+
+DEFAULT_STATE_FILE = "./state/alerts_state.json"
+
+# Forget series not seen for this long (removed servers, GPUs, disks)
+SERIES_MAX_AGE = 86400
+
+
+def _usage(section: str) -> Callable[[Dict[str, Any]], Optional[float]]:
+    def extract(server: Dict[str, Any]) -> Optional[float]:
+        return ((server.get("system") or {}).get(section) or {}).get("usage_percent")
+    return extract
+
+
+def _gpu_field(name: str) -> Callable[[Dict[str, Any]], Optional[float]]:
+    return lambda gpu: gpu.get(name)
+
+
+# metric -> (scope, extractor); the extractor gets the server, GPU or disk dict
+METRICS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Optional[float]]]] = {
+    "server.offline": ("server", lambda server: 0 if server.get("status") == "online" else 1),
+    "server.cpu_usage_percent": ("server", _usage("cpu")),
+    "server.memory_usage_percent": ("server", _usage("memory")),
+    "gpu.temperature_celsius": ("gpu", _gpu_field("temperature_celsius")),
+    "gpu.utilization_percent": ("gpu", _gpu_field("utilization_percent")),
+    "gpu.memory_usage_percent": ("gpu", lambda gpu: (gpu.get("memory") or {}).get("usage_percent")),
+    "disk.usage_percent": ("disk", lambda disk: disk.get("usage_percent")),
+}
+
+
+@dataclass
+class AlertRule:
+    """A threshold condition on one metric, evaluated per series."""
+    name: str
+    metric: str
+    op: str
+    threshold: float
+    clear: Optional[float] = None  # resolve threshold (hysteresis); None = threshold
+    for_seconds: float = 0
+    window_seconds: float = 0
+    aggregate: str = "last"
+    severity: str = "warning"
+
+    @property
+    def scope(self) -> str:
+        return METRICS[self.metric][0]
+
+
+@dataclass
+class AlertConfig:
+    """Rules, sinks and dedup settings from the "alerts" block of servers.json."""
+    rules: List[AlertRule] = field(default_factory=list)
+    sinks: List[Dict[str, Any]] = field(default_factory=list)
+    repeat_after: float = 0
+    state_file: str = DEFAULT_STATE_FILE
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _seconds(raw: Dict[str, Any], key: str, where: str) -> float:
+    value = raw.get(key, 0)
+    if not _is_number(value) or value < 0:
+        raise ValueError(f"{where}: {key} must be a non-negative number of seconds, got {value!r}")
+    return value
+
+
+def _objects(data: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    items = data.get(key, [])
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError(f"alerts: {key} must be a list of objects, got {items!r}")
+    return items
+
+
+def parse_alert_config(data: Dict[str, Any]) -> AlertConfig:
+    """
+    Parse and validate the "alerts" block of servers.json.
+
+    Raises:
+        ValueError: If a rule or sink is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"alerts must be an object, got {data!r}")
+    rules = []
+    names = set()
+    for raw in _objects(data, "rules"):
+        name = raw.get("name")
+        if not name or name in names:
+            raise ValueError(f"Alert rules need a unique name: {raw!r}")
+        names.add(name)
+
+        if raw.get("metric") not in METRICS:
+            raise ValueError(f"Alert rule {name!r}: unknown metric {raw.get('metric')!r} "
+                             f"(expected one of {', '.join(METRICS)})")
+        if raw.get("op", ">") not in OPERATORS:
+            raise ValueError(f"Alert rule {name!r}: unknown op {raw.get('op')!r}")
+        if raw.get("aggregate", "last") not in AGGREGATES:
+            raise ValueError(f"Alert rule {name!r}: aggregate must be one of {', '.join(AGGREGATES)}")
+        if raw.get("aggregate") == "mean" and not raw.get("window"):
+            raise ValueError(f"Alert rule {name!r}: aggregate 'mean' needs a window")
+        if not _is_number(raw.get("threshold")):
+            raise ValueError(f"Alert rule {name!r}: threshold must be a number")
+        for_seconds = _seconds(raw, "for", f"Alert rule {name!r}")
+        window_seconds = _seconds(raw, "window", f"Alert rule {name!r}")
+
+        # A firing alert resolves once the value fails the op against clear,
+        # so clear must lie on the non-firing side of the threshold
+        clear = raw.get("clear")
+        if clear is not None:
+            op = raw.get("op", ">")
+            if not _is_number(clear):
+                raise ValueError(f"Alert rule {name!r}: clear must be a number, got {clear!r}")
+            if (clear > raw["threshold"]) if op in (">", ">=") else (clear < raw["threshold"]):
+                side = "at most" if op in (">", ">=") else "at least"
+                raise ValueError(f"Alert rule {name!r}: with op {op!r}, clear must be {side} "
+                                 f"the threshold ({raw['threshold']}), got {clear}")
+
+        rules.append(AlertRule(
+            name=name,
+            metric=raw["metric"],
+            op=raw.get("op", ">"),
+            threshold=raw["threshold"],
+            clear=clear,
+            for_seconds=for_seconds,
+            window_seconds=window_seconds,
+            aggregate=raw.get("aggregate", "mean" if raw.get("window") else "last"),
+            severity=raw.get("severity", "warning"),
+        ))
+
+    sinks = _objects(data, "sinks")
+    for sink in sinks:
+        sink_type = sink.get("type")
+        if sink_type not in SINKS:
+            raise ValueError(f"Unknown alert sink type {sink_type!r} (expected one of {', '.join(SINKS)})")
+        required, optional = SINK_OPTIONS[sink_type]
+        if not isinstance(sink.get(required), str) or not sink[required]:
+            raise ValueError(f"Alert sink {sink_type!r}: {required} must be a non-empty string, "
+                             f"got {sink.get(required)!r}")
+        unknown = set(sink) - {"type", required, *optional}
+        if unknown:
+            raise ValueError(f"Alert sink {sink_type!r}: unknown option {', '.join(sorted(unknown))}")
+        timeout = sink.get("timeout", 10)
+        if not _is_number(timeout) or timeout <= 0:
+            raise ValueError(f"Alert sink {sink_type!r}: timeout must be a positive number, got {timeout!r}")
+
+    state_file = data.get("state_file", DEFAULT_STATE_FILE)
+    if not isinstance(state_file, str) or not state_file:
+        raise ValueError(f"alerts: state_file must be a path, got {state_file!r}")
+
+    return AlertConfig(
+        rules=rules,
+        sinks=sinks,
+        repeat_after=_seconds(data, "repeat_after", "alerts"),
+        state_file=state_file,
+    )
+
+
+class SeriesState:
+    """Alert state of one (rule, series) pair."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.firing: bool = data.get("firing", False)
+        self.breach_since: Optional[float] = data.get("breach_since")
+        self.notified_at: Optional[float] = data.get("notified_at")
+        self.first_seen: Optional[float] = data.get("first_seen")
+        self.last_seen: float = data.get("last_seen", 0)
+        self.value: Optional[float] = None  # only reported in this cycle's notifications
+        self.buckets: Deque[List[float]] = deque(data.get("buckets", []))  # [bucket start, sum, count]
+        self.total = sum(b[1] for b in self.buckets)
+        self.count = sum(b[2] for b in self.buckets)
+
+    def add_sample(self, now: float, value: float, window: float) -> float:
+        """Add a sample to the window and return the window mean."""
+        width = window / WINDOW_BUCKETS
+        start = math.floor(now / width) * width
+        if self.buckets and self.buckets[-1][0] == start:
+            self.buckets[-1][1] += value
+            self.buckets[-1][2] += 1
+        else:
+            self.buckets.append([start, value, 1])
+        self.total += value
+        self.count += 1
+
+        # Drop buckets that lie wholly before the window
+        while self.buckets and self.buckets[0][0] + width <= now - window:
+            _, total, count = self.buckets.popleft()
+            self.total -= total
+            self.count -= count
+
+        return self.total / self.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """What the next cycle needs; unset fields are left out."""
+        data: Dict[str, Any] = {"first_seen": self.first_seen, "last_seen": self.last_seen}
+        if self.firing:
+            data["firing"] = True
+        for key in ("breach_since", "notified_at"):
+            if getattr(self, key) is not None:
+                data[key] = getattr(self, key)
+        if self.buckets:
+            data["buckets"] = [list(b) for b in self.buckets]
+        return data
+
+
+class AlertEngine:
+    """
+    Evaluates the rules on each processed server and collects notifications.
+
+    Usage:
+        engine = AlertEngine(config, state)
+        for server in snapshot["servers"]:
+            engine.observe_server(server, now)
+        notifications = engine.notifications
+    """
+
+    def __init__(self, config: AlertConfig, state: Optional[Dict[str, Any]] = None):
+        self.config = config
+        self.series: Dict[str, SeriesState] = {
+            key: SeriesState(data) for key, data in (state or {}).get("series", {}).items()
+        }
+        self.notifications: List[Dict[str, Any]] = []
+
+        self._rules_by_scope: Dict[str, List[AlertRule]] = {}
+        for rule in config.rules:
+            self._rules_by_scope.setdefault(rule.scope, []).append(rule)
+
+    def observe_server(self, server: Dict[str, Any], now: float) -> None:
+        """Evaluate all rules against one processed server."""
+        name = server["name"]
+
+        for rule in self._rules_by_scope.get("server", []):
+            self._evaluate(rule, name, server, now, {"server": name})
+
+        for rule in self._rules_by_scope.get("gpu", []):
+            for gpu in server.get("gpus", []):
+                self._evaluate(rule, f"{name}/gpu{gpu['index']}", gpu, now, {"server": name, "gpu": gpu["index"]})
+
+        for rule in self._rules_by_scope.get("disk", []):
+            for disk in (server.get("system") or {}).get("disks", []):
+                mount = disk.get("mount_point")
+                self._evaluate(rule, f"{name}:{mount}", disk, now, {"server": name, "mount_point": mount})
+
+    def _evaluate(self, rule: AlertRule, series: str, item: Dict[str, Any], now: float,
+                  labels: Dict[str, Any]) -> None:
+        value = METRICS[rule.metric][1](item)
+        if value is None:
+            return
+
+        key = f"{rule.name}|{series}"
+        state = self.series.get(key)
+        if state is None:
+            state = self.series[key] = SeriesState()
+        if state.first_seen is None:
+            state.first_seen = now
+        state.last_seen = now
+
+        if rule.window_seconds:
+            value = state.add_sample(now, value, rule.window_seconds)
+        state.value = value
+
+        # A window aggregate is only meaningful once the series spans the window
+        if rule.window_seconds and now - state.first_seen < rule.window_seconds:
+            return
+
+        compare = OPERATORS[rule.op]
+        if state.firing:
+            clear = rule.threshold if rule.clear is None else rule.clear
+            if not compare(value, clear):
+                state.firing = False
+                state.breach_since = None
+                state.notified_at = now
+                self._notify(rule, series, labels, state, "resolved", now)
+            elif self.config.repeat_after and now - (state.notified_at or 0) >= self.config.repeat_after:
+                state.notified_at = now
+                self._notify(rule, series, labels, state, "firing", now)
+        elif compare(value, rule.threshold):
+            if state.breach_since is None:
+                state.breach_since = now
+            if now - state.breach_since >= rule.for_seconds:
+                state.firing = True
+                state.notified_at = now
+                self._notify(rule, series, labels, state, "firing", now)
+        else:
+            state.breach_since = None
+
+    def _notify(self, rule: AlertRule, series: str, labels: Dict[str, Any], state: SeriesState,
+                status: str, now: float) -> None:
+        value = round(state.value, 2)
+        if status == "firing":
+            message = f"[{rule.severity.upper()}] {rule.name}: {series} {rule.metric} = {value} ({rule.op} {rule.threshold})"
+        else:
+            message = f"[RESOLVED] {rule.name}: {series} {rule.metric} = {value}"
+
+        self.notifications.append(dict(
+            labels,
+            rule=rule.name,
+            severity=rule.severity,
+            status=status,
+            series=series,
+            metric=rule.metric,
+            value=value,
+            threshold=rule.threshold,
+            since=datetime.fromtimestamp(state.breach_since).astimezone().isoformat() if state.breach_since else None,
+            timestamp=datetime.fromtimestamp(now).astimezone().isoformat(),
+            message=message,
+        ))
+
+    def state_dict(self, now: float) -> Dict[str, Any]:
+        """Persistable state, without series unseen for SERIES_MAX_AGE."""
+        return {
+            "series": {
+                key: state.to_dict() for key, state in self.series.items()
+                if now - state.last_seen < SERIES_MAX_AGE
+            },
+            "firing": sorted(key for key, state in self.series.items() if state.firing),
+        }
+
+
+class FileSink:
+    """Append notifications as JSON lines to a file."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def send(self, notifications: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'ab') as f:
+            for notification in notifications:
+                f.write(dumps(notification) + b"\n")
+
+
+class WebhookSink:
+    """
+    POST notifications as one JSON body per cycle:
+    {"text": "<one line per alert>", "alerts": [...]}.
+    The "text" field makes Slack-style incoming webhooks show the alerts.
+    """
+
+    def __init__(self, url: str, timeout: float = 10):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, notifications: List[Dict[str, Any]]) -> None:
+        import urllib.request
+
+        body = dumps({
+            "text": "\n".join(n["message"] for n in notifications),
+            "alerts": notifications,
+        })
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+# Sink "type" in servers.json -> class; the other keys are passed to the constructor
+SINKS = {
+    "file": FileSink,
+    "webhook": WebhookSink,
+}
+
+# Sink "type" -> (required string option, optional options)
+SINK_OPTIONS = {
+    "file": ("path", ()),
+    "webhook": ("url", ("timeout",)),
+}
+
+
+def create_sink(config: Dict[str, Any]):
+    options = {k: v for k, v in config.items() if k != "type"}
+    return SINKS[config["type"]](**options)
+
+
+def evaluate_alerts(
+    data: Dict[str, Any],
+    config: AlertConfig,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate the rules on one snapshot, send notifications to the sinks and
+    update the state file.
+
+    Returns:
+        Notifications sent this cycle
+    """
+    if stats is None:
+        stats = CollectorStats()
+
+    state_path = Path(config.state_file)
+
+    state = None
+    if state_path.exists():
+        try:
+            state = load_file(state_path)
+        except (ValueError, IOError):
+            state = None
+
+    now = datetime.fromisoformat(data["timestamp"]).timestamp()
+
+    with stats.phase("alerts"):
+        engine = AlertEngine(config, state)
+        for server in data.get("servers", []):
+            engine.observe_server(server, now)
+
+    if engine.notifications:
+        with stats.phase("notify"):
+            for sink_config in config.sinks:
+                try:
+                    create_sink(sink_config).send(engine.notifications)
+                except Exception as e:
+                    # A broken sink must not stop collection or the other sinks
+                    print(f"Alert sink {sink_config.get('type')} failed: {e}", file=sys.stderr)
+
+    save_json(state_path, engine.state_dict(now))
+
+    if verbose:
+        for notification in engine.notifications:
+            print(notification["message"])
+        firing = sum(1 for s in engine.series.values() if s.firing)
+        print(f"Alerts evaluated ({len(engine.series)} series, {firing} firing)")
+
+    return engine.notifications
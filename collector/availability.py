@@ -0,0 +1,125 @@
+"""
+Free-GPU availability index.
+
+Built from every snapshot and written to availability.json next to the
+status file, so "where can I run" is answered without scanning the full
+status (see collector/find_free.py):
+
+    {
+      "timestamp": "...",
+      "thresholds": {"max_utilization_percent": 10, "max_memory_percent": 10},
+      "models": {
+        "<gpu model>": [
+          {"server": ..., "index": ..., "uuid": ..., "free_mb": ..., "total_mb": ...,
+           "utilization_percent": ..., "idle_since": "..."}
+        ]
+      }
+    }
+
+A GPU is free when it runs no processes and its utilization and VRAM
+usage are at or below the thresholds. Each model's list is sorted by free
+VRAM, largest first. idle_since is carried over from the previous index
+while the GPU stays free.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from .jsonio import load_file, save_json
+from .stats import CollectorStats
+
+
+def _gpu_key(server: str, gpu: Dict[str, Any]) -> tuple:
+    return (server, gpu.get("uuid") or gpu.get("index"))
+
+
+def build_availability(
+    snapshot: Dict[str, Any],
+    previous: Optional[Dict[str, Any]] = None,
+    max_utilization: float = 10,
+    max_memory_percent: float = 10,
+) -> Dict[str, Any]:
+    """
+    Build the availability index for one status snapshot.
+
+    Args:
+        snapshot: Status snapshot as written to status.json
+        previous: Previous index, to carry idle_since over
+        max_utilization: Highest utilization (%) of a free GPU
+        max_memory_percent: Highest VRAM usage (%) of a free GPU
+
+    Returns:
+        Availability index
+    """
+    timestamp = snapshot["timestamp"]
+
+    idle_since: Dict[tuple, str] = {}
+    for entries in (previous or {}).get("models", {}).values():
+        for entry in entries:
+            idle_since[_gpu_key(entry["server"], entry)] = entry["idle_since"]
+
+    models: Dict[str, list] = {}
+    for server in snapshot.get("servers", []):
+        if server.get("status") != "online":
+            continue
+
+        for gpu in server.get("gpus", []):
+            memory = gpu.get("memory") or {}
+            if (gpu.get("processes")
+                    or (gpu.get("utilization_percent") or 0) > max_utilization
+                    or (memory.get("usage_percent") or 0) > max_memory_percent):
+                continue
+
+            total_mb = memory.get("total_mb") or 0
+            models.setdefault(gpu.get("name") or "unknown", []).append({
+                "server": server["name"],
+                "index": gpu["index"],
+                "uuid": gpu.get("uuid"),
+                "free_mb": total_mb - (memory.get("used_mb") or 0),
+                "total_mb": total_mb,
+                "utilization_percent": gpu.get("utilization_percent") or 0,
+                "idle_since": idle_since.get(_gpu_key(server["name"], gpu), timestamp),
+            })
+
+    for entries in models.values():
+        entries.sort(key=lambda e: -e["free_mb"])
+
+    return {
+        "timestamp": timestamp,
+        "thresholds": {
+            "max_utilization_percent": max_utilization,
+            "max_memory_percent": max_memory_percent,
+        },
+        "models": models,
+    }
+
+
+def save_availability(
+    data: Dict[str, Any],
+    output_file: str,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    precompress: Sequence[str] = (),
+) -> None:
+    """Rebuild availability.json next to the status file from one snapshot."""
+    if stats is None:
+        stats = CollectorStats()
+
+    path = Path(output_file).parent / "availability.json"
+
+    previous = None
+    if path.exists():
+        try:
+            previous = load_file(path)
+        except (ValueError, IOError):
+            previous = None
+
+    index = build_availability(data, previous)
+
+    with stats.phase("write_availability"):
+        size = save_json(path, index, indent=True, precompress=precompress)
+    stats.record_bytes("availability", size)
+
+    if verbose:
+        free = sum(len(entries) for entries in index["models"].values())
+        print(f"Availability saved ({free} free GPUs)")
@@ -0,0 +1,115 @@
+"""Record/replay of raw host output for debugging and parser benchmarks."""
+
+import gzip
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import __version__
+from .commands import parse_sections
+from .ssh_client import CollectionResult
+from .stats import CollectorStats
+
+
+def save_capture(results: List[CollectionResult], capture_dir: str, verbose: bool = False) -> Path:
+    """
+    Store the raw output of every host of one cycle in a gzip'd JSON-lines archive.
+
+    The first line is a header with the capture time and collector version;
+    each following line holds one host's raw COMBINED_COMMAND output together
+    with its status and timing metadata.
+    """
+    capture_path = Path(capture_dir)
+    capture_path.mkdir(parents=True, exist_ok=True)
+
+    now = datetime.now().astimezone()
+    archive = capture_path / f"capture-{now.strftime('%Y%m%dT%H%M%S%f')}.jsonl.gz"
+
+    with gzip.open(archive, 'wt', encoding='utf-8') as f:
+        header = {"captured_at": now.isoformat(), "collector_version": __version__, "hosts": len(results)}
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for result in results:
+            record = {
+                "server_name": result.server_name,
+                "host": result.host,
+                "success": result.success,
+                "error": result.error,
+                "collected_at": result.collected_at.isoformat() if result.collected_at else None,
+                "timings": result.timings,
+                "bytes_received": result.bytes_received,
+                "attempts": result.attempts,
+                "output": result.raw_output,
+            }
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    if verbose:
+        print(f"Capture saved to {archive}")
+
+    return archive
+
+
+def iter_captures(capture_dir: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every capture in a directory, oldest first.
+
+    Each item is {"header": {...}, "hosts": [record, ...]}.
+    """
+    for archive in sorted(Path(capture_dir).glob("capture-*.jsonl.gz")):
+        with gzip.open(archive, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            hosts = [json.loads(line) for line in f if line.strip()]
+        yield {"header": dict(header, file=archive.name), "hosts": hosts}
+
+
+def to_result(record: Dict[str, Any], stats: Optional[CollectorStats] = None) -> CollectionResult:
+    """Rebuild a CollectionResult from a captured host record."""
+    output = record.get("output")
+    sections = {}
+    if record["success"] and output is not None:
+        start = time.monotonic()
+        sections = parse_sections(output)
+        if stats is not None:
+            stats.record("split", time.monotonic() - start, host=record["server_name"])
+
+    collected_at = record.get("collected_at")
+    return CollectionResult(
+        server_name=record["server_name"],
+        host=record["host"],
+        success=record["success"],
+        sections=sections,
+        error=record.get("error"),
+        collected_at=datetime.fromisoformat(collected_at) if collected_at else None,
+        timings=record.get("timings") or {},
+        bytes_received=record.get("bytes_received", 0),
+        attempts=record.get("attempts", 0),
+        raw_output=output,
+    )
+
+
+def replay(capture_dir: str, stats: Optional[CollectorStats] = None) -> List[Dict[str, Any]]:
+    """
+    Feed captured outputs through parse_sections and process_result without SSH.
+
+    Returns:
+        One snapshot per capture, in the same layout as collect_and_output()
+    """
+    from .main import process_result
+
+    if stats is None:
+        stats = CollectorStats()
+
+    snapshots = []
+    for capture in iter_captures(capture_dir):
+        servers_data = []
+        for record in capture["hosts"]:
+            result = to_result(record, stats)
+            servers_data.append(process_result(result, stats=stats))
+        snapshots.append({
+            "timestamp": capture["header"]["captured_at"],
+            "collector_version": __version__,
+            "servers": servers_data,
+        })
+
+    return snapshots
@@ -1,149 +1,299 @@
-"""Configuration loading with security best practices."""
-
-import json
-import os
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import List, Optional
-
-
-@dataclass
-class ServerConfig:
-    """Configuration for a single server."""
-    name: str
-    host: str
-    user: str
-    port: int = 22
-    key_path: Optional[str] = None
-    key_passphrase: Optional[str] = None
-
-    def __post_init__(self):
-        # Expand user home directory in key path
-        if self.key_path:
-            self.key_path = os.path.expanduser(self.key_path)
-
-
-@dataclass
-class CollectorConfig:
-    """Main collector configuration."""
-    servers: List[ServerConfig] = field(default_factory=list)
-    output_file: str = "./docs/data/status.json"
-    timeout: int = 30
-    ssh_key_path: Optional[str] = None
-    ssh_key_passphrase: Optional[str] = None
-
-    def __post_init__(self):
-        if self.ssh_key_path:
-            self.ssh_key_path = os.path.expanduser(self.ssh_key_path)
-
-
-def get_config_paths() -> List[Path]:
-    """Get list of possible config file paths in order of priority."""
-    paths = []
-
-    # 1. Environment variable
-    env_path = os.environ.get('GPU_MONITOR_CONFIG')
-    if env_path:
-        paths.append(Path(env_path))
-
-    # 2. User config directory
-    paths.append(Path.home() / '.config' / 'gpu-monitor' / 'servers.json')
-
-    # 3. Current directory (for development)
-    paths.append(Path('./servers.json'))
-
-    # 4. Legacy location (for migration)
-    paths.append(Path('./gpu_servers.json'))
-
-    return paths
-
-
-def load_config() -> CollectorConfig:
-    """
-    Load configuration from file or environment variables.
-
-    Priority:
-    1. Environment variable GPU_MONITOR_CONFIG (path to config file)
-    2. ~/.config/gpu-monitor/servers.json
-    3. ./servers.json
-    4. ./gpu_servers.json (legacy)
-
-    SSH credentials:
-    - SSH_KEY_PATH: Path to SSH private key
-    - SSH_KEY_PASSPHRASE: Passphrase for SSH key (optional)
-
-    Returns:
-        CollectorConfig object
-
-    Raises:
-        FileNotFoundError: If no config file is found
-    """
-    config_data = None
-    config_path = None
-
-    # Try each config path
-    for path in get_config_paths():
-        if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            config_path = path
-            break
-
-    if config_data is None:
-        raise FileNotFoundError(
-            "No configuration file found. Please create one at:\n"
-            "  ~/.config/gpu-monitor/servers.json\n"
-            "Or set GPU_MONITOR_CONFIG environment variable."
-        )
-
-    # Get SSH key settings from environment or config
-    ssh_key_path = os.environ.get('SSH_KEY_PATH') or config_data.get('ssh_key_path', '~/.ssh/id_ed25519')
-    ssh_key_passphrase = os.environ.get('SSH_KEY_PASSPHRASE') or config_data.get('ssh_key_passphrase')
-
-    # Parse servers
-    servers = []
-    for server_data in config_data.get('servers', []):
-        server = ServerConfig(
-            name=server_data.get('name', server_data.get('host')),
-            host=server_data['host'],
-            user=server_data.get('user', 'root'),
-            port=server_data.get('port', 22),
-            key_path=server_data.get('key_file') or ssh_key_path,
-            key_passphrase=server_data.get('passphrase') or ssh_key_passphrase,
-        )
-        servers.append(server)
-
-    return CollectorConfig(
-        servers=servers,
-        output_file=config_data.get('output_file', './docs/data/status.json'),
-        timeout=config_data.get('timeout', 30),
-        ssh_key_path=ssh_key_path,
-        ssh_key_passphrase=ssh_key_passphrase,
-    )
-
-
-def create_example_config(path: Optional[Path] = None) -> Path:
-    """Create an example configuration file."""
-    if path is None:
-        path = Path.home() / '.config' / 'gpu-monitor' / 'servers.json'
-
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    example_config = {
-        "servers": [
-            {
-                "name": "Server-1",
-                "host": "192.168.1.100",
-                "user": "username",
-                "port": 22
-            }
-        ],
-        "output_file": "./docs/data/status.json",
-        "timeout": 30,
-        "_comment": "SSH key is read from SSH_KEY_PATH environment variable or ~/.ssh/id_ed25519"
-    }
-
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(example_config, f, indent=2)
-
-    return path
+"""Configuration loading with security best practices."""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from .alerts import AlertConfig
+
+
+@dataclass
+class ServerConfig:
+    """Configuration for a single server."""
+    name: str
+    host: str
+    user: str
+    port: int = 22
+    key_path: Optional[str] = None
+    key_passphrase: Optional[str] = None
+
+    def __post_init__(self):
+        # Expand user home directory in key path
+        if self.key_path:
+            self.key_path = os.path.expanduser(self.key_path)
+
+
+@dataclass
+class CollectorConfig:
+    """Main collector configuration."""
+    servers: List[ServerConfig] = field(default_factory=list)
+    output_file: str = "./docs/data/status.json"
+    timeout: int = 30
+    ssh_key_path: Optional[str] = None
+    ssh_key_passphrase: Optional[str] = None
+    precompress: List[str] = field(default_factory=list)  # "gz" / "br" siblings of the output files
+    json_backend: Optional[str] = None  # "auto", "orjson" or "json"; None keeps the default
+    delta_patches: int = 120  # patches kept in the delta feed; 0 disables it
+    series_points: Union[int, Dict[str, int]] = 300  # chart points per line, or per range; 0 disables series
+    alerts: Optional["AlertConfig"] = None  # "alerts" block; None disables alerting
+
+    def __post_init__(self):
+        if self.ssh_key_path:
+            self.ssh_key_path = os.path.expanduser(self.ssh_key_path)
+
+
+def get_config_paths() -> List[Path]:
+    """Get list of possible config file paths in order of priority."""
+    paths = []
+
+    # 1. Environment variable
+    env_path = os.environ.get('GPU_MONITOR_CONFIG')
+    if env_path:
+        paths.append(Path(env_path))
+
+    # 2. User config directory
+    paths.append(Path.home() / '.config' / 'gpu-monitor' / 'servers.json')
+
+    # 3. Current directory (for development)
+    paths.append(Path('./servers.json'))
+
+    # 4. Legacy location (for migration)
+    paths.append(Path('./gpu_servers.json'))
+
+    return paths
+
+
+def find_config_path() -> Optional[Path]:
+    """Return the config file load_config() would read, or None."""
+    for path in get_config_paths():
+        if path.exists():
+            return path
+    return None
+
+
+def load_config(path: Optional[Path] = None) -> CollectorConfig:
+    """
+    Load configuration from file or environment variables.
+
+    Priority (unless path is given):
+    1. Environment variable GPU_MONITOR_CONFIG (path to config file)
+    2. ~/.config/gpu-monitor/servers.json
+    3. ./servers.json
+    4. ./gpu_servers.json (legacy)
+
+    SSH credentials:
+    - SSH_KEY_PATH: Path to SSH private key
+    - SSH_KEY_PASSPHRASE: Passphrase for SSH key (optional)
+
+    Args:
+        path: Config file to read instead of searching the paths above
+
+    Returns:
+        CollectorConfig object
+
+    Raises:
+        FileNotFoundError: If no config file is found
+        ValueError: If the file has the wrong shape or a setting has an invalid value
+    """
+    config_data = None
+    config_path = path or find_config_path()
+
+    if config_path is not None and config_path.exists():
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+
+    if config_data is None:
+        raise FileNotFoundError(
+            "No configuration file found. Please create one at:\n"
+            "  ~/.config/gpu-monitor/servers.json\n"
+            "Or set GPU_MONITOR_CONFIG environment variable."
+        )
+    if not isinstance(config_data, dict):
+        raise ValueError(f"Expected a JSON object in {config_path}, got {type(config_data).__name__}")
+
+    # Get SSH key settings from environment or config
+    ssh_key_path = os.environ.get('SSH_KEY_PATH') or config_data.get('ssh_key_path', '~/.ssh/id_ed25519')
+    ssh_key_passphrase = os.environ.get('SSH_KEY_PASSPHRASE') or config_data.get('ssh_key_passphrase')
+
+    # Parse servers
+    servers = []
+    servers_data = config_data.get('servers', [])
+    if not isinstance(servers_data, list):
+        raise ValueError(f"servers must be a list in {config_path}")
+    for server_data in servers_data:
+        if not isinstance(server_data, dict):
+            raise ValueError(f"Server entry {server_data!r} is not an object in {config_path}")
+        if 'host' not in server_data:
+            raise ValueError(f"Server {server_data.get('name', '?')!r} has no host in {config_path}")
+        server = ServerConfig(
+            name=server_data.get('name', server_data.get('host')),
+            host=server_data['host'],
+            user=server_data.get('user', 'root'),
+            port=server_data.get('port', 22),
+            key_path=server_data.get('key_file') or ssh_key_path,
+            key_passphrase=server_data.get('passphrase') or ssh_key_passphrase,
+        )
+        servers.append(server)
+
+    precompress = config_data.get('precompress', [])
+    for fmt in precompress:
+        if fmt not in ('gz', 'br'):
+            raise ValueError(f"Invalid precompress format {fmt!r} in {config_path} (expected 'gz' or 'br')")
+
+    json_backend = config_data.get('json_backend')
+    if json_backend not in (None, 'auto', 'orjson', 'json'):
+        raise ValueError(f"Invalid json_backend {json_backend!r} in {config_path}")
+
+    delta_patches = config_data.get('delta_patches', 120)
+    if not isinstance(delta_patches, int) or delta_patches < 0:
+        raise ValueError(f"Invalid delta_patches {delta_patches!r} in {config_path} (expected an integer >= 0)")
+
+    series_points = config_data.get('series_points', 300)
+    budgets = series_points.values() if isinstance(series_points, dict) else [series_points]
+    if not all(isinstance(p, int) and (p == 0 or p >= 3) for p in budgets):
+        raise ValueError(f"Invalid series_points {series_points!r} in {config_path} (expected 0 or an integer >= 3)")
+    if isinstance(series_points, dict):
+        from .downsample import RANGES
+        for range_name in series_points:
+            if range_name not in RANGES:
+                raise ValueError(f"Unknown series_points range {range_name!r} in {config_path} "
+                                 f"(expected one of {', '.join(RANGES)})")
+
+    alerts = None
+    if config_data.get('alerts'):
+        from .alerts import parse_alert_config
+        try:
+            alerts = parse_alert_config(config_data['alerts'])
+        except ValueError as e:
+            raise ValueError(f"{e} in {config_path}")
+
+    return CollectorConfig(
+        servers=servers,
+        output_file=config_data.get('output_file', './docs/data/status.json'),
+        timeout=config_data.get('timeout', 30),
+        ssh_key_path=ssh_key_path,
+        ssh_key_passphrase=ssh_key_passphrase,
+        precompress=precompress,
+        json_backend=json_backend,
+        delta_patches=delta_patches,
+        series_points=series_points,
+        alerts=alerts,
+    )
+
+
+def connection_key(server: ServerConfig) -> tuple:
+    """The settings an open SSH connection to server depends on."""
+    return (server.host, server.port, server.user, server.key_path, server.key_passphrase)
+
+
+@dataclass
+class ServerChanges:
+    """Servers added, removed and changed between two configs, by name."""
+    added: List[ServerConfig] = field(default_factory=list)
+    removed: List[ServerConfig] = field(default_factory=list)
+    changed: List[ServerConfig] = field(default_factory=list)  # new settings
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> str:
+        parts = [f"{label} {', '.join(s.name for s in servers)}"
+                 for label, servers in (("added", self.added), ("removed", self.removed), ("changed", self.changed))
+                 if servers]
+        return "; ".join(parts) or "no server changes"
+
+
+def diff_servers(old: List[ServerConfig], new: List[ServerConfig]) -> ServerChanges:
+    """
+    Compare two server lists by name. A server is changed when a setting
+    its connection depends on (host, port, user, key) differs.
+    """
+    old_by_name = {server.name: server for server in old}
+    new_by_name = {server.name: server for server in new}
+
+    changes = ServerChanges()
+    for name, server in new_by_name.items():
+        if name not in old_by_name:
+            changes.added.append(server)
+        elif connection_key(server) != connection_key(old_by_name[name]):
+            changes.changed.append(server)
+    changes.removed = [server for name, server in old_by_name.items() if name not in new_by_name]
+    return changes
+
+
+class ConfigWatcher:
+    """
+    Reload the config file when it changes, for long-running collectors.
+
+    poll() only stats the config paths, so it can run every cycle. A file
+    that fails to load or validate is reported once and the last good
+    config stays in use until the file changes again.
+    """
+
+    def __init__(self, config: CollectorConfig, path: Optional[Path] = None):
+        self.config = config
+        self.path = path or find_config_path()
+        self._signature = self._stat(self.path)
+
+    @staticmethod
+    def _stat(path: Optional[Path]) -> Optional[tuple]:
+        try:
+            st = path.stat() if path is not None else None
+        except OSError:
+            return None
+        return (str(path), st.st_mtime_ns, st.st_size) if st else None
+
+    def poll(self) -> Optional[CollectorConfig]:
+        """
+        Returns:
+            The new config if the file changed and loaded, else None
+
+        Raises:
+            ValueError: If the changed file is invalid (reported once per
+                change; self.config keeps the last good config)
+        """
+        # The env var or a higher-priority file may point elsewhere now
+        path = find_config_path()
+        signature = self._stat(path)
+        if signature == self._signature:
+            return None
+        self._signature = signature
+
+        try:
+            config = load_config(path)
+        except (FileNotFoundError, ValueError, OSError) as e:
+            raise ValueError(f"Config reload failed, keeping the last good config: {e}")
+
+        self.path = path
+        self.config = config
+        return config
+
+
+def create_example_config(path: Optional[Path] = None) -> Path:
+    """Create an example configuration file."""
+    if path is None:
+        path = Path.home() / '.config' / 'gpu-monitor' / 'servers.json'
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    example_config = {
+        "servers": [
+            {
+                "name": "Server-1",
+                "host": "192.168.1.100",
+                "user": "username",
+                "port": 22
+            }
+        ],
+        "output_file": "./docs/data/status.json",
+        "timeout": 30,
+        "_comment": "SSH key is read from SSH_KEY_PATH environment variable or ~/.ssh/id_ed25519"
+    }
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(example_config, f, indent=2)
+
+    return path
@@ -0,0 +1,251 @@
+"""
+Per-cycle patch feed for status.json consumers.
+
+Every cycle gets a sequence number (the "seq" field of status.json) and a
+patch against the previous snapshot is written to delta/patch-<seq>.json
+next to the status file. delta/index.json lists the patches still on
+disk, so a client at seq N fetches patches N+1..latest instead of the full
+file, and falls back to status.json when N is no longer covered.
+
+A patch is a list of operations on paths. Path segments are object keys,
+except inside the lists named in KEYED_LISTS, where a segment is the
+key field of an element (a server name, a GPU index, a mount point):
+
+    {"op": "set", "path": ["servers", "node1", "gpus", 0, "utilization_percent"], "value": 87}
+    {"op": "del", "path": ["servers", "node2"]}
+    {"op": "order", "path": ["servers"], "keys": ["node1", "node3"]}
+
+"set" on a keyed list element that does not exist appends it; "order"
+follows the sets and deletes of a list when its element order changed.
+Other lists (e.g. GPU processes) are replaced as a whole.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .jsonio import load_file, save_json
+
+# List field name -> element field that identifies an element
+KEYED_LISTS = {
+    "servers": "name",
+    "gpus": "index",
+    "disks": "mount_point",
+}
+
+# Top-level fields that are not part of the patched document
+IGNORED_FIELDS = ("collector_stats", "seq")
+
+
+def _index_list(items: List[Any], key_field: str) -> Optional[Dict[Any, Any]]:
+    """Map key -> element, or None if the list cannot be keyed (missing or duplicate keys)."""
+    indexed = {}
+    for item in items:
+        if not isinstance(item, dict) or key_field not in item:
+            return None
+        key = item[key_field]
+        if key in indexed:
+            return None
+        indexed[key] = item
+    return indexed
+
+
+def _diff_value(old: Any, new: Any, path: List[Any], field: Optional[str], ops: List[Dict[str, Any]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        _diff_dict(old, new, path, ops)
+        return
+
+    if isinstance(old, list) and isinstance(new, list) and field in KEYED_LISTS:
+        old_items = _index_list(old, KEYED_LISTS[field])
+        new_items = _index_list(new, KEYED_LISTS[field])
+        if old_items is not None and new_items is not None:
+            _diff_keyed_list(old_items, new_items, path, ops)
+            return
+
+    if old != new:
+        ops.append({"op": "set", "path": path, "value": new})
+
+
+def _diff_dict(old: Dict[str, Any], new: Dict[str, Any], path: List[Any], ops: List[Dict[str, Any]]) -> None:
+    for key, value in new.items():
+        if key in old:
+            _diff_value(old[key], value, path + [key], key, ops)
+        else:
+            ops.append({"op": "set", "path": path + [key], "value": value})
+
+    for key in old:
+        if key not in new:
+            ops.append({"op": "del", "path": path + [key]})
+
+
+def _diff_keyed_list(
+    old: Dict[Any, Any],
+    new: Dict[Any, Any],
+    path: List[Any],
+    ops: List[Dict[str, Any]],
+) -> None:
+    for key, item in new.items():
+        if key in old:
+            _diff_value(old[key], item, path + [key], None, ops)
+        else:
+            ops.append({"op": "set", "path": path + [key], "value": item})
+
+    for key in old:
+        if key not in new:
+            ops.append({"op": "del", "path": path + [key]})
+
+    # Order a client ends up with: survivors in old order, then appended elements
+    applied_order = [key for key in old if key in new] + [key for key in new if key not in old]
+    if applied_order != list(new):
+        ops.append({"op": "order", "path": path, "keys": list(new)})
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compute the patch operations that turn snapshot old into snapshot new.
+
+    Args:
+        old: Previous status snapshot
+        new: Current status snapshot
+
+    Returns:
+        List of set/del/order operations (empty if nothing changed)
+    """
+    ops: List[Dict[str, Any]] = []
+    _diff_dict(_strip(old), _strip(new), [], ops)
+    return ops
+
+
+def apply_patch(doc: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply patch operations to a snapshot in place and return it.
+    This is the reference for the client side in docs/index.html.
+    """
+    for op in ops:
+        path = op["path"]
+        parent_path = path if op["op"] == "order" else path[:-1]
+
+        node, field = doc, None
+        for segment in parent_path:
+            node = _child(node, segment, field)
+            field = segment
+
+        if op["op"] == "order":
+            key_field = KEYED_LISTS[field]
+            by_key = {item[key_field]: item for item in node}
+            node[:] = [by_key[key] for key in op["keys"]]
+            continue
+
+        last = path[-1]
+        if isinstance(node, list):
+            key_field = KEYED_LISTS[field]
+            position = next((i for i, item in enumerate(node) if item.get(key_field) == last), None)
+            if op["op"] == "del":
+                if position is not None:
+                    del node[position]
+            elif position is None:
+                node.append(op["value"])
+            else:
+                node[position] = op["value"]
+        elif op["op"] == "del":
+            node.pop(last, None)
+        else:
+            node[last] = op["value"]
+
+    return doc
+
+
+def _child(node: Any, segment: Any, field: Optional[str]) -> Any:
+    if isinstance(node, list):
+        key_field = KEYED_LISTS[field]
+        return next(item for item in node if item.get(key_field) == segment)
+    return node[segment]
+
+
+def _strip(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in snapshot.items() if k not in IGNORED_FIELDS}
+
+
+def _patch_seq(path: Path) -> Optional[int]:
+    """Sequence number from a patch-<seq>.json[.gz|.br] file name."""
+    stem = path.name.split(".", 1)[0]
+    try:
+        return int(stem[len("patch-"):])
+    except ValueError:
+        return None
+
+
+def save_delta(
+    data: Dict[str, Any],
+    output_file: str,
+    max_patches: int = 120,
+    verbose: bool = False,
+) -> int:
+    """
+    Write the patch from the current status.json to data and update the index.
+
+    Must run before data is written to output_file. The previous snapshot is
+    read back from output_file; if it is missing, has no seq, or does not
+    match the index, the patch chain restarts and clients reload the full
+    file. Default max_patches=120 keeps ~2 hours at 1-minute intervals.
+
+    Returns:
+        Sequence number for data (to be stored as its "seq" field)
+    """
+    output_path = Path(output_file)
+    delta_dir = output_path.parent / "delta"
+    index_path = delta_dir / "index.json"
+
+    previous, index = None, None
+    if output_path.exists():
+        try:
+            previous = load_file(output_path)
+        except (ValueError, IOError):
+            previous = None
+    if index_path.exists():
+        try:
+            index = load_file(index_path)
+        except (ValueError, IOError):
+            index = None
+
+    previous_seq = previous.get("seq") if isinstance(previous, dict) else None
+    index_seq = index.get("seq") if isinstance(index, dict) else None
+
+    # Never reuse a sequence number, even when the chain restarts
+    seq = max(previous_seq or 0, index_seq or 0) + 1
+
+    patches: List[int] = []
+    if previous_seq is not None and previous_seq == index_seq:
+        patches = list(index.get("patches", []))
+        ops = diff(previous, data)
+        save_json(delta_dir / f"patch-{seq}.json", {
+            "seq": seq,
+            "from_seq": previous_seq,
+            "timestamp": data.get("timestamp"),
+            "ops": ops,
+        })
+        patches.append(seq)
+        if verbose:
+            print(f"Delta patch {seq} saved ({len(ops)} operations)")
+    elif verbose:
+        print(f"Delta feed restarted at seq {seq}")
+
+    patches = patches[-max_patches:]
+
+    save_json(index_path, {
+        "seq": seq,
+        "timestamp": data.get("timestamp"),
+        "patches": patches,
+        "keys": KEYED_LISTS,
+    })
+
+    # Drop expired patches and any left over from a restarted chain
+    keep = set(patches)
+    for patch_path in delta_dir.glob("patch-*.json*"):
+        patch_seq = _patch_seq(patch_path)
+        if patch_seq is not None and patch_seq not in keep:
+            try:
+                patch_path.unlink()
+            except OSError:
+                pass
+
+    return seq
@@ -0,0 +1,232 @@
+"""
+Downsampled chart series for the history page.
+
+history.json holds one snapshot per minute, so a 7-day chart has ~10k
+points per line. export_series() cuts each chart line of each range down
+to a point budget with Largest-Triangle-Three-Buckets (LTTB), which keeps
+the shape and the spikes of a line, and writes one file per range:
+
+    docs/data/series/<range>.json
+    {
+      "range": "24h", "points": 300, "generated_at": "...",
+      "server_names": ["<server>", ...],
+      "servers": {
+        "<server>": {
+          "gpus": [{"index": 0, "name": "..."}],
+          "cpu": [[<epoch ms>, <value>], ...], "memory": [...], "disk": [...],
+          "gpu": {"0": {"utilization": [...], "temperature": [...], "memory": [...]}}
+        }
+      }
+    }
+
+The disk line is the root filesystem, or the first disk if there is none.
+server_names lists every server in history, like the page's server picker
+did, while servers only holds those online during the range.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .jsonio import load_file, save_json
+from .stats import CollectorStats
+
+Point = Tuple[int, float]
+
+# Range name -> seconds; the names match the range buttons of history.html
+RANGES = {
+    "1h": 3600,
+    "6h": 6 * 3600,
+    "24h": 24 * 3600,
+    "7d": 7 * 24 * 3600,
+}
+
+DEFAULT_POINTS = 300
+
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point and, from each of threshold - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket.
+
+    Args:
+        points: (x, y) points sorted by x
+        threshold: Number of points to keep
+
+    Returns:
+        The kept points (all of them if there are no more than threshold)
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        count = avg_end - avg_start
+        avg_x = sum(p[0] for p in points[avg_start:avg_end]) / count
+        avg_y = sum(p[1] for p in points[avg_start:avg_end]) / count
+
+        ax, ay = points[a]
+        max_area = -1.0
+        next_a = start = int(i * every) + 1
+        for j in range(start, int((i + 1) * every) + 1):
+            x, y = points[j]
+            # Twice the triangle area; the factor does not change the argmax
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        sampled.append(points[next_a])
+        a = next_a
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def _root_disk_usage(server: Dict[str, Any]) -> Optional[float]:
+    disks = (server.get("system") or {}).get("disks") or []
+    disk = next((d for d in disks if d.get("mount_point") == "/"), disks[0] if disks else None)
+    return disk.get("usage_percent") if disk else None
+
+
+def _server_lines(history: List[Dict[str, Any]], since: float) -> Dict[str, Dict[str, Any]]:
+    """Raw (epoch ms, value) lines per server for snapshots after since."""
+    servers: Dict[str, Dict[str, Any]] = {}
+
+    for snapshot in history:
+        timestamp = datetime.fromisoformat(snapshot["timestamp"]).timestamp()
+        if timestamp <= since:
+            continue
+        t = int(timestamp * 1000)
+
+        for server in snapshot.get("servers", []):
+            if server.get("status") != "online":
+                continue
+            lines = servers.setdefault(server["name"], {"gpus": {}, "cpu": [], "memory": [], "disk": [], "gpu": {}})
+            system = server.get("system") or {}
+
+            for name, value in (
+                ("cpu", (system.get("cpu") or {}).get("usage_percent")),
+                ("memory", (system.get("memory") or {}).get("usage_percent")),
+                ("disk", _root_disk_usage(server)),
+            ):
+                if value is not None:
+                    lines[name].append((t, value))
+
+            for gpu in server.get("gpus", []):
+                index = str(gpu["index"])
+                # Latest snapshot wins, so the chart titles show current names
+                lines["gpus"][index] = {"index": gpu["index"], "name": gpu.get("name")}
+                gpu_lines = lines["gpu"].setdefault(index, {"utilization": [], "temperature": [], "memory": []})
+                for name, value in (
+                    ("utilization", gpu.get("utilization_percent")),
+                    ("temperature", gpu.get("temperature_celsius")),
+                    ("memory", (gpu.get("memory") or {}).get("usage_percent")),
+                ):
+                    if value is not None:
+                        gpu_lines[name].append((t, value))
+
+    return servers
+
+
+def _downsample(line: List[Point], points: int) -> List[List[float]]:
+    return [[t, round(v, 1)] for t, v in lttb(line, points)]
+
+
+def build_series(history: List[Dict[str, Any]], range_name: str, points: int = DEFAULT_POINTS) -> Dict[str, Any]:
+    """
+    Build the downsampled series of one range from history.
+
+    Args:
+        history: Snapshots in time order
+        range_name: One of RANGES; the range ends at the last snapshot
+        points: Point budget per chart line
+
+    Returns:
+        Series document for data/series/<range>.json
+    """
+    end = datetime.fromisoformat(history[-1]["timestamp"]).timestamp() if history else 0
+    lines = _server_lines(history, end - RANGES[range_name])
+
+    servers = {}
+    for name, server in lines.items():
+        servers[name] = {
+            "gpus": sorted(server["gpus"].values(), key=lambda g: g["index"]),
+            "cpu": _downsample(server["cpu"], points),
+            "memory": _downsample(server["memory"], points),
+            "disk": _downsample(server["disk"], points),
+            "gpu": {
+                index: {metric: _downsample(line, points) for metric, line in gpu_lines.items()}
+                for index, gpu_lines in server["gpu"].items()
+            },
+        }
+
+    return {
+        "range": range_name,
+        "points": points,
+        "generated_at": history[-1]["timestamp"] if history else None,
+        "server_names": list(dict.fromkeys(s["name"] for snapshot in history for s in snapshot.get("servers", []))),
+        "servers": servers,
+    }
+
+
+def export_series(
+    history: List[Dict[str, Any]],
+    output_file: str,
+    points: Union[int, Dict[str, int]] = DEFAULT_POINTS,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    precompress: Sequence[str] = (),
+) -> None:
+    """
+    Write data/series/<range>.json for every range next to the status file.
+
+    A range is only rebuilt once its previous file is older than one LTTB
+    bucket (range / points, e.g. ~34 minutes for 7 days at 300 points):
+    sooner, the chart would barely change, and rebuilding the long ranges
+    every minute would cost more than the rest of the cycle.
+
+    Args:
+        history: Snapshots in time order (as just written to history.json)
+        output_file: Status file path
+        points: Point budget, for all ranges or per range name; 0 skips
+            a range
+    """
+    if stats is None:
+        stats = CollectorStats()
+    if not history:
+        return
+
+    series_dir = Path(output_file).parent / "series"
+    now = datetime.fromisoformat(history[-1]["timestamp"]).timestamp()
+
+    for range_name, seconds in RANGES.items():
+        budget = points.get(range_name, DEFAULT_POINTS) if isinstance(points, dict) else points
+        if not budget:
+            continue
+        path = series_dir / f"{range_name}.json"
+
+        if path.exists():
+            try:
+                previous = load_file(path)
+                age = now - datetime.fromisoformat(previous["generated_at"]).timestamp()
+                if previous.get("points") == budget and 0 <= age < seconds / budget:
+                    continue
+            except (ValueError, IOError, KeyError, TypeError):
+                pass
+
+        with stats.phase(f"series_{range_name}"):
+            size = save_json(path, build_series(history, range_name, budget), precompress=precompress)
+        stats.record_bytes(f"series_{range_name}", size)
+
+        if verbose:
+            print(f"Series {range_name} saved ({size / 1024:.1f} KiB)")
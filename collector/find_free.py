@@ -0,0 +1,161 @@
+"""
+Find servers with enough free GPUs, from the availability index.
+
+    python -m collector.find_free --gpus 4 --min-vram 40G
+    python -m collector.find_free --gpus 2 --model H100 --json
+
+Reads availability.json (see collector/availability.py) only, so it
+answers instantly regardless of fleet size.
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .jsonio import load_file
+
+_SIZE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$', re.IGNORECASE)
+_UNIT_MB = {'K': 1 / 1024, 'M': 1, 'G': 1024, 'T': 1024 * 1024}
+
+# Warn when the index is older than this (the collector stopped)
+STALE_SECONDS = 600
+
+
+def parse_size_mb(value: str) -> float:
+    """
+    Parse a VRAM size such as "40G", "40GB", "24576M" into MiB.
+    A bare number is taken as GiB.
+
+    Raises:
+        ValueError: If the value is not a size
+    """
+    match = _SIZE.match(value)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    number, unit = match.groups()
+    return float(number) * _UNIT_MB[unit.upper() or 'G']
+
+
+def find_free(
+    index: Dict[str, Any],
+    gpus: int = 1,
+    min_vram_mb: float = 0,
+    model: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List servers that have at least `gpus` free GPUs of one model with at
+    least min_vram_mb free each.
+
+    Args:
+        index: Availability index
+        gpus: GPUs needed on a single server
+        min_vram_mb: Free VRAM needed per GPU, in MiB
+        model: Case-insensitive substring of the GPU model name
+
+    Returns:
+        One entry per (server, model) with the GPUs to use (most free VRAM
+        first), best candidates first
+
+    Raises:
+        ValueError: If gpus is less than 1
+    """
+    if gpus < 1:
+        raise ValueError(f"gpus must be at least 1, got {gpus}")
+    candidates: Dict[tuple, List[Dict[str, Any]]] = {}
+    for model_name, entries in index.get("models", {}).items():
+        if model and model.lower() not in model_name.lower():
+            continue
+        # Entries are sorted by free VRAM, so each server's list stays sorted
+        for entry in entries:
+            if entry["free_mb"] >= min_vram_mb:
+                candidates.setdefault((entry["server"], model_name), []).append(entry)
+
+    matches = []
+    for (server, model_name), entries in candidates.items():
+        if len(entries) < gpus:
+            continue
+        chosen = entries[:gpus]
+        matches.append({
+            "server": server,
+            "model": model_name,
+            "free_gpus": len(entries),
+            "gpus": sorted(entry["index"] for entry in chosen),
+            "min_free_mb": min(entry["free_mb"] for entry in chosen),
+            # The most recently freed GPU bounds how long the set has been idle
+            "idle_since": max(entry["idle_since"] for entry in chosen),
+        })
+
+    return sorted(matches, key=lambda m: (-m["min_free_mb"], m["idle_since"]))
+
+
+def _format_idle(since: str, now: datetime) -> str:
+    seconds = max(0, int((now - datetime.fromisoformat(since)).total_seconds()))
+    if seconds >= 86400:
+        return f"{seconds // 86400}d{seconds % 86400 // 3600}h"
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}m"
+
+
+def _default_index_path() -> Path:
+    from .config import load_config
+    try:
+        output_file = load_config().output_file
+    except (FileNotFoundError, ValueError):
+        output_file = "./docs/data/status.json"
+    return Path(output_file).parent / "availability.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find servers with free GPUs")
+    parser.add_argument('--gpus', type=int, default=1, help='GPUs needed on one server (default: 1)')
+    parser.add_argument('--min-vram', default='0', help='Free VRAM per GPU, e.g. 40G or 24576M (default: any)')
+    parser.add_argument('--model', help='GPU model substring, e.g. H100')
+    parser.add_argument('--file', help='availability.json (default: next to the configured status file)')
+    parser.add_argument('--json', action='store_true', help='Print matches as JSON')
+    args = parser.parse_args()
+    if args.gpus < 1:
+        parser.error(f"--gpus must be at least 1, got {args.gpus}")
+
+    try:
+        min_vram_mb = parse_size_mb(args.min_vram)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    path = Path(args.file) if args.file else _default_index_path()
+    try:
+        index = load_file(path)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot read availability index {path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    matches = find_free(index, gpus=args.gpus, min_vram_mb=min_vram_mb, model=args.model)
+
+    if args.json:
+        print(json.dumps(matches, indent=2, ensure_ascii=False))
+        sys.exit(0 if matches else 1)
+
+    now = datetime.now().astimezone()
+    age = (now - datetime.fromisoformat(index["timestamp"])).total_seconds()
+    if age > STALE_SECONDS:
+        print(f"Warning: availability index is {age / 60:.0f} minutes old", file=sys.stderr)
+
+    if not matches:
+        print(f"No server has {args.gpus} free GPU(s) with {args.min_vram} free VRAM")
+        sys.exit(1)
+
+    for match in matches:
+        gpu_list = ",".join(str(i) for i in match["gpus"])
+        print(f"{match['server']}  {match['model']}  "
+              f"{match['free_gpus']} free, GPUs {gpu_list}  "
+              f"min free {match['min_free_mb'] / 1024:.1f} GiB  "
+              f"idle {_format_idle(match['idle_since'], now)}")
+
+
+if __name__ == "__main__":
+    main()
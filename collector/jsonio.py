@@ -0,0 +1,203 @@
+"""JSON serialization backends and atomic file output."""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+# Backend used by dumps()/loads(); resolved on first use, see use_backend()
+_backend: Optional["JSONBackend"] = None
+_backend_name = os.environ.get('GPU_MONITOR_JSON_BACKEND', 'auto')
+
+PRECOMPRESS_FORMATS = ('gz', 'br')
+
+
+class JSONBackend:
+    """Standard library json; always available."""
+    name = "json"
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+        return text.encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """orjson: several times faster, emits UTF-8 bytes directly."""
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_INDENT_2 if indent else 0)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+def use_backend(name: str = "auto") -> JSONBackend:
+    """
+    Select the serializer: "orjson", "json", or "auto" (orjson when
+    installed). The GPU_MONITOR_JSON_BACKEND environment variable sets
+    the initial choice.
+    """
+    global _backend, _backend_name
+
+    if name not in ("auto", "orjson", "json"):
+        raise ValueError(f"Unknown JSON backend: {name}")
+
+    if name == "json":
+        backend = JSONBackend()
+    else:
+        try:
+            backend = OrjsonBackend()
+        except ImportError:
+            if name == "orjson":
+                raise
+            backend = JSONBackend()
+
+    _backend, _backend_name = backend, name
+    return backend
+
+
+def get_backend() -> JSONBackend:
+    if _backend is None:
+        return use_backend(_backend_name)
+    return _backend
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the selected backend."""
+    return get_backend().dumps(obj, indent=indent)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    return get_backend().loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """
+    Yield the elements of a file holding one JSON array, reading it in
+    chunks, so memory is bounded by the largest element rather than the
+    file (e.g. to stream a multi-week history.json).
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer, pos, eof = "", 0, False
+
+        def skip(chars: str) -> None:
+            nonlocal buffer, pos, eof
+            while True:
+                while pos < len(buffer) and buffer[pos] in chars:
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    return
+                buffer, pos = f.read(chunk_size), 0
+                eof = not buffer
+
+        skip(" \t\r\n")
+        if buffer[pos:pos + 1] != '[':
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos += 1
+
+        while True:
+            skip(" \t\r\n,")
+            if pos >= len(buffer):
+                raise ValueError(f"{path}: unterminated JSON array")
+            if buffer[pos] == ']':
+                return
+
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A value ending at the buffer end may continue in the next chunk
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+
+            if complete:
+                yield value
+                pos = end
+                continue
+
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+
+
+def compress(data: bytes, fmt: str) -> Optional[bytes]:
+    """Compress for a precompressed sibling; None if the codec is unavailable."""
+    if fmt == 'gz':
+        # mtime=0 keeps the output byte-identical for identical input
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if fmt == 'br':
+        try:
+            import brotli
+        except ImportError:
+            return None
+        return brotli.compress(data)
+    raise ValueError(f"Unknown precompress format: {fmt}")
+
+
+def write_atomic(path: Path, data: bytes) -> int:
+    """
+    Write bytes to a temporary file next to path and rename it into place,
+    so readers never see a partially written file. Returns the byte count.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    return len(data)
+
+
+def save_json(path: Path, obj: Any, indent: bool = False, precompress: Iterable[str] = ()) -> int:
+    """
+    Serialize obj and write it atomically, plus optional precompressed
+    siblings (path.gz / path.br) for static hosting.
+
+    Returns:
+        Size in bytes of the uncompressed JSON
+    """
+    path = Path(path)
+    data = dumps(obj, indent=indent)
+    size = write_atomic(path, data)
+
+    for fmt in precompress:
+        compressed = compress(data, fmt)
+        if compressed is not None:
+            write_atomic(path.with_name(f"{path.name}.{fmt}"), compressed)
+
+    return size
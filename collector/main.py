@@ -1,259 +1,541 @@
-#!/usr/bin/env python3
-"""
-GPU/CPU Monitor Collector - Main Entry Point
-
-Collects system and GPU metrics from multiple servers via SSH
-and outputs structured JSON data.
-"""
-
-import argparse
-import asyncio
-import json
-import os
-import sys
-from dataclasses import asdict
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List
-
-from . import __version__
-from .config import load_config, CollectorConfig
-from .ssh_client import SSHCollector, CollectionResult
-from .parsers import (
-    parse_cpu,
-    parse_memory,
-    parse_disk,
-    parse_gpus,
-    build_process_map,
-)
-
-
-def process_result(result: CollectionResult) -> Dict[str, Any]:
-    """Process a collection result into structured data."""
-    server_data = {
-        "name": result.server_name,
-        "host": result.host,
-        "status": "online" if result.success else "offline",
-        "error_message": result.error,
-        "collected_at": result.collected_at.isoformat() if result.collected_at else None,
-    }
-
-    if not result.success:
-        return server_data
-
-    sections = result.sections
-
-    # Parse hostname
-    server_data["hostname"] = sections.get("HOSTNAME", "").strip() or result.host
-
-    # Parse system metrics
-    cpu_metrics = parse_cpu(
-        sections.get("CPU_STAT", ""),
-        sections.get("CPU_INFO", "1"),
-    )
-
-    memory_metrics = parse_memory(sections.get("MEMORY", ""))
-    disk_metrics = parse_disk(sections.get("DISK", ""))
-
-    server_data["system"] = {
-        "cpu": {
-            "usage_percent": cpu_metrics.usage_percent if cpu_metrics else 0,
-            "cores": cpu_metrics.cores if cpu_metrics else 0,
-        },
-        "memory": {
-            "total_bytes": memory_metrics.total_bytes if memory_metrics else 0,
-            "available_bytes": memory_metrics.available_bytes if memory_metrics else 0,
-            "used_bytes": memory_metrics.used_bytes if memory_metrics else 0,
-            "usage_percent": memory_metrics.usage_percent if memory_metrics else 0,
-        },
-        "disks": [
-            {
-                "device": disk.device,
-                "mount_point": disk.mount_point,
-                "total_bytes": disk.total_bytes,
-                "used_bytes": disk.used_bytes,
-                "available_bytes": disk.available_bytes,
-                "usage_percent": disk.usage_percent,
-            }
-            for disk in disk_metrics
-        ],
-    }
-
-    # Parse GPU metrics
-    process_map = build_process_map(sections.get("ALL_PROCESSES", ""))
-    gpu_metrics = parse_gpus(
-        sections.get("GPU_INFO", "NO_GPU"),
-        sections.get("GPU_PROCESSES", "NO_PROCESSES"),
-        process_map,
-    )
-
-    server_data["gpus"] = [
-        {
-            "index": gpu.index,
-            "name": gpu.name,
-            "uuid": gpu.uuid,
-            "temperature_celsius": gpu.temperature_celsius,
-            "utilization_percent": gpu.utilization_percent,
-            "memory": {
-                "used_mb": gpu.memory.used_mb,
-                "total_mb": gpu.memory.total_mb,
-                "usage_percent": gpu.memory.usage_percent,
-            },
-            "driver_version": gpu.driver_version,
-            "processes": [
-                {
-                    "pid": proc.pid,
-                    "user": proc.user,
-                    "command": proc.command,
-                    "gpu_memory_mb": proc.gpu_memory_mb,
-                }
-                for proc in gpu.processes
-            ],
-        }
-        for gpu in gpu_metrics
-    ]
-
-    return server_data
-
-
-def collect_and_output(config: CollectorConfig, use_async: bool = False, verbose: bool = False) -> Dict[str, Any]:
-    """Collect data from all servers and return structured output."""
-    if verbose:
-        print(f"Collecting from {len(config.servers)} servers...")
-
-    collector = SSHCollector(config.servers, timeout=config.timeout)
-
-    # Collect data
-    if use_async:
-        try:
-            results = asyncio.run(collector.collect_all_async())
-        except ImportError:
-            if verbose:
-                print("asyncssh not available, falling back to sync mode")
-            results = collector.collect_all_sync()
-    else:
-        results = collector.collect_all_sync()
-
-    # Process results
-    servers_data = []
-    for result in results:
-        if verbose:
-            status = "OK" if result.success else f"FAILED: {result.error}"
-            print(f"  {result.server_name}: {status}")
-
-        server_data = process_result(result)
-        servers_data.append(server_data)
-
-    # Build output
-    output = {
-        "timestamp": datetime.now().astimezone().isoformat(),
-        "collector_version": __version__,
-        "servers": servers_data,
-    }
-
-    return output
-
-
-def save_output(data: Dict[str, Any], output_file: str, verbose: bool = False) -> None:
-    """Save output to JSON file."""
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-    if verbose:
-        print(f"Output saved to {output_path}")
-
-
-def save_history(data: Dict[str, Any], output_file: str, max_entries: int = 10080, verbose: bool = False) -> None:
-    """
-    Save data to history file, maintaining a rolling window.
-    Default max_entries=10080 keeps ~7 days of data at 1-minute intervals.
-    """
-    # History file is next to the status file
-    output_path = Path(output_file)
-    history_path = output_path.parent / "history.json"
-
-    # Load existing history
-    history = []
-    if history_path.exists():
-        try:
-            with open(history_path, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            history = []
-
-    # Add new entry
-    history.append(data)
-
-    # Trim to max entries (keep most recent)
-    if len(history) > max_entries:
-        history = history[-max_entries:]
-
-    # Save
-    with open(history_path, 'w', encoding='utf-8') as f:
-        json.dump(history, f, ensure_ascii=False)
-
-    if verbose:
-        print(f"History saved ({len(history)} entries)")
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="GPU/CPU Monitor Collector",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output',
-    )
-    parser.add_argument(
-        '-o', '--output',
-        type=str,
-        help='Output file path (overrides config)',
-    )
-    parser.add_argument(
-        '--async',
-        dest='use_async',
-        action='store_true',
-        help='Use async SSH (requires asyncssh)',
-    )
-    parser.add_argument(
-        '--stdout',
-        action='store_true',
-        help='Print JSON to stdout instead of file',
-    )
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}',
-    )
-
-    args = parser.parse_args()
-
-    try:
-        config = load_config()
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Override output file if specified
-    if args.output:
-        config.output_file = args.output
-
-    # Collect data
-    data = collect_and_output(config, use_async=args.use_async, verbose=args.verbose)
-
-    # Output
-    if args.stdout:
-        print(json.dumps(data, indent=2, ensure_ascii=False))
-    else:
-        save_output(data, config.output_file, verbose=args.verbose)
-        # Also save to history
-        save_history(data, config.output_file, verbose=args.verbose)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+GPU/CPU Monitor Collector - Main Entry Point
+
+Collects system and GPU metrics from multiple servers via SSH
+and outputs structured JSON data.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from . import __version__
+from .config import load_config, CollectorConfig
+from .ssh_client import SSHCollector, CollectionResult, ConnectionPool
+from .jsonio import load_file, save_json, use_backend
+from .stats import CollectorStats, save_stats
+
+
+def process_result(result: CollectionResult, stats: Optional[CollectorStats] = None) -> Dict[str, Any]:
+    """Process a collection result into structured data."""
+    if stats is None:
+        return _process_result(result)
+
+    with stats.phase("parse", host=result.server_name):
+        return _process_result(result)
+
+
+def _process_result(result: CollectionResult) -> Dict[str, Any]:
+    # Parsers are imported on first use to keep the cold-start path short
+    from .parsers import (
+        parse_cpu,
+        parse_memory,
+        parse_disk,
+        parse_gpu_sections,
+        build_process_map,
+    )
+    from .schema import EMPTY_CPU, EMPTY_MEMORY, to_json
+
+    server_data = {
+        "name": result.server_name,
+        "host": result.host,
+        "status": "online" if result.success else "offline",
+        "error_message": result.error,
+        "collected_at": result.collected_at.isoformat() if result.collected_at else None,
+    }
+
+    if not result.success:
+        return server_data
+
+    sections = result.sections
+
+    # Parse hostname
+    server_data["hostname"] = sections.get("HOSTNAME", "").strip() or result.host
+
+    # Parse system metrics
+    cpu_metrics = parse_cpu(
+        sections.get("CPU_STAT", ""),
+        sections.get("CPU_INFO", "1"),
+    )
+
+    memory_metrics = parse_memory(sections.get("MEMORY", ""))
+    disk_metrics = parse_disk(sections.get("DISK", ""))
+
+    server_data["system"] = {
+        "cpu": to_json(cpu_metrics or EMPTY_CPU),
+        "memory": to_json(memory_metrics or EMPTY_MEMORY),
+        "disks": to_json(disk_metrics),
+    }
+
+    # Parse GPU metrics
+    process_map = build_process_map(sections.get("ALL_PROCESSES", ""))
+    gpu_metrics = parse_gpu_sections(sections, process_map)
+
+    server_data["gpus"] = to_json(gpu_metrics)
+
+    return server_data
+
+
+def collect_and_output(
+    config: CollectorConfig,
+    use_async: bool = False,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    capture_dir: Optional[str] = None,
+    pool: Optional[ConnectionPool] = None,
+) -> Dict[str, Any]:
+    """
+    Collect data from all servers and return structured output.
+    If capture_dir is given, the raw output of every host is archived there.
+    If pool is given, SSH connections are reused across calls.
+    """
+    if stats is None:
+        stats = CollectorStats()
+
+    if verbose:
+        print(f"Collecting from {len(config.servers)} servers...")
+
+    collector = SSHCollector(config.servers, timeout=config.timeout, pool=pool)
+
+    # Collect data
+    with stats.phase("collect"):
+        if use_async:
+            import asyncio
+            try:
+                if pool is not None:
+                    results = pool.run(collector.collect_all_async())
+                else:
+                    results = asyncio.run(collector.collect_all_async())
+            except ImportError:
+                if verbose:
+                    print("asyncssh not available, falling back to sync mode")
+                results = collector.collect_all_sync()
+        else:
+            results = collector.collect_all_sync()
+
+    if capture_dir:
+        from .capture import save_capture
+        with stats.phase("capture"):
+            save_capture(results, capture_dir, verbose=verbose)
+
+    # Process results
+    servers_data = []
+    with stats.phase("parse"):
+        for result in results:
+            if verbose:
+                status = "OK" if result.success else f"FAILED: {result.error}"
+                print(f"  {result.server_name}: {status}")
+
+            stats.add_result(result)
+            server_data = process_result(result, stats=stats)
+            servers_data.append(server_data)
+
+    # Build output
+    output = {
+        "timestamp": datetime.now().astimezone().isoformat(),
+        "collector_version": __version__,
+        "servers": servers_data,
+    }
+
+    return output
+
+
+def save_output(
+    data: Dict[str, Any],
+    output_file: str,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    precompress: Sequence[str] = (),
+) -> None:
+    """
+    Save output to JSON file.
+    The file is replaced atomically, optionally with .gz/.br siblings.
+    If stats is given, the cycle stats so far are embedded as a
+    collector_stats block and the write itself is timed.
+    """
+    output_path = Path(output_file)
+
+    if stats is not None:
+        data = dict(data, collector_stats=stats.to_dict())
+        start = time.monotonic()
+
+    size = save_json(output_path, data, indent=True, precompress=precompress)
+
+    if stats is not None:
+        stats.record("write_status", time.monotonic() - start)
+        stats.record_bytes("status", size)
+
+    if verbose:
+        print(f"Output saved to {output_path}")
+
+
+def _history_servers(servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Servers without GPU telemetry, which would grow history.json by half."""
+    return [
+        dict(server, gpus=[{k: v for k, v in gpu.items() if k != "telemetry"} for gpu in server["gpus"]])
+        if any("telemetry" in gpu for gpu in server.get("gpus", [])) else server
+        for server in servers
+    ]
+
+
+def save_history(
+    data: Dict[str, Any],
+    output_file: str,
+    max_entries: int = 10080,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    precompress: Sequence[str] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Save data to history file, maintaining a rolling window.
+    Default max_entries=10080 keeps ~7 days of data at 1-minute intervals.
+
+    Returns:
+        The saved history, for the series exporter
+    """
+    if stats is None:
+        stats = CollectorStats()
+
+    # History file is next to the status file
+    output_path = Path(output_file)
+    history_path = output_path.parent / "history.json"
+
+    # Load existing history
+    history = []
+    with stats.phase("load_history"):
+        if history_path.exists():
+            try:
+                history = load_file(history_path)
+            except (ValueError, IOError):
+                history = []
+
+    # Add new entry (collector stats go to their own rolling file, seq only
+    # matters to the delta feed, shard bookkeeping and GPU telemetry stay
+    # in status.json)
+    entry = {k: v for k, v in data.items() if k not in ("collector_stats", "seq", "shards")}
+    entry["servers"] = _history_servers(entry.get("servers", []))
+    history.append(entry)
+
+    # Trim to max entries (keep most recent)
+    if len(history) > max_entries:
+        history = history[-max_entries:]
+
+    # Save
+    with stats.phase("write_history"):
+        size = save_json(history_path, history, precompress=precompress)
+    stats.record_bytes("history", size)
+
+    if verbose:
+        print(f"History saved ({len(history)} entries)")
+
+    return history
+
+
+def replay_captures(capture_dir: str, to_stdout: bool = False) -> None:
+    """Replay a capture directory and report parse timings."""
+    from .capture import replay
+
+    stats = CollectorStats()
+    with stats.phase("replay"):
+        snapshots = replay(capture_dir, stats=stats)
+
+    if to_stdout:
+        print(json.dumps(snapshots, indent=2, ensure_ascii=False))
+        return
+
+    summary = stats.to_dict()
+    host_count = sum(len(s["servers"]) for s in snapshots)
+    split_ms = sum(h["timings"].get("split", 0) for h in summary["hosts"].values())
+    parse_ms = sum(h["timings"].get("parse", 0) for h in summary["hosts"].values())
+    print(f"Replayed {len(snapshots)} captures, {host_count} host outputs "
+          f"in {summary['phases_ms'].get('replay', 0):.1f} ms")
+    if host_count:
+        print(f"  parse_sections: {split_ms:.1f} ms total, {split_ms / host_count:.3f} ms/host")
+        print(f"  process_result: {parse_ms:.1f} ms total, {parse_ms / host_count:.3f} ms/host")
+
+
+def run_cycle(
+    config: CollectorConfig,
+    args: argparse.Namespace,
+    profiler=None,
+    pool: Optional[ConnectionPool] = None,
+) -> None:
+    """Run one collection cycle in the mode selected on the command line."""
+    if profiler is not None:
+        profiler.begin_cycle()
+
+    stats = CollectorStats(profiler=profiler)
+
+    if args.merge_shards:
+        from .sharding import merge_shards
+        with stats.phase("merge"):
+            data = merge_shards(
+                config.servers,
+                config.output_file,
+                args.shard_count,
+                max_age=args.shard_max_age,
+                verbose=args.verbose,
+            )
+    elif args.shard_id is not None:
+        from .sharding import shard_servers, save_shard
+        try:
+            config = replace(config, servers=shard_servers(config.servers, args.shard_id, args.shard_count))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        data = collect_and_output(config, use_async=args.use_async, verbose=args.verbose,
+                                  stats=stats, capture_dir=args.capture, pool=pool)
+        data["collector_stats"] = stats.to_dict()
+        if args.stdout:
+            print(json.dumps(data, indent=2, ensure_ascii=False))
+        else:
+            # Partial snapshot only; the merge step writes status and history
+            save_shard(data, config.output_file, args.shard_id, args.shard_count, verbose=args.verbose)
+        return
+    else:
+        # Collect data
+        data = collect_and_output(config, use_async=args.use_async, verbose=args.verbose,
+                                  stats=stats, capture_dir=args.capture, pool=pool)
+
+    # Output
+    if args.stdout:
+        data["collector_stats"] = stats.to_dict()
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+    else:
+        with stats.phase("save"):
+            if config.delta_patches:
+                from .delta import save_delta
+                with stats.phase("write_delta"):
+                    data["seq"] = save_delta(data, config.output_file, max_patches=config.delta_patches,
+                                             verbose=args.verbose)
+            save_output(data, config.output_file, verbose=args.verbose, stats=stats,
+                        precompress=config.precompress)
+            # Also save to history
+            history = save_history(data, config.output_file, verbose=args.verbose, stats=stats,
+                                   precompress=config.precompress)
+            if config.series_points:
+                from .downsample import export_series
+                export_series(history, config.output_file, points=config.series_points,
+                              verbose=args.verbose, stats=stats, precompress=config.precompress)
+            from .sessions import save_sessions
+            save_sessions(data, config.output_file, verbose=args.verbose, stats=stats,
+                          precompress=config.precompress)
+            from .accounting import save_accounting
+            save_accounting(data, config.output_file, verbose=args.verbose, stats=stats,
+                            precompress=config.precompress)
+            from .availability import save_availability
+            save_availability(data, config.output_file, verbose=args.verbose, stats=stats,
+                              precompress=config.precompress)
+        if config.alerts is not None:
+            from .alerts import evaluate_alerts
+            evaluate_alerts(data, config.alerts, verbose=args.verbose, stats=stats)
+        save_stats(stats, config.output_file, verbose=args.verbose)
+
+
+def apply_config(config: CollectorConfig, args: argparse.Namespace) -> CollectorConfig:
+    """
+    Apply process-wide settings of a loaded config and command-line overrides.
+
+    Raises:
+        ImportError: If the configured JSON backend is not installed
+    """
+    if config.json_backend:
+        try:
+            use_backend(config.json_backend)
+        except ImportError:
+            raise ImportError("json_backend 'orjson' requires the orjson package")
+
+    # Override output file if specified
+    if args.output:
+        config.output_file = args.output
+
+    return config
+
+
+def run_daemon(config: CollectorConfig, args: argparse.Namespace, profiler=None) -> None:
+    """
+    Run a collection cycle every args.interval seconds until interrupted.
+
+    SIGUSR1 toggles profiling on or off from the next cycle, so a running
+    collector can be profiled under real load without a restart. Profiles
+    go to --profile DIR, or ./profiles if profiling was not enabled at start.
+
+    SSH connections stay open across cycles. The config file is checked
+    before every cycle and reloaded when it changed: connections of removed
+    servers and of servers whose host, port, user or key changed are
+    closed, added servers are connected on first use, and the rest keep
+    their connections. An invalid file is reported and the last good
+    config stays in use.
+    """
+    import signal
+    from .config import ConfigWatcher, diff_servers
+
+    state = {"profiler": profiler}
+    pool = ConnectionPool()
+    watcher = ConfigWatcher(config)
+
+    def toggle_profiling(signum, frame):
+        if state["profiler"] is None:
+            from .profiling import CycleProfiler
+            state["profiler"] = CycleProfiler(args.profile or "./profiles", mode=args.profile_mode)
+            print("Profiling enabled", flush=True)
+        else:
+            state["profiler"] = None
+            print("Profiling disabled", flush=True)
+
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, toggle_profiling)
+
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                new_config = watcher.poll()
+            except ValueError as e:
+                print(e, file=sys.stderr, flush=True)
+                new_config = None
+            if new_config is not None:
+                try:
+                    new_config = apply_config(new_config, args)
+                except ImportError as e:
+                    print(f"Config reload failed, keeping the last good config: {e}", file=sys.stderr, flush=True)
+                else:
+                    changes = diff_servers(config.servers, new_config.servers)
+                    pool.reconcile(changes)
+                    config = new_config
+                    print(f"Config reloaded from {watcher.path}: {changes.summary()}", flush=True)
+
+            try:
+                run_cycle(config, args, state["profiler"], pool=pool)
+            except Exception as e:
+                # Keep the daemon alive; the next cycle retries
+                print(f"Cycle failed: {e}", file=sys.stderr, flush=True)
+
+            time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+    finally:
+        pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="GPU/CPU Monitor Collector",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Enable verbose output',
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        help='Output file path (overrides config)',
+    )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Use async SSH (requires asyncssh)',
+    )
+    parser.add_argument(
+        '--stdout',
+        action='store_true',
+        help='Print JSON to stdout instead of file',
+    )
+    parser.add_argument(
+        '--capture',
+        metavar='DIR',
+        help='Also archive the raw output of every host in DIR',
+    )
+    parser.add_argument(
+        '--replay',
+        metavar='DIR',
+        help='Replay archived outputs from DIR through the parsers (no SSH)',
+    )
+    parser.add_argument(
+        '--shard-id',
+        type=int,
+        help='Collect only the servers assigned to this shard (0-based)',
+    )
+    parser.add_argument(
+        '--shard-count',
+        type=int,
+        help='Total number of collector shards',
+    )
+    parser.add_argument(
+        '--merge-shards',
+        action='store_true',
+        help='Merge shard snapshots into the status and history files',
+    )
+    parser.add_argument(
+        '--shard-max-age',
+        type=float,
+        default=300,
+        help='Ignore shard snapshots older than this many seconds (default: 300)',
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        metavar='SECONDS',
+        help='Run continuously, collecting every SECONDS (daemon mode)',
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='DIR',
+        help='Write a profile per phase (collect, parse, save) of every cycle to DIR',
+    )
+    parser.add_argument(
+        '--profile-mode',
+        choices=['cprofile', 'sample'],
+        default='cprofile',
+        help='cprofile: .pstats files; sample: flamegraph collapsed stacks (default: cprofile)',
+    )
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'%(prog)s {__version__}',
+    )
+
+    args = parser.parse_args()
+
+    if args.replay:
+        replay_captures(args.replay, to_stdout=args.stdout)
+        return
+
+    if (args.shard_id is not None or args.merge_shards) and not args.shard_count:
+        parser.error('--shard-id and --merge-shards require --shard-count')
+    if args.shard_id is not None and args.merge_shards:
+        parser.error('--shard-id and --merge-shards are mutually exclusive')
+
+    try:
+        config = load_config()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        config = apply_config(config, args)
+    except ImportError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    profiler = None
+    if args.profile:
+        from .profiling import CycleProfiler
+        profiler = CycleProfiler(args.profile, mode=args.profile_mode)
+
+    if args.interval:
+        run_daemon(config, args, profiler)
+    else:
+        run_cycle(config, args, profiler)
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,32 @@
-"""Data parsers for system and GPU metrics."""
-
-from .cpu import parse_cpu
-from .memory import parse_memory
-from .disk import parse_disk
-from .gpu import parse_gpus
-from .process import build_process_map
-
-__all__ = [
-    'parse_cpu',
-    'parse_memory',
-    'parse_disk',
-    'parse_gpus',
-    'build_process_map',
-]
+"""Data parsers for system and GPU metrics."""
+
+import importlib
+
+# Parser modules are loaded on first attribute access (PEP 562)
+_LAZY = {
+    'parse_cpu': '.cpu',
+    'parse_memory': '.memory',
+    'parse_disk': '.disk',
+    'parse_gpus': '.gpu',
+    'parse_gpu_xml': '.gpu',
+    'parse_gpu_sections': '.gpu',
+    'build_process_map': '.process',
+}
+
+__all__ = [
+    'parse_cpu',
+    'parse_memory',
+    'parse_disk',
+    'parse_gpus',
+    'parse_gpu_xml',
+    'parse_gpu_sections',
+    'build_process_map',
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,140 +1,308 @@
-"""GPU metrics parser."""
-
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-from .process import ProcessInfo
-
-
-@dataclass
-class GPUProcess:
-    pid: int
-    user: str
-    command: str
-    gpu_memory_mb: int
-
-
-@dataclass
-class GPUMemory:
-    used_mb: int
-    total_mb: int
-    usage_percent: float
-
-
-@dataclass
-class GPUMetrics:
-    index: int
-    name: str
-    uuid: str
-    temperature_celsius: int
-    utilization_percent: int
-    memory: GPUMemory
-    driver_version: str
-    processes: List[GPUProcess] = field(default_factory=list)
-
-
-def parse_gpus(
-    gpu_info: str,
-    gpu_processes: str,
-    process_map: Dict[int, ProcessInfo],
-) -> List[GPUMetrics]:
-    """
-    Parse GPU metrics from nvidia-smi output.
-
-    Args:
-        gpu_info: Output of nvidia-smi --query-gpu=...
-                  Format: 0, NVIDIA RTX 6000, GPU-xxx, 39, 0, 43, 49140, 570.133.07
-        gpu_processes: Output of nvidia-smi --query-compute-apps=...
-                       Format: GPU-xxx, 1234, 5000
-        process_map: Pre-built process map from ps output
-
-    Returns:
-        List of GPUMetrics objects
-    """
-    if 'NO_GPU' in gpu_info:
-        return []
-
-    # Build UUID to GPU index mapping
-    uuid_to_gpu: Dict[str, GPUMetrics] = {}
-    gpus: List[GPUMetrics] = []
-
-    # Parse GPU info
-    for line in gpu_info.strip().split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) < 8:
-            continue
-
-        try:
-            index = int(parts[0])
-            name = parts[1]
-            uuid = parts[2]
-            temp = int(parts[3]) if parts[3].isdigit() else 0
-            util = int(parts[4]) if parts[4].isdigit() else 0
-            mem_used = int(parts[5]) if parts[5].isdigit() else 0
-            mem_total = int(parts[6]) if parts[6].isdigit() else 1
-            driver = parts[7]
-
-            mem_percent = round((mem_used / mem_total) * 100, 1) if mem_total > 0 else 0.0
-
-            gpu = GPUMetrics(
-                index=index,
-                name=name,
-                uuid=uuid,
-                temperature_celsius=temp,
-                utilization_percent=util,
-                memory=GPUMemory(
-                    used_mb=mem_used,
-                    total_mb=mem_total,
-                    usage_percent=mem_percent,
-                ),
-                driver_version=driver,
-                processes=[],
-            )
-
-            gpus.append(gpu)
-            uuid_to_gpu[uuid] = gpu
-
-        except (ValueError, IndexError):
-            continue
-
-    # Parse GPU processes
-    if 'NO_PROCESSES' not in gpu_processes:
-        for line in gpu_processes.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) < 3:
-                continue
-
-            try:
-                gpu_uuid = parts[0]
-                pid = int(parts[1])
-                gpu_mem = int(parts[2]) if parts[2].isdigit() else 0
-
-                # Find the GPU this process belongs to
-                gpu = uuid_to_gpu.get(gpu_uuid)
-                if not gpu:
-                    continue
-
-                # Get process info from the pre-built map
-                proc_info = process_map.get(pid)
-                user = proc_info.user if proc_info else "unknown"
-                command = proc_info.command if proc_info else "unknown"
-
-                gpu.processes.append(GPUProcess(
-                    pid=pid,
-                    user=user,
-                    command=command,
-                    gpu_memory_mb=gpu_mem,
-                ))
-
-            except (ValueError, IndexError):
-                continue
-
-    return gpus
+"""
+GPU metrics parser.
+
+Hosts report GPUs with one `nvidia-smi -q -x` call (GPU_XML section),
+which also carries power, clocks, PCIe throughput and ECC counters. The
+CSV queries (GPU_INFO / GPU_PROCESSES sections) are the fallback for
+drivers whose nvidia-smi cannot produce XML, and for older captures.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from .process import ProcessInfo
+
+
+class GPUProcess(NamedTuple):
+    pid: int
+    user: str
+    command: str
+    gpu_memory_mb: int
+
+
+class GPUMemory(NamedTuple):
+    used_mb: int
+    total_mb: int
+    usage_percent: float
+
+
+class GPUTelemetry(NamedTuple):
+    """Extended readings, only available from the XML report (None: N/A)."""
+    power_draw_watts: Optional[float]
+    power_limit_watts: Optional[float]
+    sm_clock_mhz: Optional[int]
+    memory_clock_mhz: Optional[int]
+    pcie_tx_kbps: Optional[int]
+    pcie_rx_kbps: Optional[int]
+    ecc_corrected: Optional[int]  # volatile counts, since the driver loaded
+    ecc_uncorrected: Optional[int]
+
+
+class GPUMetrics(NamedTuple):
+    index: int
+    name: str
+    uuid: str
+    temperature_celsius: int
+    utilization_percent: int
+    memory: GPUMemory
+    driver_version: str
+    processes: List[GPUProcess]  # filled in place while parsing compute apps
+    telemetry: Optional[GPUTelemetry] = None
+
+
+def parse_gpus(
+    gpu_info: str,
+    gpu_processes: str,
+    process_map: Dict[int, ProcessInfo],
+) -> List[GPUMetrics]:
+    """
+    Parse GPU metrics from nvidia-smi output.
+
+    Args:
+        gpu_info: Output of nvidia-smi --query-gpu=...
+                  Format: 0, NVIDIA RTX 6000, GPU-xxx, 39, 0, 43, 49140, 570.133.07
+        gpu_processes: Output of nvidia-smi --query-compute-apps=...
+                       Format: GPU-xxx, 1234, 5000
+        process_map: Pre-built process map from ps output
+
+    Returns:
+        List of GPUMetrics objects
+    """
+    if 'NO_GPU' in gpu_info:
+        return []
+
+    # Build UUID to GPU index mapping
+    uuid_to_gpu: Dict[str, GPUMetrics] = {}
+    gpus: List[GPUMetrics] = []
+
+    # Parse GPU info
+    for line in gpu_info.strip().split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        parts = [p.strip() for p in line.split(',')]
+        if len(parts) < 8:
+            continue
+
+        try:
+            index = int(parts[0])
+            name = parts[1]
+            uuid = parts[2]
+            temp = int(parts[3]) if parts[3].isdigit() else 0
+            util = int(parts[4]) if parts[4].isdigit() else 0
+            mem_used = int(parts[5]) if parts[5].isdigit() else 0
+            mem_total = int(parts[6]) if parts[6].isdigit() else 1
+            driver = parts[7]
+
+            mem_percent = round((mem_used / mem_total) * 100, 1) if mem_total > 0 else 0.0
+
+            gpu = GPUMetrics(
+                index=index,
+                name=name,
+                uuid=uuid,
+                temperature_celsius=temp,
+                utilization_percent=util,
+                memory=GPUMemory(
+                    used_mb=mem_used,
+                    total_mb=mem_total,
+                    usage_percent=mem_percent,
+                ),
+                driver_version=driver,
+                processes=[],
+            )
+
+            gpus.append(gpu)
+            uuid_to_gpu[uuid] = gpu
+
+        except (ValueError, IndexError):
+            continue
+
+    # Parse GPU processes
+    if 'NO_PROCESSES' not in gpu_processes:
+        for line in gpu_processes.strip().split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = [p.strip() for p in line.split(',')]
+            if len(parts) < 3:
+                continue
+
+            try:
+                gpu_uuid = parts[0]
+                pid = int(parts[1])
+                gpu_mem = int(parts[2]) if parts[2].isdigit() else 0
+
+                # Find the GPU this process belongs to
+                gpu = uuid_to_gpu.get(gpu_uuid)
+                if not gpu:
+                    continue
+
+                # Get process info from the pre-built map
+                proc_info = process_map.get(pid)
+                user = proc_info.user if proc_info else "unknown"
+                command = proc_info.command if proc_info else "unknown"
+
+                gpu.processes.append(GPUProcess(
+                    pid=pid,
+                    user=user,
+                    command=command,
+                    gpu_memory_mb=gpu_mem,
+                ))
+
+            except (ValueError, IndexError):
+                continue
+
+    return gpus
+
+
+_NUMBER = re.compile(r'^\s*(-?\d+(?:\.\d+)?)')
+
+# Bytes fed to the XML parser at a time; parsed GPUs are released as we go
+XML_CHUNK = 64 * 1024
+
+
+def _number(text: Optional[str]) -> Optional[float]:
+    """Leading number of an nvidia-smi value ("265.43 W", "71 C"), or None for N/A."""
+    match = _NUMBER.match(text or '')
+    return float(match.group(1)) if match else None
+
+
+def _int(text: Optional[str]) -> Optional[int]:
+    value = _number(text)
+    return int(value) if value is not None else None
+
+
+def _child_text(parent: Optional[Element], tag: str) -> Optional[str]:
+    # Plain tags, not paths: findtext() then skips ElementPath
+    return parent.findtext(tag) if parent is not None else None
+
+
+def _ecc_counts(ecc_errors: Optional[Element]) -> tuple:
+    """(corrected, uncorrected) volatile ECC errors, None if not reported."""
+    volatile = ecc_errors.find('volatile') if ecc_errors is not None else None
+    if volatile is None:
+        return None, None
+
+    # Drivers before R535: single_bit / double_bit totals
+    single, double = volatile.find('single_bit'), volatile.find('double_bit')
+    if single is not None or double is not None:
+        return _int(_child_text(single, 'total')), _int(_child_text(double, 'total'))
+
+    # Later drivers: sram_correctable, sram_uncorrectable_*, dram_* counters
+    corrected = uncorrected = None
+    for counter in volatile:
+        value = _int(counter.text)
+        if value is None:
+            continue
+        if 'uncorrectable' in counter.tag:
+            uncorrected = (uncorrected or 0) + value
+        elif 'correctable' in counter.tag:
+            corrected = (corrected or 0) + value
+    return corrected, uncorrected
+
+
+def _gpu_from_xml(gpu: Element, index: int, driver: str, process_map: Dict[int, ProcessInfo]) -> GPUMetrics:
+    sections = {child.tag: child for child in gpu}
+    memory = sections.get('fb_memory_usage')
+    mem_used = _int(_child_text(memory, 'used')) or 0
+    mem_total = _int(_child_text(memory, 'total')) or 1
+
+    processes = []
+    for info in sections.get('processes', ()):
+        # Graphics-only clients (Xorg, ...) are not compute apps
+        kind = info.findtext('type')
+        pid = _int(info.findtext('pid'))
+        if info.tag != 'process_info' or pid is None or (kind and 'C' not in kind):
+            continue
+        proc_info = process_map.get(pid)
+        processes.append(GPUProcess(
+            pid=pid,
+            user=proc_info.user if proc_info else "unknown",
+            command=proc_info.command if proc_info else "unknown",
+            gpu_memory_mb=_int(info.findtext('used_memory')) or 0,
+        ))
+
+    # gpu_power_readings since R530, power_readings before
+    power = sections.get('gpu_power_readings', sections.get('power_readings'))
+    clocks, pci = sections.get('clocks'), sections.get('pci')
+    corrected, uncorrected = _ecc_counts(sections.get('ecc_errors'))
+
+    return GPUMetrics(
+        index=index,
+        name=gpu.findtext('product_name') or '',
+        uuid=gpu.findtext('uuid') or '',
+        temperature_celsius=_int(_child_text(sections.get('temperature'), 'gpu_temp')) or 0,
+        utilization_percent=_int(_child_text(sections.get('utilization'), 'gpu_util')) or 0,
+        memory=GPUMemory(
+            used_mb=mem_used,
+            total_mb=mem_total,
+            usage_percent=round((mem_used / mem_total) * 100, 1) if mem_total > 0 else 0.0,
+        ),
+        driver_version=driver,
+        processes=processes,
+        telemetry=GPUTelemetry(
+            power_draw_watts=_number(_child_text(power, 'power_draw')),
+            power_limit_watts=_number(_child_text(power, 'current_power_limit') or _child_text(power, 'power_limit')),
+            sm_clock_mhz=_int(_child_text(clocks, 'sm_clock')),
+            memory_clock_mhz=_int(_child_text(clocks, 'mem_clock')),
+            pcie_tx_kbps=_int(_child_text(pci, 'tx_util')),
+            pcie_rx_kbps=_int(_child_text(pci, 'rx_util')),
+            ecc_corrected=corrected,
+            ecc_uncorrected=uncorrected,
+        ),
+    )
+
+
+def parse_gpu_xml(gpu_xml: str, process_map: Dict[int, ProcessInfo]) -> List[GPUMetrics]:
+    """
+    Parse GPU metrics and compute processes from `nvidia-smi -q -x`.
+
+    The report is parsed incrementally and each <gpu> element is released
+    once converted, so memory stays flat on many-GPU nodes. If the output
+    was cut off, the GPUs completed before the cut are still returned.
+
+    Args:
+        gpu_xml: Output of nvidia-smi -q -x
+        process_map: Pre-built process map from ps output
+
+    Returns:
+        List of GPUMetrics objects, in nvidia-smi order (= GPU index)
+    """
+    gpus: List[GPUMetrics] = []
+    driver = ''
+    # End events only: neither tag occurs below the top level of the report
+    parser = XMLPullParser(events=('end',))
+
+    try:
+        for offset in range(0, len(gpu_xml), XML_CHUNK):
+            parser.feed(gpu_xml[offset:offset + XML_CHUNK])
+            for _, elem in parser.read_events():
+                if elem.tag == 'gpu':
+                    gpus.append(_gpu_from_xml(elem, len(gpus), driver, process_map))
+                    elem.clear()
+                elif elem.tag == 'driver_version':
+                    driver = (elem.text or '').strip()
+        parser.close()
+    except ParseError:
+        pass
+
+    return gpus
+
+
+def parse_gpu_sections(sections: Dict[str, str], process_map: Dict[int, ProcessInfo]) -> List[GPUMetrics]:
+    """
+    Parse the GPUs of one host output: the XML report when the host
+    produced one, otherwise the CSV fallback sections (present when
+    nvidia-smi -q -x failed, possibly after printing part of a report).
+    """
+    gpu_xml = sections.get('GPU_XML', '')
+    if gpu_xml.lstrip().startswith('<') and 'GPU_INFO' not in sections:
+        return parse_gpu_xml(gpu_xml, process_map)
+    return parse_gpus(
+        sections.get('GPU_INFO', 'NO_GPU'),
+        sections.get('GPU_PROCESSES', 'NO_PROCESSES'),
+        process_map,
+    )
@@ -0,0 +1,103 @@
+"""Opt-in per-phase profiling of collection cycles."""
+
+import cProfile
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Cycle phases that get their own profile file
+PROFILED_PHASES = ("collect", "parse", "save")
+
+
+class _StackSampler(threading.Thread):
+    """Background thread sampling the stacks of all other threads."""
+
+    def __init__(self, interval: float):
+        super().__init__(name="stack-sampler", daemon=True)
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        me = threading.get_ident()
+        names = {}
+        while not self._done.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                if ident not in names:
+                    # Worker threads share a root frame: ThreadPoolExecutor-0_3 -> ThreadPoolExecutor
+                    names.update((t.ident, re.sub(r'[-_\d]+$', '', t.name)) for t in threading.enumerate())
+                stack.append(names.get(ident, "thread"))
+                self.counts[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+
+class CycleProfiler:
+    """
+    Write one profile per phase per cycle.
+
+    mode="cprofile" writes deterministic <cycle>-<phase>.pstats files
+    (open with `python -m pstats` or snakeviz). cProfile only sees the
+    thread that runs the phase, so for the threaded sync collection use
+    mode="sample", which writes <cycle>-<phase>.collapsed files in the
+    collapsed-stack format read by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, output_dir: str, mode: str = "cprofile", interval: float = 0.005):
+        if mode not in ("cprofile", "sample"):
+            raise ValueError(f"Unknown profile mode: {mode}")
+
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.interval = interval
+        self.cycle: Optional[str] = None
+
+    def begin_cycle(self) -> None:
+        """Start a new cycle; its timestamp prefixes the profile files."""
+        self.cycle = datetime.now().strftime('%Y%m%dT%H%M%S')
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile a block if it is one of PROFILED_PHASES."""
+        if name not in PROFILED_PHASES:
+            yield
+            return
+
+        if self.cycle is None:
+            self.begin_cycle()
+        base = self.output_dir / f"{self.cycle}-{name}"
+
+        if self.mode == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                profile.dump_stats(f"{base}.pstats")
+        else:
+            sampler = _StackSampler(self.interval)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+                    for stack, count in sampler.counts.most_common():
+                        f.write(f"{stack} {count}\n")
@@ -0,0 +1,357 @@
+"""
+Per-GPU utilization report over history, computed with NumPy.
+
+    python -m collector.report                       # last 7 days of docs/data/history.json
+    python -m collector.report --days 30 --csv report.csv
+    python -m collector.report archive/*.json --since 2026-01-01 --json report.json
+
+For every GPU: p50/p95 utilization, mean utilization, idle fraction,
+p95/max temperature and thermal headroom, and time under VRAM pressure.
+A summary plus the per-GPU rows is written to report.json next to the
+status file; the history page shows each GPU's row in its section header.
+
+History is streamed once. Snapshots are gathered into (time x series)
+uint8 blocks of CHUNK_ROWS rows, and each block is folded into per-series
+histograms and time-weighted sums, vectorized across all GPUs at once.
+Utilization, temperature and VRAM usage are integer percentages/degrees,
+so the 256-bin histograms give exact percentiles while memory stays
+O(series) however long the history is.
+
+NumPy is optional for the collector and only needed here.
+"""
+
+import argparse
+import csv
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .jsonio import iter_json_array, save_json
+
+CHUNK_ROWS = 4096
+MISSING = 255  # uint8 marker for "no sample" (server offline, GPU absent)
+BINS = 256
+
+# Defaults for the derived statistics
+IDLE_UTILIZATION = 5       # % utilization at or below which a GPU counts as idle
+THERMAL_LIMIT = 85         # degrees C; headroom = limit - p95 temperature
+VRAM_PRESSURE = 90         # % VRAM usage at or above which a GPU is under pressure
+MAX_SAMPLE_SECONDS = 300   # longest interval one snapshot can stand for
+
+METRICS = ("utilization", "temperature", "memory")
+
+
+class _Accumulator:
+    """Per-series histograms and time-weighted sums, grown as series appear."""
+
+    def __init__(self, np, idle_utilization: int, vram_pressure: int):
+        self.np = np
+        self.idle_utilization = idle_utilization
+        self.vram_pressure = vram_pressure
+        self.capacity = 0
+        self.histograms = {metric: np.zeros((0, BINS), dtype=np.int64) for metric in METRICS}
+        self.hours = np.zeros(0)
+        self.idle_hours = np.zeros(0)
+        self.pressure_hours = np.zeros(0)
+        self.util_hours = np.zeros(0)
+
+    def grow(self, capacity: int) -> None:
+        np = self.np
+        extra = capacity - self.capacity
+        for metric in METRICS:
+            self.histograms[metric] = np.vstack([self.histograms[metric], np.zeros((extra, BINS), dtype=np.int64)])
+        self.hours = np.concatenate([self.hours, np.zeros(extra)])
+        self.idle_hours = np.concatenate([self.idle_hours, np.zeros(extra)])
+        self.pressure_hours = np.concatenate([self.pressure_hours, np.zeros(extra)])
+        self.util_hours = np.concatenate([self.util_hours, np.zeros(extra)])
+        self.capacity = capacity
+
+    def add_block(self, blocks: Dict[str, Any], durations: Any) -> None:
+        """Fold (rows x series) uint8 blocks, with per-row durations in hours."""
+        np = self.np
+        util = blocks["utilization"]
+        valid = util != MISSING
+        weights = durations[:, None] * valid
+
+        # Offsetting each column by series * BINS turns all histograms into one bincount
+        offsets = np.arange(util.shape[1]) * BINS
+        for metric in METRICS:
+            values = blocks[metric]
+            present = values != MISSING
+            flat = (values.astype(np.int64) + offsets)[present]
+            counts = np.bincount(flat, minlength=util.shape[1] * BINS)
+            self.histograms[metric][:util.shape[1]] += counts.reshape(-1, BINS)
+
+        n = util.shape[1]
+        self.hours[:n] += weights.sum(axis=0)
+        self.idle_hours[:n] += (weights * (util <= self.idle_utilization)).sum(axis=0)
+        self.util_hours[:n] += (weights * np.where(valid, util, 0)).sum(axis=0)
+        memory = blocks["memory"]
+        self.pressure_hours[:n] += (weights * ((memory >= self.vram_pressure) & (memory != MISSING))).sum(axis=0)
+
+    def percentile(self, metric: str, q: float) -> Any:
+        """Nearest-rank percentile per series (-1 where a series has no samples)."""
+        np = self.np
+        cumulative = self.histograms[metric].cumsum(axis=1)
+        total = cumulative[:, -1]
+        rank = np.maximum(np.ceil(total * q / 100), 1)
+        result = (cumulative >= rank[:, None]).argmax(axis=1)
+        return np.where(total > 0, result, -1)
+
+    def maximum(self, metric: str) -> Any:
+        np = self.np
+        present = self.histograms[metric] > 0
+        last = BINS - 1 - present[:, ::-1].argmax(axis=1)
+        return np.where(present.any(axis=1), last, -1)
+
+
+def build_report(
+    snapshots: Iterable[Dict[str, Any]],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    idle_utilization: int = IDLE_UTILIZATION,
+    thermal_limit: int = THERMAL_LIMIT,
+    vram_pressure: int = VRAM_PRESSURE,
+) -> Dict[str, Any]:
+    """
+    Compute the per-GPU report from snapshots in time order.
+
+    Args:
+        snapshots: History snapshots (e.g. streamed with iter_json_array)
+        since: Ignore snapshots before this time
+        until: Ignore snapshots after this time
+        idle_utilization: Utilization (%) at or below which a GPU is idle
+        thermal_limit: Temperature (C) that thermal headroom is measured against
+        vram_pressure: VRAM usage (%) at or above which a GPU is under pressure
+
+    Returns:
+        Report with "range", "thresholds", "summary" and per-GPU "gpus" rows
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    import numpy as np
+
+    acc = _Accumulator(np, idle_utilization, vram_pressure)
+    series: Dict[Tuple[str, int], int] = {}
+    models: List[str] = []
+
+    # Samples of the current block, flattened; counts[i] samples belong to row i
+    counts: List[int] = []
+    cols: List[int] = []
+    values: Dict[str, List[Optional[float]]] = {metric: [] for metric in METRICS}
+    durations: List[float] = []
+    previous: Optional[datetime] = None
+    first: Optional[str] = None
+    last: Optional[str] = None
+    count = 0
+
+    def flush() -> None:
+        if not durations:
+            return
+        width = len(series)
+        if width > acc.capacity:
+            acc.grow(max(width, acc.capacity * 2))
+        rows = np.repeat(np.arange(len(durations)), counts)
+        blocks = {}
+        for metric in METRICS:
+            # None becomes NaN, which becomes MISSING
+            raw = np.rint(np.array(values[metric], dtype=float))
+            block = np.full((len(durations), width), MISSING, dtype=np.uint8)
+            block[rows, cols] = np.where(np.isnan(raw), MISSING, np.clip(raw, 0, MISSING - 1))
+            blocks[metric] = block
+            values[metric].clear()
+        acc.add_block(blocks, np.asarray(durations))
+        counts.clear()
+        cols.clear()
+        durations.clear()
+
+    utilization, temperature, memory = (values[metric] for metric in METRICS)
+    for snapshot in snapshots:
+        timestamp = datetime.fromisoformat(snapshot["timestamp"])
+        # The collector writes aware timestamps; a naive one (hand-made snapshot) is taken as UTC
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        if (since and timestamp < since) or (until and timestamp > until):
+            continue
+
+        if previous is None:
+            seconds = 60.0
+        else:
+            seconds = min(max((timestamp - previous).total_seconds(), 0.0), MAX_SAMPLE_SECONDS)
+        previous = timestamp
+        first = first or snapshot["timestamp"]
+        last = snapshot["timestamp"]
+        count += 1
+
+        durations.append(seconds / 3600)
+        samples_before = len(cols)
+
+        for server in snapshot.get("servers", []):
+            if server.get("status") != "online":
+                continue
+            name = server["name"]
+            for gpu in server.get("gpus", []):
+                key = (name, gpu["index"])
+                col = series.get(key)
+                if col is None:
+                    col = series[key] = len(series)
+                    models.append(gpu.get("name") or "unknown")
+                cols.append(col)
+                utilization.append(gpu.get("utilization_percent"))
+                temperature.append(gpu.get("temperature_celsius"))
+                memory.append((gpu.get("memory") or {}).get("usage_percent"))
+
+        counts.append(len(cols) - samples_before)
+        if len(durations) == CHUNK_ROWS:
+            flush()
+    flush()
+
+    n = len(series)
+    if n > acc.capacity:
+        acc.grow(n)
+
+    util_p50 = acc.percentile("utilization", 50)[:n]
+    util_p95 = acc.percentile("utilization", 95)[:n]
+    temp_p95 = acc.percentile("temperature", 95)[:n]
+    temp_max = acc.maximum("temperature")[:n]
+    samples = acc.histograms["utilization"].sum(axis=1)[:n]
+    hours = acc.hours[:n]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        util_mean = np.where(hours > 0, acc.util_hours[:n] / hours, 0)
+        idle_fraction = np.where(hours > 0, acc.idle_hours[:n] / hours, 0)
+        pressure_fraction = np.where(hours > 0, acc.pressure_hours[:n] / hours, 0)
+
+    gpus = []
+    for (server, index), col in series.items():
+        gpus.append({
+            "server": server,
+            "index": index,
+            "model": models[col],
+            "samples": int(samples[col]),
+            "hours": round(float(hours[col]), 2),
+            "util_p50": int(util_p50[col]),
+            "util_p95": int(util_p95[col]),
+            "util_mean": round(float(util_mean[col]), 1),
+            "idle_fraction": round(float(idle_fraction[col]), 3),
+            "temp_p95": int(temp_p95[col]),
+            "temp_max": int(temp_max[col]),
+            "thermal_headroom": int(thermal_limit - temp_p95[col]) if temp_p95[col] >= 0 else None,
+            "vram_pressure_hours": round(float(acc.pressure_hours[col]), 2),
+            "vram_pressure_fraction": round(float(pressure_fraction[col]), 3),
+        })
+    gpus.sort(key=lambda g: (g["server"], g["index"]))
+
+    total_hours = float(hours.sum())
+    summary = {
+        "gpus": n,
+        "gpu_hours": round(total_hours, 1),
+        "util_mean": round(float(acc.util_hours[:n].sum() / total_hours), 1) if total_hours else 0.0,
+        "idle_fraction": round(float(acc.idle_hours[:n].sum() / total_hours), 3) if total_hours else 0.0,
+        "vram_pressure_hours": round(float(acc.pressure_hours[:n].sum()), 1),
+        "min_thermal_headroom": min((g["thermal_headroom"] for g in gpus if g["thermal_headroom"] is not None),
+                                    default=None),
+        "busiest": sorted(gpus, key=lambda g: -g["util_mean"])[:5],
+        "idlest": sorted(gpus, key=lambda g: -g["idle_fraction"])[:5],
+    }
+
+    return {
+        "generated_at": datetime.now().astimezone().isoformat(),
+        "range": {"start": first, "end": last, "snapshots": count},
+        "thresholds": {
+            "idle_utilization_percent": idle_utilization,
+            "thermal_limit_celsius": thermal_limit,
+            "vram_pressure_percent": vram_pressure,
+        },
+        "summary": summary,
+        "gpus": gpus,
+    }
+
+
+CSV_FIELDS = (
+    "server", "index", "model", "samples", "hours", "util_p50", "util_p95", "util_mean",
+    "idle_fraction", "temp_p95", "temp_max", "thermal_headroom",
+    "vram_pressure_hours", "vram_pressure_fraction",
+)
+
+
+def write_csv(report: Dict[str, Any], path: Path) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(report["gpus"])
+
+
+def _parse_date(value: str) -> datetime:
+    # Naive dates/times are local time, like the collector's timestamps
+    return datetime.fromisoformat(value).astimezone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-GPU utilization report over history")
+    parser.add_argument('history', nargs='*', help='History files in time order (default: history.json next to the status file)')
+    parser.add_argument('--days', type=float, default=7, help='Last N days (default: 7)')
+    parser.add_argument('--since', type=_parse_date, help='Start time (ISO date/time), overrides --days')
+    parser.add_argument('--until', type=_parse_date, help='End time (ISO date/time)')
+    parser.add_argument('--json', dest='json_path', help='Write the full report as JSON')
+    parser.add_argument('--csv', dest='csv_path', help='Write per-GPU rows as CSV')
+    parser.add_argument('--no-publish', action='store_true', help="Don't write report.json next to the status file")
+    parser.add_argument('--idle-util', type=int, default=IDLE_UTILIZATION, help='Idle utilization threshold, %%')
+    parser.add_argument('--thermal-limit', type=int, default=THERMAL_LIMIT, help='Thermal limit, C')
+    parser.add_argument('--vram-pressure', type=int, default=VRAM_PRESSURE, help='VRAM pressure threshold, %%')
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("Error: collector.report needs NumPy (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+
+    from .config import load_config
+    try:
+        output_file = load_config().output_file
+    except (FileNotFoundError, ValueError):
+        output_file = "./docs/data/status.json"
+    data_dir = Path(output_file).parent
+
+    paths = [Path(p) for p in args.history] or [data_dir / "history.json"]
+    since = args.since or datetime.now().astimezone() - timedelta(days=args.days)
+
+    def snapshots():
+        for path in paths:
+            yield from iter_json_array(path)
+
+    try:
+        report = build_report(
+            snapshots(),
+            since=since,
+            until=args.until,
+            idle_utilization=args.idle_util,
+            thermal_limit=args.thermal_limit,
+            vram_pressure=args.vram_pressure,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json_path:
+        save_json(Path(args.json_path), report, indent=True)
+    if args.csv_path:
+        write_csv(report, Path(args.csv_path))
+    if not args.no_publish:
+        save_json(data_dir / "report.json", report, indent=True)
+
+    summary = report["summary"]
+    print(f"{report['range']['snapshots']} snapshots, {summary['gpus']} GPUs, "
+          f"{summary['gpu_hours']} GPU-hours: mean utilization {summary['util_mean']}%, "
+          f"idle {summary['idle_fraction']:.1%}, {summary['vram_pressure_hours']} h under VRAM pressure")
+    print(f"{'server':<24} {'gpu':>3} {'p50':>4} {'p95':>4} {'idle':>6} {'t95':>4} {'head':>5} {'vram-h':>7}")
+    for gpu in report["gpus"]:
+        headroom = "-" if gpu["thermal_headroom"] is None else gpu["thermal_headroom"]
+        print(f"{gpu['server'][:24]:<24} {gpu['index']:>3} {gpu['util_p50']:>4} {gpu['util_p95']:>4} "
+              f"{gpu['idle_fraction']:>6.1%} {gpu['temp_p95']:>4} {headroom:>5} {gpu['vram_pressure_hours']:>7}")
+
+
+if __name__ == "__main__":
+    main()
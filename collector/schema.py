@@ -0,0 +1,53 @@
+"""Schema-driven conversion of parsed records into status.json structures."""
+
+from typing import Any, Dict, Tuple, Type
+
+from .parsers.cpu import CPUMetrics
+from .parsers.disk import DiskMetrics
+from .parsers.gpu import GPUMemory, GPUMetrics, GPUProcess, GPUTelemetry
+from .parsers.memory import MemoryMetrics
+
+# Fields written to the output for each record type, in output order.
+# Nested records and lists of records are converted recursively.
+OUTPUT_FIELDS: Dict[Type, Tuple[str, ...]] = {
+    CPUMetrics: ("usage_percent", "cores"),
+    MemoryMetrics: ("total_bytes", "available_bytes", "used_bytes", "usage_percent"),
+    DiskMetrics: ("device", "mount_point", "total_bytes", "used_bytes", "available_bytes", "usage_percent"),
+    GPUMemory: ("used_mb", "total_mb", "usage_percent"),
+    GPUProcess: ("pid", "user", "command", "gpu_memory_mb"),
+    GPUTelemetry: (
+        "power_draw_watts",
+        "power_limit_watts",
+        "sm_clock_mhz",
+        "memory_clock_mhz",
+        "pcie_tx_kbps",
+        "pcie_rx_kbps",
+        "ecc_corrected",
+        "ecc_uncorrected",
+    ),
+    GPUMetrics: (
+        "index",
+        "name",
+        "uuid",
+        "temperature_celsius",
+        "utilization_percent",
+        "memory",
+        "driver_version",
+        "processes",
+        "telemetry",
+    ),
+}
+
+# Values reported when a parser returns None
+EMPTY_CPU = CPUMetrics(usage_percent=0, cores=0)
+EMPTY_MEMORY = MemoryMetrics(total_bytes=0, available_bytes=0, used_bytes=0, usage_percent=0)
+
+
+def to_json(value: Any) -> Any:
+    """Convert a record, or a list of records, into JSON-ready builtins."""
+    fields = OUTPUT_FIELDS.get(type(value))
+    if fields is not None:
+        return {name: to_json(getattr(value, name)) for name in fields}
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+    return value
@@ -0,0 +1,191 @@
+"""
+Incremental GPU process-session index.
+
+A session is one process seen on one GPU over consecutive snapshots,
+identified by (server, GPU uuid, pid, start). Each cycle extends the
+sessions still running and opens new ones, so the history page looks up
+a GPU's recent processes instead of rescanning every snapshot.
+
+process_sessions.json, next to the status file, is both the published
+index and the state carried between cycles:
+
+    {
+      "since": "<first snapshot indexed>",
+      "last_seen": {"<server>": "<timestamp of its last online snapshot>"},
+      "truncated_before": {"<server>": {"<gpu index>": "<end of the latest session dropped by the cap>"}},
+      "servers": {
+        "<server>": {
+          "<gpu index>": [
+            {"gpu_uuid": ..., "pid": ..., "user": ..., "command": ...,
+             "start": ..., "end": ..., "peak_memory_mb": ..., "samples": ...}
+          ]
+        }
+      }
+    }
+
+A GPU's sessions are complete from max(since, truncated_before) on; for
+ranges starting earlier, the page reads history.json instead.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from .jsonio import load_file, save_json
+from .stats import CollectorStats
+
+
+def _continues(session: Dict[str, Any], process: Dict[str, Any]) -> bool:
+    # A reused pid shows up with another user or command
+    return session["user"] == process["user"] and session["command"] == process["command"]
+
+
+def update_sessions(
+    table: Dict[str, Any],
+    snapshot: Dict[str, Any],
+    retention_hours: int = 168,
+    max_per_gpu: int = 200,
+) -> Dict[str, Any]:
+    """
+    Fold one status snapshot into the session table, in place.
+
+    A process continues its session if it was also present in the previous
+    online snapshot of the server, on the same GPU, with the same user and
+    command. Otherwise (first sighting, pid reuse, or a gap) a new session
+    starts. Snapshots where a server is offline are skipped without closing
+    its sessions.
+
+    Args:
+        table: Session table (empty dict to start a new one)
+        snapshot: Status snapshot as written to status.json
+        retention_hours: Drop sessions that ended longer ago than this
+        max_per_gpu: Keep at most this many sessions per GPU (about one
+            an hour over the default retention); the oldest are dropped
+            first and recorded in truncated_before
+
+    Returns:
+        The updated table
+    """
+    timestamp = snapshot["timestamp"]
+    cutoff = (datetime.fromisoformat(timestamp) - timedelta(hours=retention_hours)).isoformat()
+
+    table.setdefault("since", timestamp)
+    last_seen = table.setdefault("last_seen", {})
+    servers = table.setdefault("servers", {})
+    truncated = table.setdefault("truncated_before", {})
+
+    for server in snapshot.get("servers", []):
+        if server.get("status") != "online":
+            continue
+
+        name = server["name"]
+        previous = last_seen.get(name)
+        gpu_sessions = servers.setdefault(name, {})
+
+        for gpu in server.get("gpus", []):
+            sessions = gpu_sessions.setdefault(str(gpu["index"]), [])
+            uuid = gpu.get("uuid")
+
+            # Sessions that were running at the previous sample, by pid
+            running = {
+                s["pid"]: s for s in sessions
+                if previous is not None and s["end"] == previous and s["gpu_uuid"] == uuid
+            }
+            current: Dict[int, Dict[str, Any]] = {}
+
+            for process in gpu.get("processes", []):
+                pid = process["pid"]
+                memory = process.get("gpu_memory_mb", 0)
+
+                session = current.get(pid)
+                if session is not None:
+                    # Same pid listed twice in one sample
+                    session["peak_memory_mb"] = max(session["peak_memory_mb"], memory)
+                    continue
+
+                session = running.pop(pid, None)
+                if session is not None and _continues(session, process):
+                    session["end"] = timestamp
+                    session["peak_memory_mb"] = max(session["peak_memory_mb"], memory)
+                    session["samples"] += 1
+                else:
+                    session = {
+                        "gpu_uuid": uuid,
+                        "pid": pid,
+                        "user": process["user"],
+                        "command": process["command"],
+                        "start": timestamp,
+                        "end": timestamp,
+                        "peak_memory_mb": memory,
+                        "samples": 1,
+                    }
+                    sessions.append(session)
+                current[pid] = session
+
+        last_seen[name] = timestamp
+
+    # Expire old sessions, then cap each GPU, keeping running sessions
+    for name in list(servers):
+        gpu_sessions = servers[name]
+        for index in list(gpu_sessions):
+            sessions = [s for s in gpu_sessions[index] if s["end"] >= cutoff]
+            excess = len(sessions) - max_per_gpu
+            if excess > 0:
+                kept = []
+                for session in sessions:
+                    if excess > 0 and session["end"] != timestamp:
+                        excess -= 1
+                        gpu_truncated = truncated.setdefault(name, {})
+                        gpu_truncated[index] = max(gpu_truncated.get(index, ""), session["end"])
+                        continue
+                    kept.append(session)
+                sessions = kept
+
+            if sessions:
+                gpu_sessions[index] = sessions
+            else:
+                del gpu_sessions[index]
+
+        if not gpu_sessions and last_seen.get(name, "") < cutoff:
+            del servers[name]
+            last_seen.pop(name, None)
+
+    # Sessions dropped before the retention cutoff would have expired anyway
+    for name in list(truncated):
+        truncated[name] = {i: end for i, end in truncated[name].items() if end >= cutoff}
+        if not truncated[name]:
+            del truncated[name]
+
+    return table
+
+
+def save_sessions(
+    data: Dict[str, Any],
+    output_file: str,
+    verbose: bool = False,
+    stats: Optional[CollectorStats] = None,
+    precompress: Sequence[str] = (),
+) -> None:
+    """Update process_sessions.json next to the status file with one snapshot."""
+    if stats is None:
+        stats = CollectorStats()
+
+    sessions_path = Path(output_file).parent / "process_sessions.json"
+
+    table: Dict[str, Any] = {}
+    with stats.phase("load_sessions"):
+        if sessions_path.exists():
+            try:
+                table = load_file(sessions_path)
+            except (ValueError, IOError):
+                table = {}
+
+    update_sessions(table, data)
+
+    with stats.phase("write_sessions"):
+        size = save_json(sessions_path, table, precompress=precompress)
+    stats.record_bytes("process_sessions", size)
+
+    if verbose:
+        session_count = sum(len(s) for gpus in table["servers"].values() for s in gpus.values())
+        print(f"Process sessions saved ({session_count} sessions)")
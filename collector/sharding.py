@@ -0,0 +1,167 @@
+"""Horizontal sharding of the server list across collector instances."""
+
+import bisect
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import __version__
+from .config import ServerConfig
+from .jsonio import load_file, save_json
+
+# Virtual nodes per shard on the hash ring. More points give a more even
+# split, and adding a shard only moves ~1/N of the servers.
+VIRTUAL_NODES = 64
+
+
+def _hash(key: str) -> int:
+    """Stable 64-bit hash (the builtin hash() is salted per process)."""
+    return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+
+
+class HashRing:
+    """Consistent hash ring mapping server names to shard ids."""
+
+    def __init__(self, shard_count: int, virtual_nodes: int = VIRTUAL_NODES):
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+
+        self.shard_count = shard_count
+        points = sorted(
+            (_hash(f"shard-{shard}#{vnode}"), shard)
+            for shard in range(shard_count)
+            for vnode in range(virtual_nodes)
+        )
+        self._keys = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, name: str) -> int:
+        """Return the shard id owning the given server name."""
+        pos = bisect.bisect(self._keys, _hash(name)) % len(self._keys)
+        return self._shards[pos]
+
+
+def shard_servers(servers: List[ServerConfig], shard_id: int, shard_count: int) -> List[ServerConfig]:
+    """
+    Select the servers handled by one collector shard.
+
+    Args:
+        servers: Full server list from the configuration
+        shard_id: Zero-based id of this shard
+        shard_count: Total number of shards
+
+    Returns:
+        Servers assigned to shard_id, in configuration order
+    """
+    if not 0 <= shard_id < shard_count:
+        raise ValueError(f"shard_id must be in [0, {shard_count}), got {shard_id}")
+
+    ring = HashRing(shard_count)
+    return [s for s in servers if ring.shard_for(s.name) == shard_id]
+
+
+def get_shard_path(output_file: str, shard_id: int, shard_count: int) -> Path:
+    """Partial snapshots live in a shards/ directory next to the status file."""
+    return Path(output_file).parent / "shards" / f"shard-{shard_id}-of-{shard_count}.json"
+
+
+def save_shard(data: Dict[str, Any], output_file: str, shard_id: int, shard_count: int,
+               verbose: bool = False) -> Path:
+    """Save a partial snapshot produced by one shard."""
+    shard_path = get_shard_path(output_file, shard_id, shard_count)
+
+    partial = dict(data)
+    partial["shard"] = {"id": shard_id, "count": shard_count}
+
+    # Atomic, so the merge step never reads a half-written shard
+    save_json(shard_path, partial)
+
+    if verbose:
+        print(f"Shard {shard_id}/{shard_count} saved to {shard_path}")
+
+    return shard_path
+
+
+def _load_shard(path: Path, max_age: Optional[float], now: datetime) -> Optional[Dict[str, Any]]:
+    """Load a partial snapshot, returning None if missing, unreadable or stale."""
+    if not path.exists():
+        return None
+
+    try:
+        partial = load_file(path)
+        timestamp = datetime.fromisoformat(partial["timestamp"])
+    except (IOError, KeyError, ValueError):
+        return None
+
+    # The collector writes aware timestamps; a naive one (hand-written shard) is taken as UTC
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    if max_age is not None and (now - timestamp).total_seconds() > max_age:
+        return None
+
+    return partial
+
+
+def merge_shards(
+    servers: List[ServerConfig],
+    output_file: str,
+    shard_count: int,
+    max_age: Optional[float] = 300,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Merge partial shard snapshots into a single status snapshot.
+
+    Servers whose shard snapshot is missing, unreadable or older than
+    max_age seconds are reported as offline so the dashboard still lists
+    every configured server.
+
+    Args:
+        servers: Full server list from the configuration (defines order)
+        output_file: Status file path; shards are read from its directory
+        shard_count: Total number of shards
+        max_age: Maximum age in seconds of a usable shard snapshot
+        verbose: Print a line per shard
+
+    Returns:
+        Snapshot with the same layout as collect_and_output()
+    """
+    now = datetime.now().astimezone()
+    ring = HashRing(shard_count)
+
+    by_name: Dict[str, Dict[str, Any]] = {}
+    missing: List[int] = []
+
+    for shard_id in range(shard_count):
+        partial = _load_shard(get_shard_path(output_file, shard_id, shard_count), max_age, now)
+        if partial is None:
+            missing.append(shard_id)
+            if verbose:
+                print(f"  shard {shard_id}: MISSING")
+            continue
+
+        if verbose:
+            print(f"  shard {shard_id}: {len(partial.get('servers', []))} servers")
+        for server_data in partial.get("servers", []):
+            by_name[server_data["name"]] = server_data
+
+    servers_data = []
+    for server in servers:
+        server_data = by_name.get(server.name)
+        if server_data is None:
+            server_data = {
+                "name": server.name,
+                "host": server.host,
+                "status": "offline",
+                "error_message": f"No data from collector shard {ring.shard_for(server.name)}",
+                "collected_at": None,
+            }
+        servers_data.append(server_data)
+
+    return {
+        "timestamp": now.isoformat(),
+        "collector_version": __version__,
+        "servers": servers_data,
+        "shards": {"count": shard_count, "missing": missing},
+    }
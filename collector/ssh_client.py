@@ -1,197 +1,394 @@
-"""Async SSH client for parallel data collection."""
-
-import asyncio
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Optional
-
-try:
-    import asyncssh
-    HAS_ASYNCSSH = True
-except ImportError:
-    HAS_ASYNCSSH = False
-
-import paramiko
-
-from .commands import COMBINED_COMMAND, parse_sections
-from .config import ServerConfig
-
-
-@dataclass
-class CollectionResult:
-    """Result from collecting data from a single server."""
-    server_name: str
-    host: str
-    success: bool
-    sections: Dict[str, str]
-    error: Optional[str] = None
-    collected_at: Optional[datetime] = None
-
-
-class SSHCollector:
-    """SSH collector with support for both sync and async execution."""
-
-    def __init__(self, servers: List[ServerConfig], timeout: int = 30, max_retries: int = 3):
-        self.servers = servers
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.retry_delay = 2  # seconds between retries
-
-    def collect_all_sync(self) -> List[CollectionResult]:
-        """
-        Collect data from all servers using synchronous paramiko.
-        Uses threading for parallel execution.
-        """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        results = []
-        with ThreadPoolExecutor(max_workers=len(self.servers)) as executor:
-            futures = {
-                executor.submit(self._collect_sync, server): server
-                for server in self.servers
-            }
-            for future in as_completed(futures):
-                results.append(future.result())
-
-        return results
-
-    def _collect_sync(self, server: ServerConfig) -> CollectionResult:
-        """Collect data from a single server using paramiko with retry logic."""
-        import time
-        last_error = None
-
-        for attempt in range(self.max_retries):
-            try:
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-                connect_kwargs = {
-                    'hostname': server.host,
-                    'port': server.port,
-                    'username': server.user,
-                    'timeout': self.timeout,
-                    'banner_timeout': self.timeout,
-                    'allow_agent': False,
-                    'look_for_keys': False,
-                }
-
-                if server.key_path:
-                    connect_kwargs['key_filename'] = server.key_path
-                    if server.key_passphrase:
-                        connect_kwargs['passphrase'] = server.key_passphrase
-
-                ssh.connect(**connect_kwargs)
-
-                # Execute combined command
-                stdin, stdout, stderr = ssh.exec_command(
-                    COMBINED_COMMAND,
-                    timeout=self.timeout
-                )
-                exit_status = stdout.channel.recv_exit_status()
-                output = stdout.read().decode('utf-8')
-
-                ssh.close()
-
-                if exit_status != 0:
-                    last_error = f"Command failed with exit status {exit_status}"
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay)
-                        continue
-                    return CollectionResult(
-                        server_name=server.name,
-                        host=server.host,
-                        success=False,
-                        sections={},
-                        error=last_error,
-                        collected_at=datetime.now(),
-                    )
-
-                # Parse output into sections
-                sections = parse_sections(output)
-
-                return CollectionResult(
-                    server_name=server.name,
-                    host=server.host,
-                    success=True,
-                    sections=sections,
-                    collected_at=datetime.now(),
-                )
-
-            except Exception as e:
-                last_error = str(e)
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                    continue
-
-        # All retries failed
-        return CollectionResult(
-            server_name=server.name,
-            host=server.host,
-            success=False,
-            sections={},
-            error=f"Failed after {self.max_retries} attempts: {last_error}",
-            collected_at=datetime.now(),
-        )
-
-    async def collect_all_async(self) -> List[CollectionResult]:
-        """
-        Collect data from all servers using async SSH.
-        Requires asyncssh package.
-        """
-        if not HAS_ASYNCSSH:
-            raise ImportError("asyncssh is required for async collection")
-
-        tasks = [self._collect_async(server) for server in self.servers]
-        return await asyncio.gather(*tasks)
-
-    async def _collect_async(self, server: ServerConfig) -> CollectionResult:
-        """Collect data from a single server using asyncssh."""
-        try:
-            connect_opts = {
-                'host': server.host,
-                'port': server.port,
-                'username': server.user,
-                'known_hosts': None,
-                'connect_timeout': self.timeout,
-            }
-
-            if server.key_path:
-                connect_opts['client_keys'] = [server.key_path]
-                if server.key_passphrase:
-                    connect_opts['passphrase'] = server.key_passphrase
-
-            async with asyncssh.connect(**connect_opts) as conn:
-                result = await asyncio.wait_for(
-                    conn.run(COMBINED_COMMAND),
-                    timeout=self.timeout
-                )
-
-                if result.exit_status != 0:
-                    return CollectionResult(
-                        server_name=server.name,
-                        host=server.host,
-                        success=False,
-                        sections={},
-                        error=f"Command failed with exit status {result.exit_status}",
-                        collected_at=datetime.now(),
-                    )
-
-                sections = parse_sections(result.stdout)
-
-                return CollectionResult(
-                    server_name=server.name,
-                    host=server.host,
-                    success=True,
-                    sections=sections,
-                    collected_at=datetime.now(),
-                )
-
-        except Exception as e:
-            return CollectionResult(
-                server_name=server.name,
-                host=server.host,
-                success=False,
-                sections={},
-                error=str(e),
-                collected_at=datetime.now(),
-            )
+"""Async SSH client for parallel data collection.
+
+paramiko, asyncssh and asyncio are imported when a backend is first used,
+not at import time: each costs tens of milliseconds of cold start, and a
+cron run only ever needs one of them.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .commands import COMBINED_COMMAND, parse_sections
+from .config import ServerChanges, ServerConfig, connection_key
+
+
+@dataclass
+class CollectionResult:
+    """Result from collecting data from a single server."""
+    server_name: str
+    host: str
+    success: bool
+    sections: Dict[str, str]
+    error: Optional[str] = None
+    collected_at: Optional[datetime] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per phase
+    bytes_received: int = 0
+    attempts: int = 0
+    raw_output: Optional[str] = None  # unparsed command output, kept for --capture
+
+
+class ConnectionPool:
+    """
+    SSH connections kept open across cycles, for daemon mode.
+
+    Connections are keyed by server name and opened on first use, so a
+    server added to the config gets one on the next cycle. A connection
+    whose server settings no longer match is rebuilt; reconcile() closes
+    those of removed and changed servers as soon as the config changes.
+    asyncssh connections belong to an event loop, so async collection
+    runs on the pool's own loop (run()) instead of a new one per cycle.
+    """
+
+    def __init__(self):
+        import threading
+
+        self._lock = threading.Lock()
+        self._sync: Dict[str, Tuple[tuple, Any]] = {}   # name -> (connection key, paramiko.SSHClient)
+        self._async: Dict[str, Tuple[tuple, Any]] = {}  # name -> (connection key, asyncssh connection)
+        self._loop = None
+        self.opened = 0
+        self.closed = 0
+
+    def __len__(self) -> int:
+        return len(self._sync) + len(self._async)
+
+    def get_sync(self, server: ServerConfig, connect: Callable[[ServerConfig], Any]) -> Tuple[Any, bool]:
+        """
+        Returns:
+            (paramiko client, True if it was reused)
+        """
+        key = connection_key(server)
+        with self._lock:
+            entry = self._sync.get(server.name)
+        if entry is not None:
+            transport = entry[1].get_transport()
+            if entry[0] == key and transport is not None and transport.is_active():
+                return entry[1], True
+            self.discard(server.name)
+
+        client = connect(server)
+        with self._lock:
+            self._sync[server.name] = (key, client)
+            self.opened += 1
+        return client, False
+
+    async def get_async(self, server: ServerConfig, connect) -> Tuple[Any, bool]:
+        """
+        Returns:
+            (asyncssh connection, True if it was reused)
+        """
+        key = connection_key(server)
+        entry = self._async.get(server.name)
+        if entry is not None:
+            if entry[0] == key and not entry[1].is_closed():
+                return entry[1], True
+            self.discard(server.name)
+
+        conn = await connect(server)
+        self._async[server.name] = (key, conn)
+        self.opened += 1
+        return conn, False
+
+    def discard(self, name: str) -> None:
+        """Close and forget the connections to a server, if any."""
+        with self._lock:
+            entries = [pool.pop(name) for pool in (self._sync, self._async) if name in pool]
+            self.closed += len(entries)
+        for _, conn in entries:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def reconcile(self, changes: ServerChanges) -> None:
+        """Close the connections of removed servers and of changed ones."""
+        for server in changes.removed + changes.changed:
+            self.discard(server.name)
+
+    def run(self, coro):
+        """Run a coroutine on the pool's event loop."""
+        import asyncio
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Close every connection."""
+        for name in list(self._sync) + list(self._async):
+            self.discard(name)
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+
+class SSHCollector:
+    """SSH collector with support for both sync and async execution."""
+
+    def __init__(
+        self,
+        servers: List[ServerConfig],
+        timeout: int = 30,
+        max_retries: int = 3,
+        pool: Optional[ConnectionPool] = None,
+    ):
+        self.servers = servers
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = 2  # seconds between retries
+        self.pool = pool  # keep connections open across cycles (daemon mode)
+
+    def collect_all_sync(self) -> List[CollectionResult]:
+        """
+        Collect data from all servers using synchronous paramiko.
+        Uses threading for parallel execution.
+        """
+        if not self.servers:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        results = []
+        with ThreadPoolExecutor(max_workers=len(self.servers)) as executor:
+            futures = {
+                executor.submit(self._collect_sync, server): server
+                for server in self.servers
+            }
+            for future in as_completed(futures):
+                results.append(future.result())
+
+        return results
+
+    def _connect_sync(self, server: ServerConfig):
+        import paramiko
+
+        ssh = paramiko.SSHClient()
+        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        connect_kwargs = {
+            'hostname': server.host,
+            'port': server.port,
+            'username': server.user,
+            'timeout': self.timeout,
+            'banner_timeout': self.timeout,
+            'allow_agent': False,
+            'look_for_keys': False,
+        }
+
+        if server.key_path:
+            connect_kwargs['key_filename'] = server.key_path
+            if server.key_passphrase:
+                connect_kwargs['passphrase'] = server.key_passphrase
+
+        ssh.connect(**connect_kwargs)
+        return ssh
+
+    def _collect_sync(self, server: ServerConfig) -> CollectionResult:
+        """Collect data from a single server using paramiko with retry logic."""
+        last_error = None
+        timings: Dict[str, float] = {}
+
+        def timed(phase: str, start: float) -> float:
+            now = time.monotonic()
+            timings[phase] = timings.get(phase, 0.0) + (now - start)
+            return now
+
+        for attempt in range(self.max_retries):
+            start = time.monotonic()
+            ssh = None
+            try:
+                if self.pool is not None:
+                    ssh, reused = self.pool.get_sync(server, self._connect_sync)
+                else:
+                    ssh, reused = self._connect_sync(server), False
+                if not reused:
+                    start = timed('connect', start)
+
+                # Execute combined command
+                stdin, stdout, stderr = ssh.exec_command(
+                    COMBINED_COMMAND,
+                    timeout=self.timeout
+                )
+                # recv_exit_status() ignores the channel timeout, so a hung
+                # host would block this thread forever
+                if not stdout.channel.status_event.wait(self.timeout):
+                    raise TimeoutError(f"Command timed out after {self.timeout}s")
+                exit_status = stdout.channel.recv_exit_status()
+                start = timed('exec', start)
+                raw = stdout.read()
+                output = raw.decode('utf-8')
+                start = timed('transfer', start)
+
+                if self.pool is None:
+                    ssh.close()
+
+                if exit_status != 0:
+                    last_error = f"Command failed with exit status {exit_status}"
+                    if attempt < self.max_retries - 1:
+                        time.sleep(self.retry_delay)
+                        continue
+                    return CollectionResult(
+                        server_name=server.name,
+                        host=server.host,
+                        success=False,
+                        sections={},
+                        error=last_error,
+                        collected_at=datetime.now(),
+                        timings=timings,
+                        bytes_received=len(raw),
+                        attempts=attempt + 1,
+                        raw_output=output,
+                    )
+
+                # Parse output into sections
+                sections = parse_sections(output)
+                timed('split', start)
+
+                return CollectionResult(
+                    server_name=server.name,
+                    host=server.host,
+                    success=True,
+                    sections=sections,
+                    collected_at=datetime.now(),
+                    timings=timings,
+                    bytes_received=len(raw),
+                    attempts=attempt + 1,
+                    raw_output=output,
+                )
+
+            except Exception as e:
+                timed('failed', start)
+                # The connection may be broken; the retry opens a new one
+                if self.pool is not None:
+                    self.pool.discard(server.name)
+                elif ssh is not None:
+                    ssh.close()
+                last_error = str(e)
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.retry_delay)
+                    continue
+
+        # All retries failed
+        return CollectionResult(
+            server_name=server.name,
+            host=server.host,
+            success=False,
+            sections={},
+            error=f"Failed after {self.max_retries} attempts: {last_error}",
+            collected_at=datetime.now(),
+            timings=timings,
+            attempts=self.max_retries,
+        )
+
+    async def collect_all_async(self) -> List[CollectionResult]:
+        """
+        Collect data from all servers using async SSH.
+        Requires asyncssh package.
+        """
+        import asyncio
+
+        try:
+            import asyncssh  # noqa: F401
+        except ImportError:
+            raise ImportError("asyncssh is required for async collection")
+
+        tasks = [self._collect_async(server) for server in self.servers]
+        return await asyncio.gather(*tasks)
+
+    async def _connect_async(self, server: ServerConfig):
+        import asyncssh
+
+        connect_opts = {
+            'host': server.host,
+            'port': server.port,
+            'username': server.user,
+            'known_hosts': None,
+            'connect_timeout': self.timeout,
+        }
+
+        if server.key_path:
+            connect_opts['client_keys'] = [server.key_path]
+            if server.key_passphrase:
+                connect_opts['passphrase'] = server.key_passphrase
+
+        return await asyncssh.connect(**connect_opts)
+
+    async def _collect_async(self, server: ServerConfig) -> CollectionResult:
+        """Collect data from a single server using asyncssh."""
+        import asyncio
+
+        timings: Dict[str, float] = {}
+        start = time.monotonic()
+        try:
+            if self.pool is not None:
+                conn, reused = await self.pool.get_async(server, self._connect_async)
+            else:
+                conn, reused = await self._connect_async(server), False
+
+            try:
+                now = time.monotonic()
+                if not reused:
+                    timings['connect'] = now - start
+                start = now
+
+                # asyncssh reads the output while the command runs, so
+                # exec and transfer cannot be told apart here
+                result = await asyncio.wait_for(
+                    conn.run(COMBINED_COMMAND),
+                    timeout=self.timeout
+                )
+                now = time.monotonic()
+                timings['exec'] = now - start
+                start = now
+                bytes_received = len(result.stdout.encode('utf-8'))
+
+                if result.exit_status != 0:
+                    return CollectionResult(
+                        server_name=server.name,
+                        host=server.host,
+                        success=False,
+                        sections={},
+                        error=f"Command failed with exit status {result.exit_status}",
+                        collected_at=datetime.now(),
+                        timings=timings,
+                        bytes_received=bytes_received,
+                        attempts=1,
+                        raw_output=result.stdout,
+                    )
+
+                sections = parse_sections(result.stdout)
+                timings['split'] = time.monotonic() - start
+
+                return CollectionResult(
+                    server_name=server.name,
+                    host=server.host,
+                    success=True,
+                    sections=sections,
+                    collected_at=datetime.now(),
+                    timings=timings,
+                    bytes_received=bytes_received,
+                    attempts=1,
+                    raw_output=result.stdout,
+                )
+            finally:
+                if self.pool is None:
+                    conn.close()
+                    await conn.wait_closed()
+
+        except Exception as e:
+            timings['failed'] = time.monotonic() - start
+            # The connection may be broken; the next cycle opens a new one
+            if self.pool is not None:
+                self.pool.discard(server.name)
+            return CollectionResult(
+                server_name=server.name,
+                host=server.host,
+                success=False,
+                sections={},
+                error=str(e),
+                collected_at=datetime.now(),
+                timings=timings,
+                attempts=1,
+            )
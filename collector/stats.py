@@ -0,0 +1,109 @@
+"""Phase timing instrumentation for collection cycles."""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .jsonio import load_file, save_json
+
+
+class CollectorStats:
+    """
+    Monotonic timings, byte counts and retry counts for one cycle.
+
+    Cycle-level phases (collect, parse, write_status, ...) and per-host
+    phases (connect, exec, transfer, split, parse) are kept separately.
+    All durations are in seconds, measured with time.monotonic().
+    """
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler  # optional CycleProfiler, driven by cycle phases
+        self.started_at = datetime.now().astimezone()
+        self._start = time.monotonic()
+        self.phases: Dict[str, float] = {}
+        self.bytes: Dict[str, int] = {}
+        self.hosts: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def phase(self, name: str, host: Optional[str] = None) -> Iterator[None]:
+        """Time a block and add it to a cycle phase or a host phase."""
+        if host is None and self.profiler is not None:
+            with self.profiler.phase(name):
+                start = time.monotonic()
+                try:
+                    yield
+                finally:
+                    self.record(name, time.monotonic() - start)
+            return
+
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - start, host=host)
+
+    def record(self, name: str, seconds: float, host: Optional[str] = None) -> None:
+        """Add a duration to a cycle phase or to a host phase."""
+        if host is None:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+        else:
+            timings = self._host(host).setdefault("timings", {})
+            timings[name] = timings.get(name, 0.0) + seconds
+
+    def record_bytes(self, name: str, count: int) -> None:
+        """Record the size of a written artifact."""
+        self.bytes[name] = self.bytes.get(name, 0) + count
+
+    def add_result(self, result) -> None:
+        """Merge the timings and counters carried by a CollectionResult."""
+        host = self._host(result.server_name)
+        host["status"] = "online" if result.success else "offline"
+        host["attempts"] = result.attempts
+        host["bytes_received"] = result.bytes_received
+        for name, seconds in result.timings.items():
+            self.record(name, seconds, host=result.server_name)
+
+    def _host(self, name: str) -> Dict[str, Any]:
+        return self.hosts.setdefault(name, {})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats as a JSON-serializable dict (durations in ms)."""
+        def ms(timings: Dict[str, float]) -> Dict[str, float]:
+            return {name: round(seconds * 1000, 2) for name, seconds in timings.items()}
+
+        return {
+            "started_at": self.started_at.isoformat(),
+            "elapsed_ms": round((time.monotonic() - self._start) * 1000, 2),
+            "phases_ms": ms(self.phases),
+            "bytes": dict(self.bytes),
+            "hosts": {
+                name: {**host, "timings": ms(host.get("timings", {}))}
+                for name, host in self.hosts.items()
+            },
+        }
+
+
+def save_stats(stats: CollectorStats, output_file: str, max_entries: int = 1440, verbose: bool = False) -> None:
+    """
+    Append the cycle stats to a rolling stats file next to the status file.
+    Default max_entries=1440 keeps ~1 day of cycles at 1-minute intervals.
+    """
+    stats_path = Path(output_file).parent / "collector_stats.json"
+
+    entries = []
+    if stats_path.exists():
+        try:
+            entries = load_file(stats_path)
+        except (ValueError, IOError):
+            entries = []
+
+    entries.append(stats.to_dict())
+    if len(entries) > max_entries:
+        entries = entries[-max_entries:]
+
+    save_json(stats_path, entries)
+
+    if verbose:
+        print(f"Collector stats saved ({len(entries)} entries)")
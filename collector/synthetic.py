@@ -0,0 +1,323 @@
+"""
+Synthetic COMBINED_COMMAND output for benchmarks and fixtures.
+
+GPUs are reported like a current driver does, as an `nvidia-smi -q -x`
+report (GPU_XML section); gpu_format="csv" gives the CSV fallback sections
+instead, and "both" gives both, to compare the two parsers on the same GPUs.
+
+Also writes a whole synthetic status.json, e.g. a large fleet to measure
+dashboard render cost:
+
+    python -m collector.synthetic --servers 200 --gpus 8 -o /tmp/fleet/status.json
+    python -m collector.synthetic --servers 200 --gpus 8 --tick 1 -o /tmp/fleet/status-1.json
+"""
+
+import argparse
+import random
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+GPU_MODELS = [
+    ("NVIDIA RTX 6000 Ada Generation", 49140),
+    ("NVIDIA H100 80GB HBM3", 81559),
+    ("NVIDIA GeForce RTX 4090", 24564),
+]
+
+USERS = ["alice", "bob", "carol", "dave", "erin", "frank"]
+COMMANDS = ["python", "python3", "torchrun", "jupyter-lab", "bash", "sshd", "nvtop", "tmux: server"]
+
+DRIVER_VERSION = "580.95.05"
+
+
+def _gpu_xml(gpus: List[Dict[str, Any]], processes: List[Tuple[str, int, int]]) -> str:
+    """An nvidia-smi -q -x report (v12 layout) with the elements the parser reads, and some it skips."""
+    parts = [
+        '<?xml version="1.0" ?>',
+        '<!DOCTYPE nvidia_smi_log SYSTEM "nvsmi_device_v12.dtd">',
+        '<nvidia_smi_log>',
+        '\t<timestamp>Thu Jan  1 00:00:00 2026</timestamp>',
+        f'\t<driver_version>{DRIVER_VERSION}</driver_version>',
+        '\t<cuda_version>13.0</cuda_version>',
+        f'\t<attached_gpus>{len(gpus)}</attached_gpus>',
+    ]
+    for gpu in gpus:
+        procs = "".join(
+            f"""
+\t\t\t<process_info>
+\t\t\t\t<gpu_instance_id>N/A</gpu_instance_id>
+\t\t\t\t<compute_instance_id>N/A</compute_instance_id>
+\t\t\t\t<pid>{pid}</pid>
+\t\t\t\t<type>C</type>
+\t\t\t\t<process_name>python</process_name>
+\t\t\t\t<used_memory>{used_mb} MiB</used_memory>
+\t\t\t</process_info>"""
+            for gpu_uuid, pid, used_mb in processes if gpu_uuid == gpu["uuid"]
+        )
+        parts.append(f"""\t<gpu id="00000000:{gpu['bus']:02X}:00.0">
+\t\t<product_name>{gpu['name']}</product_name>
+\t\t<product_brand>NVIDIA</product_brand>
+\t\t<persistence_mode>Enabled</persistence_mode>
+\t\t<uuid>{gpu['uuid']}</uuid>
+\t\t<minor_number>{gpu['index']}</minor_number>
+\t\t<pci>
+\t\t\t<pci_bus>{gpu['bus']:02X}</pci_bus>
+\t\t\t<pci_bus_id>00000000:{gpu['bus']:02X}:00.0</pci_bus_id>
+\t\t\t<replay_counter>0</replay_counter>
+\t\t\t<tx_util>{gpu['tx']} KB/s</tx_util>
+\t\t\t<rx_util>{gpu['rx']} KB/s</rx_util>
+\t\t</pci>
+\t\t<fan_speed>N/A</fan_speed>
+\t\t<performance_state>{'P0' if gpu['util'] else 'P8'}</performance_state>
+\t\t<fb_memory_usage>
+\t\t\t<total>{gpu['total_mb']} MiB</total>
+\t\t\t<reserved>512 MiB</reserved>
+\t\t\t<used>{gpu['used_mb']} MiB</used>
+\t\t\t<free>{max(gpu['total_mb'] - gpu['used_mb'] - 512, 0)} MiB</free>
+\t\t</fb_memory_usage>
+\t\t<utilization>
+\t\t\t<gpu_util>{gpu['util']} %</gpu_util>
+\t\t\t<memory_util>{gpu['util'] // 2} %</memory_util>
+\t\t\t<encoder_util>0 %</encoder_util>
+\t\t\t<decoder_util>0 %</decoder_util>
+\t\t</utilization>
+\t\t<ecc_errors>
+\t\t\t<volatile>
+\t\t\t\t<sram_correctable>0</sram_correctable>
+\t\t\t\t<sram_uncorrectable_parity>0</sram_uncorrectable_parity>
+\t\t\t\t<sram_uncorrectable_secded>0</sram_uncorrectable_secded>
+\t\t\t\t<dram_correctable>{gpu['ecc']}</dram_correctable>
+\t\t\t\t<dram_uncorrectable>0</dram_uncorrectable>
+\t\t\t</volatile>
+\t\t</ecc_errors>
+\t\t<temperature>
+\t\t\t<gpu_temp>{gpu['temp']} C</gpu_temp>
+\t\t\t<gpu_temp_max_threshold>92 C</gpu_temp_max_threshold>
+\t\t</temperature>
+\t\t<gpu_power_readings>
+\t\t\t<power_state>{'P0' if gpu['util'] else 'P8'}</power_state>
+\t\t\t<power_draw>{gpu['power']:.2f} W</power_draw>
+\t\t\t<current_power_limit>{gpu['limit']:.2f} W</current_power_limit>
+\t\t</gpu_power_readings>
+\t\t<clocks>
+\t\t\t<graphics_clock>{gpu['sm']} MHz</graphics_clock>
+\t\t\t<sm_clock>{gpu['sm']} MHz</sm_clock>
+\t\t\t<mem_clock>{gpu['mem_clock']} MHz</mem_clock>
+\t\t</clocks>
+\t\t<processes>{procs}
+\t\t</processes>
+\t</gpu>""")
+    parts.append('</nvidia_smi_log>')
+    return "\n".join(parts)
+
+
+def synthetic_output(
+    hostname: str,
+    gpu_count: int = 8,
+    process_count: int = 300,
+    busy_fraction: float = 0.5,
+    seed: Optional[int] = None,
+    gpu_format: str = "xml",
+) -> str:
+    """
+    Build output in the same format the remote COMBINED_COMMAND produces.
+
+    Args:
+        hostname: Value for the HOSTNAME section (also seeds the generator)
+        gpu_count: Number of GPUs reported by nvidia-smi (0 means NO_GPU)
+        process_count: Number of rows in the ps process table
+        busy_fraction: Fraction of GPUs running a compute process
+        seed: Random seed; defaults to one derived from hostname
+        gpu_format: "xml" (GPU_XML section), "csv" (GPU_INFO and
+            GPU_PROCESSES sections) or "both"
+
+    Returns:
+        Raw command output, ready for parse_sections()
+    """
+    if gpu_format not in ("xml", "csv", "both"):
+        raise ValueError(f"Unknown gpu_format: {gpu_format}")
+    rng = random.Random(seed if seed is not None else hostname)
+    model, total_mb = rng.choice(GPU_MODELS)
+
+    pids = rng.sample(range(1000, 4000000), process_count)
+    ps_lines = [
+        f"{pid:>7} {rng.choice(USERS):<8} {rng.choice(COMMANDS)}"
+        for pid in pids
+    ]
+
+    gpus = []
+    gpu_processes = []
+    for index in range(gpu_count):
+        gpu_uuid = f"GPU-{uuid.UUID(int=rng.getrandbits(128))}"
+        busy = bool(pids) and rng.random() < busy_fraction
+        used_mb = rng.randint(total_mb // 4, total_mb - 1) if busy else rng.randint(1, 20)
+        util = rng.randint(30, 100) if busy else 0
+        temp = rng.randint(55, 88) if busy else rng.randint(28, 45)
+        gpus.append({
+            "index": index, "name": model, "uuid": gpu_uuid, "temp": temp, "util": util,
+            "used_mb": used_mb, "total_mb": total_mb,
+        })
+        if busy:
+            gpu_processes.append((gpu_uuid, rng.choice(pids), used_mb - 1))
+
+    # Drawn after the CSV fields, so both formats describe the same GPUs
+    telemetry_rng = random.Random(f"{seed if seed is not None else hostname}-telemetry")
+    for gpu in gpus:
+        busy = gpu["util"] > 0
+        gpu.update(
+            bus=0x18 + gpu["index"] * 0x10,
+            power=telemetry_rng.uniform(180, 300) if busy else telemetry_rng.uniform(15, 35),
+            limit=300.0,
+            sm=telemetry_rng.randint(1800, 2500) if busy else 210,
+            mem_clock=10001,
+            tx=telemetry_rng.randint(1000, 300000) if busy else 0,
+            rx=telemetry_rng.randint(1000, 300000) if busy else 0,
+            ecc=telemetry_rng.choice([0, 0, 0, 1]),
+        )
+
+    gpu_sections = []
+    if gpu_format in ("xml", "both"):
+        # A host without GPUs has no nvidia-smi, and reports NO_GPU in the fallback
+        gpu_sections.append(("GPU_XML", _gpu_xml(gpus, gpu_processes) if gpus else "NO_XML"))
+    if gpu_format in ("csv", "both") or not gpus:
+        gpu_sections += [
+            ("GPU_INFO", "\n".join(
+                f"{g['index']}, {g['name']}, {g['uuid']}, {g['temp']}, {g['util']}, "
+                f"{g['used_mb']}, {g['total_mb']}, {DRIVER_VERSION}"
+                for g in gpus
+            ) or "NO_GPU"),
+            ("GPU_PROCESSES", "\n".join(f"{u}, {pid}, {mb}" for u, pid, mb in gpu_processes)),
+        ]
+
+    mem_total_kb = rng.choice([131072, 263168, 527660]) * 1024
+    mem_avail_kb = rng.randint(mem_total_kb // 10, mem_total_kb)
+    disk_total = rng.choice([1, 2, 4]) * 1000 ** 4
+    disk_used = rng.randint(disk_total // 20, disk_total)
+    user, system, idle = rng.randint(10 ** 6, 10 ** 8), rng.randint(10 ** 5, 10 ** 7), rng.randint(10 ** 8, 10 ** 9)
+
+    sections = [
+        ("HOSTNAME", hostname),
+        ("TIMESTAMP", "2026-01-01T00:00:00+08:00"),
+        ("UPTIME", "2025-12-01 09:00:00"),
+        ("CPU_STAT", f"cpu  {user} 0 {system} {idle} 1000 0 200 0 0 0"),
+        ("CPU_INFO", str(rng.choice([32, 64, 128]))),
+        ("MEMORY", "\n".join([
+            f"MemTotal:       {mem_total_kb} kB",
+            f"MemFree:        {mem_avail_kb // 2} kB",
+            f"MemAvailable:   {mem_avail_kb} kB",
+            "Buffers:          123456 kB",
+            "Cached:          4567890 kB",
+            "SwapTotal:       8388604 kB",
+            "SwapFree:        8388604 kB",
+        ])),
+        ("DISK", "\n".join([
+            f"/dev/nvme0n1p2 {disk_total} {disk_used} {disk_total - disk_used} /",
+            "/dev/nvme0n1p1 535805952 14958592 520847360 /boot/efi",
+        ])),
+        *gpu_sections,
+        ("ALL_PROCESSES", "\n".join(ps_lines)),
+    ]
+
+    lines = []
+    for name, body in sections:
+        lines.append(f"==={name}===")
+        lines.append(body)
+        lines.append("")
+    lines.append("===END===")
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_status(
+    servers: int = 200,
+    gpu_count: int = 8,
+    process_count: int = 50,
+    offline_fraction: float = 0.0,
+    tick: int = 0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Build a status.json document for a synthetic fleet, through the same
+    parse path as a real collection.
+
+    Args:
+        servers: Number of servers
+        gpu_count: GPUs per server
+        process_count: Rows in each server's process table
+        offline_fraction: Fraction of servers reported offline
+        tick: Later ticks keep the fleet (names, GPUs, processes) and only
+            move the metrics, like consecutive collection cycles
+        seed: Random seed of the fleet
+
+    Returns:
+        Status document
+    """
+    # Imported here: the parse path is not needed to build raw outputs
+    from . import __version__
+    from .commands import parse_sections
+    from .main import process_result
+    from .ssh_client import CollectionResult
+
+    rng = random.Random(seed)
+    drift = random.Random(f"{seed}-{tick}")
+    servers_data = []
+
+    for i in range(servers):
+        name = f"node{i + 1}"
+        if rng.random() < offline_fraction:
+            servers_data.append(process_result(CollectionResult(
+                server_name=name, host=f"10.0.{i // 256}.{i % 256}", success=False, sections={},
+                error="Connection timed out",
+            )))
+            continue
+
+        output = synthetic_output(name, gpu_count=gpu_count, process_count=process_count, seed=seed * 100003 + i)
+        server = process_result(CollectionResult(
+            server_name=name, host=f"10.0.{i // 256}.{i % 256}", success=True, sections=parse_sections(output),
+        ))
+
+        if tick:
+            server["system"]["cpu"]["usage_percent"] = round(drift.uniform(0, 100), 1)
+            for gpu in server["gpus"]:
+                busy = bool(gpu["processes"])
+                gpu["utilization_percent"] = drift.randint(30, 100) if busy else 0
+                gpu["temperature_celsius"] = drift.randint(55, 88) if busy else drift.randint(28, 45)
+                memory = gpu["memory"]
+                memory["used_mb"] = drift.randint(memory["total_mb"] // 4, memory["total_mb"] - 1) if busy else drift.randint(1, 20)
+                memory["usage_percent"] = round(memory["used_mb"] / memory["total_mb"] * 100, 1)
+                for process in gpu["processes"]:
+                    process["gpu_memory_mb"] = memory["used_mb"] - 1
+                telemetry = gpu.get("telemetry")
+                if telemetry:
+                    telemetry["power_draw_watts"] = round(drift.uniform(180, 300) if busy else drift.uniform(15, 35), 2)
+                    telemetry["sm_clock_mhz"] = drift.randint(1800, 2500) if busy else 210
+
+        servers_data.append(server)
+
+    return {
+        "timestamp": f"2026-01-01T00:{tick // 60 % 60:02d}:{tick % 60:02d}+08:00",
+        "collector_version": __version__,
+        "servers": servers_data,
+    }
+
+
+def main():
+    from .jsonio import save_json
+
+    parser = argparse.ArgumentParser(description="Write a synthetic status.json")
+    parser.add_argument('--servers', type=int, default=200, help='Servers (default: 200)')
+    parser.add_argument('--gpus', type=int, default=8, help='GPUs per server (default: 8)')
+    parser.add_argument('--processes', type=int, default=50, help='Process table rows per server')
+    parser.add_argument('--offline', type=float, default=0.0, help='Fraction of offline servers (default: 0)')
+    parser.add_argument('--tick', type=int, default=0, help='Collection cycle; later ticks only move metrics')
+    parser.add_argument('--seed', type=int, default=0, help='Fleet seed')
+    # No default: the usual place, docs/data/status.json, is the live file cron publishes
+    parser.add_argument('-o', '--output', required=True, help='Output file')
+    args = parser.parse_args()
+
+    data = synthetic_status(args.servers, args.gpus, args.processes, args.offline, args.tick, args.seed)
+    size = save_json(args.output, data, indent=True)
+    gpus = sum(len(server.get("gpus", [])) for server in data["servers"])
+    print(f"{args.output}: {len(data['servers'])} servers, {gpus} GPUs, {size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()